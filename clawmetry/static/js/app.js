@@ -435,13 +435,39 @@ async function ackAllAlerts() {
 // resumes immediately on visibilitychange. Per-tab pollers (loadCrons
 // 30s when on Crons tab, etc.) keep their existing tab-name gates.
 //
+// "Immediately": a poller that skipped a tick while hidden runs once as soon
+// as the tab is shown again, instead of leaving stale numbers up for up to a
+// full interval. Callers still stop pollers with plain clearInterval, so each
+// tick re-registers its entry and the visibilitychange pass drops every entry
+// it handles: a live interval puts itself back on its next tick, a cleared
+// one never does. Nothing is inferred from how long a timer has been silent
+// (sleep and background throttling can stall live timers for minutes).
+//
 // Function declaration, NOT var, so the hoist makes it available to the
 // module-init `setInterval` callers below at parse time.
+var _visPollers = {};
 function visibilitySetInterval(fn, ms) {
-  return setInterval(function() {
-    if (typeof document !== 'undefined' && document.hidden) return;
+  var entry = { fn: fn, missed: false };
+  var id = setInterval(function() {
+    _visPollers[id] = entry;
+    if (typeof document !== 'undefined' && document.hidden) { entry.missed = true; return; }
+    entry.missed = false;
     try { fn(); } catch (e) {}
   }, ms);
+  _visPollers[id] = entry;
+  return id;
+}
+if (typeof document !== 'undefined') {
+  document.addEventListener('visibilitychange', function() {
+    if (document.hidden) return;
+    Object.keys(_visPollers).forEach(function(id) {
+      var p = _visPollers[id];
+      delete _visPollers[id];
+      if (!p.missed) return;
+      p.missed = false;
+      try { p.fn(); } catch (e) {}
+    });
+  });
 }
 
 // Tab-scoped polling. Heavy pollers (the Overview loadAll() fan-out) gate on
@@ -1188,6 +1214,14 @@ async function loadContextEconomics() {
 }
 
 
+// Nav items carry only data-tab; one delegated listener routes clicks to
+// switchTab instead of ~40 inline onclick="switchTab('…')" attributes, each
+// of which compiles its own handler function on first parse.
+document.addEventListener('click', function(e) {
+  var item = e.target.closest('.left-nav-item[data-tab], .nav-tab[data-tab]');
+  if (item) switchTab(item.dataset.tab);
+});
+
 function switchTab(name) {
   // Track the active tab so tab-scoped pollers (Overview loadAll, etc.) only
   // run on their own screen instead of on every tab.
@@ -1204,8 +1238,7 @@ function switchTab(name) {
   // this view (aggregate/node-wide tabs get an honest note; filterable tabs
   // filter themselves below).
   try { _cmApplyRuntimeScopeNote(name); } catch (e) {}
-  var tabs = document.querySelectorAll('.nav-tab');
-  tabs.forEach(function(t) { if (t.getAttribute('onclick') && t.getAttribute('onclick').indexOf("'" + name + "'") !== -1) t.classList.add('active'); });
+  document.querySelectorAll('.nav-tab[data-tab="' + name + '"]').forEach(function(t) { t.classList.add('active'); });
   var leftItems = document.querySelectorAll('.left-nav-item[data-tab="' + name + '"]');
   leftItems.forEach(function(t) { t.classList.add('active'); });
   // Phase A beginner IA: if the selected tab lives inside a collapsed drawer
@@ -1281,8 +1314,7 @@ function toggleAdvancedDrawer() {
     list.setAttribute('hidden', '');
     btn.setAttribute('aria-expanded', 'false');
   }
-  try { localStorage.setItem('cm_advanced_open', nowOpen ? '1' : '0'); }
-  catch (e) { /* localStorage blocked */ }
+  persistPrefOnIdle('cm_advanced_open', nowOpen ? '1' : '0');
 }
 
 function toggleLeftNavMobile() {
@@ -1305,8 +1337,7 @@ function toggleLiveDrawer() {
     list.setAttribute('hidden', '');
     btn.setAttribute('aria-expanded', 'false');
   }
-  try { localStorage.setItem('cm_live_open', nowOpen ? '1' : '0'); }
-  catch (e) { /* localStorage blocked */ }
+  persistPrefOnIdle('cm_live_open', nowOpen ? '1' : '0');
 }
 
 // Restore Advanced + Live drawer state on page load.
@@ -1789,10 +1820,15 @@ function _configMeta(filename) {
   return _CONFIG_FILE_META[filename] || { desc: '' };
 }
 
+// Attribute-safe escaping in one pass over the string (one regex, one map
+// lookup per hit) rather than a replace per character.
+var _HTML_ESC = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+var _HTML_ESC_RE = /[&<>"']/g;
+function _htmlEscChar(c) { return _HTML_ESC[c]; }
+
 // Escape HTML for safe injection of raw file content.
 function _escapeHtml(s) {
-  return (s || '').replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
-                  .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+  return (s || '').replace(_HTML_ESC_RE, _htmlEscChar);
 }
 
 // Sanitize markdown -> HTML that is safe to assign to innerHTML.
@@ -2499,22 +2535,65 @@ async function loadSkillFile(skillName, filePath) {
 var _sunSVG = '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/></svg>';
 var _moonSVG = '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/></svg>';
 
+// Persist a preference once the main thread is idle: localStorage writes are
+// synchronous, and a held-down shortcut would otherwise write every repeat.
+// Only the last value per key within the idle window is written. Code that
+// reads a preference back in the same session goes through readPref() so it
+// sees a value still waiting for the flush; pagehide flushes whatever is left.
+var _idlePrefs = {};
+var _idlePrefsPending = false;
+
+function _flushIdlePrefs() {
+  var prefs = _idlePrefs;
+  _idlePrefs = {};
+  _idlePrefsPending = false;
+  Object.keys(prefs).forEach(function(k) {
+    try { localStorage.setItem(k, prefs[k]); } catch (e) {}
+  });
+}
+
+function persistPrefOnIdle(key, value) {
+  _idlePrefs[key] = value;
+  if (_idlePrefsPending) return;
+  _idlePrefsPending = true;
+  if (typeof requestIdleCallback === 'function') requestIdleCallback(_flushIdlePrefs, { timeout: 500 });
+  else setTimeout(_flushIdlePrefs, 200);
+}
+
+function readPref(key) {
+  if (Object.prototype.hasOwnProperty.call(_idlePrefs, key)) return _idlePrefs[key];
+  return localStorage.getItem(key);
+}
+
+window.addEventListener('pagehide', _flushIdlePrefs);
+
+// Theme flips are applied once per frame: repeated toggles inside a frame
+// only move _themeTarget, and the attribute + icon are written once.
+var _themeTarget = null;
+var _themeRaf = 0;
+
 function toggleTheme() {
+  const current = _themeTarget || (document.body.getAttribute('data-theme') === 'dark' ? 'dark' : 'light');
+  _themeTarget = current === 'dark' ? 'light' : 'dark';
+  if (!_themeRaf) _themeRaf = requestAnimationFrame(_applyThemeTarget);
+}
+
+function _applyThemeTarget() {
   const body = document.body;
   const toggle = document.getElementById('theme-toggle-btn');
-  const isLight = !body.hasAttribute('data-theme') || body.getAttribute('data-theme') !== 'dark';
-  
-  if (isLight) {
+  const theme = _themeTarget;
+  _themeRaf = 0;
+  _themeTarget = null;
+  if (theme === 'dark') {
     body.setAttribute('data-theme', 'dark');
     toggle.innerHTML = _sunSVG;
     toggle.title = 'Switch to light theme';
-    localStorage.setItem('openclaw-theme', 'dark');
   } else {
     body.removeAttribute('data-theme');
     toggle.innerHTML = _moonSVG;
     toggle.title = 'Switch to dark theme';
-    localStorage.setItem('openclaw-theme', 'light');
   }
+  persistPrefOnIdle('openclaw-theme', theme);
 }
 
 function initTheme() {
@@ -2533,43 +2612,75 @@ function initTheme() {
 
 // === Zoom Controls ===
 let currentZoom = 1.0;
-const MIN_ZOOM = 0.5;
-const MAX_ZOOM = 2.0;
-const ZOOM_STEP = 0.1;
+// Discrete zoom stops instead of ±0.1 accumulation: the wrapper only ever
+// lands on a handful of scales (no 1.2000000000000002 drift), so the layer
+// and the flow SVGs are re-rasterised at a few sizes rather than every step.
+const ZOOM_LEVELS = [0.5, 0.67, 0.75, 0.9, 1, 1.1, 1.25, 1.5, 1.75, 2];
+
+function snapZoom(z) {
+  return ZOOM_LEVELS.reduce(function(best, lvl) {
+    return Math.abs(lvl - z) < Math.abs(best - z) ? lvl : best;
+  }, 1);
+}
+// While the wrapper's 0.3s scale transition runs it is promoted to its own
+// layer (will-change) and the flow SVGs drop to optimizeSpeed rendering; both
+// are undone once it settles so text re-rasterises crisply at the new scale.
+const ZOOM_SETTLE_MS = 600;
+let _zoomSettleTimer = null;
 
 function initZoom() {
   const savedZoom = localStorage.getItem('openclaw-zoom');
   if (savedZoom) {
-    currentZoom = parseFloat(savedZoom);
+    currentZoom = snapZoom(parseFloat(savedZoom) || 1);
   }
   applyZoom();
 }
 
+// Zoom writes are coalesced to one per frame, so a held-down Ctrl/Cmd + '+'
+// lands on the final level with a single transform write.
+let _zoomRaf = 0;
+
 function applyZoom() {
+  if (!_zoomRaf) _zoomRaf = requestAnimationFrame(_flushZoom);
+}
+
+function _flushZoom() {
+  _zoomRaf = 0;
   const wrapper = document.getElementById('zoom-wrapper');
   const levelDisplay = document.getElementById('zoom-level');
   
   if (wrapper) {
+    const svgs = ['flow-svg', 'overview-flow-svg']
+      .map(function(id) { return document.getElementById(id); })
+      .filter(Boolean);
+    svgs.forEach(function(svg) { svg.classList.add('zooming'); });
+    wrapper.style.willChange = 'transform';
+    clearTimeout(_zoomSettleTimer);
+    _zoomSettleTimer = setTimeout(function() {
+      svgs.forEach(function(svg) { svg.classList.remove('zooming'); });
+      wrapper.style.willChange = '';
+    }, ZOOM_SETTLE_MS);
     wrapper.style.transform = `scale(${currentZoom})`;
   }
   if (levelDisplay) {
     levelDisplay.textContent = Math.round(currentZoom * 100) + '%';
   }
   
-  // Save to localStorage
-  localStorage.setItem('openclaw-zoom', currentZoom.toString());
+  persistPrefOnIdle('openclaw-zoom', currentZoom.toString());
 }
 
 function zoomIn() {
-  if (currentZoom < MAX_ZOOM) {
-    currentZoom = Math.min(MAX_ZOOM, currentZoom + ZOOM_STEP);
+  const i = ZOOM_LEVELS.indexOf(currentZoom);
+  if (i < ZOOM_LEVELS.length - 1) {
+    currentZoom = ZOOM_LEVELS[i + 1];
     applyZoom();
   }
 }
 
 function zoomOut() {
-  if (currentZoom > MIN_ZOOM) {
-    currentZoom = Math.max(MIN_ZOOM, currentZoom - ZOOM_STEP);
+  const i = ZOOM_LEVELS.indexOf(currentZoom);
+  if (i > 0) {
+    currentZoom = ZOOM_LEVELS[i - 1];
     applyZoom();
   }
 }
@@ -2604,9 +2715,25 @@ function timeAgo(ms) {
   return Math.floor(diff/86400000) + 'd ago';
 }
 
+// Shared formatters for the per-row timestamp paths (log lines, event
+// streams, session tables). Every toLocale*String call with options builds
+// a fresh Intl formatter; these are built once. DateTimeFormat.format throws
+// on an invalid Date where toLocaleString returned 'Invalid Date', so go
+// through _fmtDate to keep that output.
+var _DTF_SHORT = new Intl.DateTimeFormat('en-GB', {hour:'2-digit',minute:'2-digit',day:'numeric',month:'short'});
+var _DTF_CLOCK_OPTS = {hour:'2-digit',minute:'2-digit',second:'2-digit'};
+var _DTF_CLOCK = new Intl.DateTimeFormat('en-GB', _DTF_CLOCK_OPTS);
+function _fmtDate(fmt, d) {
+  return isNaN(d.getTime()) ? 'Invalid Date' : fmt.format(d);
+}
+
+// Card/table formatters shared by the Overview widgets and the Usage tab.
+function fmtCost(c) { return c >= 0.01 ? '$' + c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
+function fmtTokens(n) { return n >= 1000000 ? (n/1000000).toFixed(1) + 'M' : n >= 1000 ? (n/1000).toFixed(0) + 'K' : String(n); }
+
 function formatTime(ms) {
   if (!ms) return '--';
-  return new Date(ms).toLocaleString('en-GB', {hour:'2-digit',minute:'2-digit',day:'numeric',month:'short'});
+  return _fmtDate(_DTF_SHORT, new Date(ms));
 }
 
 // Inflight dedup: 5 long-lived SSE EventSources (brain, flow-brain,
@@ -2635,6 +2762,46 @@ async function fetchJsonWithTimeout(url, timeoutMs) {
   return p;
 }
 
+// /api/overview has readers besides loadAll (Flow tab, context inspector,
+// runtime switcher). The last payload is kept for OVERVIEW_REUSE_MS and handed
+// to them instead of refetching; loadAll's bulk response refreshes it too.
+// Readers must not mutate it.
+var OVERVIEW_REUSE_MS = 5000;
+var _overviewCache = { at: 0, data: null };
+function rememberOverview(data) {
+  if (data) { _overviewCache.at = Date.now(); _overviewCache.data = data; }
+  return data;
+}
+function getOverview(timeoutMs) {
+  if (_overviewCache.data && Date.now() - _overviewCache.at < OVERVIEW_REUSE_MS) {
+    return Promise.resolve(_overviewCache.data);
+  }
+  return fetchJsonWithTimeout('/api/overview', timeoutMs || 5000).then(rememberOverview);
+}
+
+// /api/subagents is read by several panels that refresh together (Overview
+// tasks, Sessions, the sub-agent modal). Callers share one in-flight request,
+// and a settled result is reused for SUBAGENTS_REUSE_MS so a burst of clicks
+// doesn't refetch it. Failures aren't kept. Callers must not mutate the
+// shared payload.
+var SUBAGENTS_REUSE_MS = 500;
+var _subagentsShared = null;
+function fetchSubagentsShared() {
+  var hit = _subagentsShared;
+  if (hit && (hit.pending || Date.now() - hit.at < SUBAGENTS_REUSE_MS)) return hit.promise;
+  var entry = { pending: true, at: 0 };
+  entry.promise = fetch('/api/subagents').then(function(r) { return r.json(); }).then(function(data) {
+    entry.pending = false;
+    entry.at = Date.now();
+    return data;
+  }, function(e) {
+    if (_subagentsShared === entry) _subagentsShared = null;
+    throw e;
+  });
+  _subagentsShared = entry;
+  return entry.promise;
+}
+
 // Same root cause as above — when the browser tab is hidden the 5 SSE are
 // useless yet still hold connection slots. Close them on hidden; the tab-
 // change handlers re-open the one needed when the user returns (each guards
@@ -2780,9 +2947,7 @@ async function loadHealthTimeline() {
 // Minimal HTML escape for the runtime label; the rest of the values are
 // hand-built from numbers/timestamps so they're safe without escaping.
 function escapeHtmlSafe(s) {
-  return String(s == null ? '' : s)
-    .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+  return String(s == null ? '' : s).replace(_HTML_ESC_RE, _htmlEscChar);
 }
 
 // ── Per-run compare modal (#2196 item #2) ───────────────────────────────────
@@ -3211,8 +3376,11 @@ async function loadAll() {
   try {
     // Runtime scope banner on first paint (showTab only fires on tab switch).
     try { _cmApplyRuntimeScopeNote('overview'); } catch (e) {}
-    // Render overview quickly; do not block on heavy usage aggregation.
-    var overview = await fetchJsonWithTimeout('/api/overview', 3000);
+    // One round-trip for overview + usage + logs + sub-agents. If the bulk
+    // call is slow or fails, fall back to the overview alone so the page
+    // still renders quickly; the other parts then fetch their own endpoints.
+    var bulk = await fetchJsonWithTimeout('/api/dashboard/bulk', 5000).catch(function () { return null; });
+    var overview = (bulk && rememberOverview(bulk.overview)) || await getOverview(3000);
     window._cmOverview = overview;
     try { renderOauthBanner(overview); } catch(e) {}
     try { _renderOverviewHero(); } catch(e) {}
@@ -3260,11 +3428,11 @@ async function loadAll() {
 
     // Usage may be slow on first run; keep trying in background with timeout.
     try {
-      var usage = await fetchJsonWithTimeout('/api/usage', 5000);
-      loadMiniWidgets(overview, usage);
+      var usage = (bulk && bulk.usage) || await fetchJsonWithTimeout('/api/usage', 5000);
+      loadMiniWidgets(overview, usage, bulk);
     } catch (e) {
       // Keep UI responsive with placeholder values until next refresh.
-      loadMiniWidgets(overview, {todayCost:0, weekCost:0, monthCost:0, month:0, today:0});
+      loadMiniWidgets(overview, {todayCost:0, weekCost:0, monthCost:0, month:0, today:0}, bulk);
     }
     // Health timeline (#2196 item #4) — fire-and-forget; renderer hides the
     // card if there's nothing to show.
@@ -3285,12 +3453,81 @@ async function loadAll() {
   return _loadAllInFlight;
 }
 
-async function loadMiniWidgets(overview, usage) {
+// Write textContent only when it differs. The Overview refresh re-sets every
+// widget on each poll, and most values are unchanged; comparing against the
+// current text (a read, no layout) skips dirtying the node in that case.
+// Compared against the DOM rather than a remembered value so writes made
+// elsewhere can't leave it stale.
+function setText(el, v) {
+  var s = (v == null) ? '' : String(v);
+  if (el.textContent !== s) el.textContent = s;
+}
+
+// innerHTML counterpart for markup rebuilt on every poll (tables, badges).
+// Serialized innerHTML can't be compared with the source string, so the last
+// string written through here is remembered per element; an unchanged
+// rebuild skips the parse and the subtree replacement. Only use it for
+// elements that nothing else writes.
+var _htmlWritten = new WeakMap();
+function setHtml(el, html) {
+  if (_htmlWritten.get(el) === html) return;
+  el.innerHTML = html;
+  _htmlWritten.set(el, html);
+}
+
+// Same idea for className: an unchanged assignment still invalidates style.
+function setClass(el, cls) {
+  if (el.className !== cls) el.className = cls;
+}
+
+// getElementById memo for nodes rewritten on every poll or SSE tick. As with
+// initDomCache(), a missing or detached entry is looked up again.
+var _elCache = {};
+function cachedEl(id) {
+  var el = _elCache[id];
+  if (!el || !el.isConnected) el = _elCache[id] = document.getElementById(id);
+  return el;
+}
+
+// Overview widget elements, looked up once rather than on every refresh.
+// initDomCache() (re)resolves only entries that are missing or detached, so
+// widgets whose markup appears later are picked up on the next call.
+var _OV_WIDGET_IDS = {
+  costToday: 'cost-today',
+  costWeek: 'cost-week',
+  costMonth: 'cost-month',
+  costTrend: 'cost-trend',
+  costBillingBadge: 'cost-billing-badge',
+  costInfoIcon: 'cost-info-icon',
+  tokenRate: 'token-rate',
+  tokensToday: 'tokens-today',
+  hotSessionsCount: 'hot-sessions-count',
+  hotSessionsLabel: 'hot-sessions-label',
+  modelPrimary: 'model-primary',
+  modelBreakdown: 'model-breakdown',
+  mainActivityModel: 'main-activity-model',
+  subagentsCount: 'subagents-count',
+  subagentsStatus: 'subagents-status',
+  subagentsPreview: 'subagents-preview',
+  toolsActive: 'tools-active',
+  toolsRecent: 'tools-recent'
+};
+var _ovEls = {};
+
+function initDomCache() {
+  Object.keys(_OV_WIDGET_IDS).forEach(function(k) {
+    var el = _ovEls[k];
+    if (!el || !el.isConnected) _ovEls[k] = document.getElementById(_OV_WIDGET_IDS[k]);
+  });
+  return _ovEls;
+}
+
+async function loadMiniWidgets(overview, usage, bulk) {
+  initDomCache();
   // 💰 Cost Ticker 
-  function fmtCost(c) { return c >= 0.01 ? '$' + c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
-  document.getElementById('cost-today').textContent = fmtCost(usage.todayCost || 0);
-  document.getElementById('cost-week').textContent = fmtCost(usage.weekCost || 0);
-  document.getElementById('cost-month').textContent = fmtCost(usage.monthCost || 0);
+  setText(_ovEls.costToday, fmtCost(usage.todayCost || 0));
+  setText(_ovEls.costWeek, fmtCost(usage.weekCost || 0));
+  setText(_ovEls.costMonth, fmtCost(usage.monthCost || 0));
   
   var trend = '';
   if (usage.trend && usage.trend.trend) {
@@ -3299,22 +3536,22 @@ async function loadMiniWidgets(overview, usage) {
   }
   var isOauthLikely = (usage.billingSummary === 'likely_oauth_or_included');
   var isMixed = (usage.billingSummary === 'mixed');
-  var trendEl = document.getElementById('cost-trend');
-  var badgeEl = document.getElementById('cost-billing-badge');
-  var infoIcon = document.getElementById('cost-info-icon');
+  var trendEl = _ovEls.costTrend;
+  var badgeEl = _ovEls.costBillingBadge;
+  var infoIcon = _ovEls.costInfoIcon;
 
   if (isOauthLikely) {
     if (badgeEl) {
       badgeEl.style.display = '';
-      badgeEl.textContent = t("app.est_equivalent_if_billed_oauth_likely", null, "est. equivalent if billed - OAuth likely");
+      setText(badgeEl, t("app.est_equivalent_if_billed_oauth_likely", null, "est. equivalent if billed - OAuth likely"));
     }
     trendEl.style.display = 'none';
   } else {
     if (badgeEl) {
       badgeEl.style.display = 'none';
-      badgeEl.textContent = '';
+      setText(badgeEl, '');
     }
-    trendEl.textContent = trend || 'Today\'s running total';
+    setText(trendEl, trend || 'Today\'s running total');
     trendEl.style.display = trend ? '' : 'none';
   }
 
@@ -3331,12 +3568,11 @@ async function loadMiniWidgets(overview, usage) {
   applyBillingHintToFlow(usage.billingSummary || 'unknown');
   
   // ⚡ Tool Activity (load from logs)
-  loadToolActivity();
+  loadToolActivity(bulk && bulk.logStats);
   
   // 📊 Token Burn Rate
-  function fmtTokens(n) { return n >= 1000000 ? (n/1000000).toFixed(1) + 'M' : n >= 1000 ? (n/1000).toFixed(0) + 'K' : String(n); }
-  document.getElementById('token-rate').textContent = fmtTokens(usage.month || 0);
-  document.getElementById('tokens-today').textContent = fmtTokens(usage.today || 0);
+  setText(_ovEls.tokenRate, fmtTokens(usage.month || 0));
+  setText(_ovEls.tokensToday, fmtTokens(usage.today || 0));
   // Raw today-token total (unformatted) so the hero can compute live tokens/sec.
   window._cmTodayTokensRaw = Number(usage.today || 0);
   
@@ -3347,7 +3583,7 @@ async function loadMiniWidgets(overview, usage) {
   // and it briefly read "0" on a slow/failed fetch. Set synchronously from the
   // value already in hand so the card is never blank and never contradicts the
   // hero. (Card relabeled "Sessions today" in overview.html.)
-  document.getElementById('hot-sessions-count').textContent = overview.sessionCount || 0;
+  setText(_ovEls.hotSessionsCount, overview.sessionCount || 0);
 
   // 📈 Runtime scope — when a runtime is selected, the Overview stat cards
   // (sessions / tokens / cost / model) must show ONLY that runtime's data
@@ -3406,7 +3642,7 @@ async function loadMiniWidgets(overview, usage) {
       if (_scope) {
         window._cmRuntimeScope = _scope;
         var _fmtT = function (n) { return n >= 1e6 ? (n / 1e6).toFixed(1) + 'M' : n >= 1e3 ? (n / 1e3).toFixed(0) + 'K' : String(n); };
-        var _set = function (id, v) { var e = document.getElementById(id); if (e) e.textContent = v; };
+        var _set = function (id, v) { var e = document.getElementById(id); if (e) setText(e, v); };
         _set('hot-sessions-count', _scope.sessions);
         _set('tokens-today', _fmtT(_scope.tokensToday));
         _set('token-rate', _fmtT(_scope.tokensMonth));
@@ -3418,26 +3654,26 @@ async function loadMiniWidgets(overview, usage) {
       }
     }
   } catch (e) { /* keep the node-dominant values */ }
-  document.getElementById('model-primary').textContent = _ovModel;
+  setText(_ovEls.modelPrimary, _ovModel);
   // Relabel the SESSIONS tile: scoped shows the runtime's TOTAL (matches the
   // switcher) so "today" would be wrong; node-wide stays the live "today".
   try {
-    var _slbl = document.getElementById('hot-sessions-label');
-    if (_slbl) _slbl.textContent = window._cmRuntimeScope
+    var _slbl = _ovEls.hotSessionsLabel;
+    if (_slbl) setText(_slbl, window._cmRuntimeScope
       ? t('overview.sessions', null, 'Sessions')
-      : t('overview.sessions_today', null, 'Sessions today');
+      : t('overview.sessions_today', null, 'Sessions today'));
   } catch (e) {}
   // Re-render the hero so its headline (sessions / cost / model) reflects the
   // scope just applied (it may have first painted node-wide from loadAll).
   try { if (typeof _renderOverviewHero === 'function') _renderOverviewHero(); } catch (e) {}
-  var modelLabel = document.getElementById('main-activity-model');
+  var modelLabel = _ovEls.mainActivityModel;
   if (modelLabel && _ovModel && _ovModel !== '—') {
     var m = _ovModel;
     if (m.indexOf('/') !== -1) m = m.split('/').pop();
     m = m.replace(/-/g, ' ').replace(/\b\w/g, function(c){return c.toUpperCase();});
-    modelLabel.textContent = m;
+    setText(modelLabel, m);
   } else if (modelLabel && _ovModel === '—') {
-    modelLabel.textContent = '—';
+    setText(modelLabel, '—');
   }
   var modelBreakdown = '';
   if (usage.modelBreakdown && usage.modelBreakdown.length > 0) {
@@ -3450,10 +3686,10 @@ async function loadMiniWidgets(overview, usage) {
   } else {
     modelBreakdown = 'Primary model';
   }
-  document.getElementById('model-breakdown').textContent = modelBreakdown;
+  setText(_ovEls.modelBreakdown, modelBreakdown);
   
   // 🐝 Worker Bees (Sub-Agents)
-  loadSubAgents();
+  loadSubAgents(bulk && bulk.subagents);
 
   // Issue #1619 Phase 1 — eval score tile. Lazy, non-blocking; tile shows
   // a dash on miss so a slow daemon doesn't gate the overview render.
@@ -3703,14 +3939,16 @@ async function saveEvalRubric() {
   }
 }
 
-async function loadSubAgents() {
+async function loadSubAgents(prefetched) {
+  initDomCache();
   try {
-    var _saResp = await fetch('/api/subagents').then(async function(r) { return {s: r.status, b: await r.json()}; });
+    var _saResp = prefetched ? {s: 200, b: prefetched}
+      : await fetch('/api/subagents').then(async function(r) { return {s: r.status, b: await r.json()}; });
     var data = _saResp.b || {};
     // Issue #1804: show outage banner when ingest is offline (503 envelope).
     if (_saResp.s === 503 && data && data.error === 'local_store ingest is offline') {
-      document.getElementById('subagents-status').textContent = t("app.ingest_offline", null, "Ingest offline");
-      var _saPrev = document.getElementById('subagents-preview');
+      setText(_ovEls.subagentsStatus, t("app.ingest_offline", null, "Ingest offline"));
+      var _saPrev = _ovEls.subagentsPreview;
       if (_saPrev) _saPrev.innerHTML = '<div style="background:#fff7ed;border:1px solid #f59e0b;color:#92400e;padding:12px 16px;border-radius:6px;font-size:12px;"><strong>' + t("app.ingest_temporarily_offline", null, "Ingest temporarily offline.") + '</strong> Sub-agent data unavailable; the local_store writer is not responding.</div>';
       return;
     }
@@ -3718,7 +3956,7 @@ async function loadSubAgents() {
     var subagents = data.subagents;
 
     // Update main counter
-    document.getElementById('subagents-count').textContent = counts.total;
+    setText(_ovEls.subagentsCount, counts.total);
     
     // Update status text
     var statusText = '';
@@ -3731,38 +3969,40 @@ async function loadSubAgents() {
     } else {
       statusText = 'All idle/stale';
     }
-    document.getElementById('subagents-status').textContent = statusText;
+    setText(_ovEls.subagentsStatus, statusText);
     
     // Update preview with top sub-agents (human-readable)
-    var previewHtml = '';
     if (subagents.length === 0) {
-      previewHtml = '<div style="font-size:11px;color:#666;">No active tasks</div>';
+      _ovEls.subagentsPreview.innerHTML = '<div style="font-size:11px;color:#666;">No active tasks</div>';
     } else {
       // Show active ones first
       var activeFirst = subagents.filter(function(a){return a.status==='active';}).concat(subagents.filter(function(a){return a.status!=='active';}));
       var topAgents = activeFirst.slice(0, 3);
+      var preview = document.createDocumentFragment();
       topAgents.forEach(function(agent) {
         var icon = agent.status === 'active' ? '🔄' : agent.status === 'idle' ? '✅' : '⬜';
         var name = cleanTaskName(agent.displayName);
         if (name.length > 40) name = name.substring(0, 37) + '…';
-        previewHtml += '<div class="subagent-item">';
-        previewHtml += '<span style="font-size:10px;">' + icon + '</span>';
-        previewHtml += '<span class="subagent-name" style="overflow:hidden;text-overflow:ellipsis;white-space:nowrap;">' + escHtml(name) + '</span>';
-        previewHtml += '<span class="subagent-runtime">' + agent.runtime + '</span>';
-        previewHtml += '</div>';
+        var row = _tplRow('tpl-subagent-item');
+        row.querySelector('.sa-icon').textContent = icon;
+        row.querySelector('.subagent-name').textContent = name;
+        row.querySelector('.subagent-runtime').textContent = agent.runtime;
+        preview.appendChild(row);
       });
       
       if (subagents.length > 3) {
-        previewHtml += '<div style="font-size:9px;color:#555;margin-top:4px;">+' + (subagents.length - 3) + ' more</div>';
+        var more = document.createElement('div');
+        more.style.cssText = 'font-size:9px;color:#555;margin-top:4px;';
+        more.textContent = '+' + (subagents.length - 3) + ' more';
+        preview.appendChild(more);
       }
+      _ovEls.subagentsPreview.replaceChildren(preview);
     }
     
-    document.getElementById('subagents-preview').innerHTML = previewHtml;
-    
   } catch(e) {
-    document.getElementById('subagents-count').textContent = '?';
-    document.getElementById('subagents-status').textContent = t("app.error_loading_sub_agents", null, "Error loading sub-agents");
-    document.getElementById('subagents-preview').innerHTML = '<div style="color:#e74c3c;font-size:11px;">' + t("app.failed_to_load_workforce", null, "Failed to load workforce") + '</div>';
+    setText(_ovEls.subagentsCount, '?');
+    setText(_ovEls.subagentsStatus, t("app.error_loading_sub_agents", null, "Error loading sub-agents"));
+    _ovEls.subagentsPreview.innerHTML = '<div style="color:#e74c3c;font-size:11px;">' + t("app.failed_to_load_workforce", null, "Failed to load workforce") + '</div>';
   }
 }
 
@@ -3824,7 +4064,7 @@ async function loadActiveTasks() {
     if (!grid) return;
 
     // Fetch active sub-agents
-    var saData = await fetch('/api/subagents').then(r => r.json()).catch(function() { return {subagents:[]}; });
+    var saData = await fetchSubagentsShared().catch(function() { return {subagents:[]}; });
 
     // "Active Tasks" should mean ACTIVE. Previously we lingered failed
     // and stale entries here for 24h, which meant a subagent that failed
@@ -3859,7 +4099,7 @@ async function loadActiveTasks() {
     var badge = document.getElementById('overview-tasks-count-badge');
     if (badge) {
       var liveCount = agents.filter(function(a) { return a.status === 'active' || a.status === 'idle'; }).length;
-      badge.textContent = liveCount > 0 ? (liveCount + ' active') : (agents.length + ' recent');
+      setText(badge, liveCount > 0 ? (liveCount + ' active') : (agents.length + ' recent'));
     }
 
     // Per-status visual style
@@ -3919,39 +4159,44 @@ function startActiveTasksRefresh() {
   _activeTasksTimer = visibilitySetInterval(loadActiveTasks, 30000);
 }
 
-async function loadToolActivity() {
+async function loadToolActivity(prefetched) {
+  initDomCache();
   try {
-    var logs = await fetch('/api/logs?lines=100').then(r => r.json());
-    var toolCounts = { exec: 0, browser: 0, search: 0, other: 0 };
-    var recentTools = [];
-    
-    logs.lines.forEach(function(line) {
-      var msg = line.toLowerCase();
-      if (msg.includes('tool') || msg.includes('invoke')) {
-        if (msg.includes('exec') || msg.includes('shell')) { 
-          toolCounts.exec++; recentTools.push('exec'); 
-        } else if (msg.includes('browser') || msg.includes('screenshot')) { 
-          toolCounts.browser++; recentTools.push('browser'); 
-        } else if (msg.includes('web_search') || msg.includes('web_fetch')) { 
-          toolCounts.search++; recentTools.push('search'); 
-        } else {
-          toolCounts.other++;
-        }
-      }
-    });
+    // Classified server-side, incrementally as the log grows.
+    var stats = prefetched || await fetch('/api/logs/stats').then(r => r.json());
+    var toolCounts = stats.toolCounts;
     
-    document.getElementById('tools-active').textContent = recentTools.slice(0, 3).join(', ') || 'Idle';
-    document.getElementById('tools-recent').textContent = t("app.last", null, "Last ") + Math.min(logs.lines.length, 100) + ' log entries';
+    setText(_ovEls.toolsActive, stats.recentTools.join(', ') || 'Idle');
+    setText(_ovEls.toolsRecent, t("app.last", null, "Last ") + stats.lines + ' log entries');
     
     var sparks = document.querySelectorAll('.tool-spark span');
-    sparks[0].textContent = toolCounts.exec;
-    sparks[1].textContent = toolCounts.browser;  
-    sparks[2].textContent = toolCounts.search;
+    setText(sparks[0], toolCounts.exec);
+    setText(sparks[1], toolCounts.browser);
+    setText(sparks[2], toolCounts.search);
   } catch(e) {
-    document.getElementById('tools-active').textContent = '--';
+    setText(_ovEls.toolsActive, '--');
   }
 }
 
+// Fresh copy of a row from a <template> in the page (see tabs/overview.html).
+// Template lookups are cached; callers fill the copy via textContent.
+var _rowTemplates = {};
+function _tplRow(id) {
+  var tpl = _rowTemplates[id];
+  if (!tpl || !tpl.isConnected) tpl = _rowTemplates[id] = document.getElementById(id);
+  return tpl.content.firstElementChild.cloneNode(true);
+}
+
+// Labels for the activity tags /api/transcript/<id>/activity assigns to each
+// assistant reply; "thought" rows show the server-side preview instead.
+var _ACTIVITY_LABELS = {
+  search: '🔍 Searching web for information',
+  read: '📖 Reading files',
+  edit: '✏️ Editing files',
+  exec: '⚡ Running commands',
+  browser: '🌐 Browser automation'
+};
+
 async function loadActivityStream() {
   try {
     var transcripts = await fetchJsonWithTimeout('/api/transcripts', 4000);
@@ -3961,46 +4206,22 @@ async function loadActivityStream() {
     if (transcripts.transcripts && transcripts.transcripts.length > 0) {
       var recent = transcripts.transcripts[0];
       try {
-        var transcript = await fetchJsonWithTimeout('/api/transcript/' + recent.id, 4000);
-        var recentMessages = transcript.messages.slice(-10); // Last 10 messages
+        // The server tags the last 10 messages and sends only {ts, tag,
+        // preview}, plus the latest reply for the hero, not the messages.
+        var feed = await fetchJsonWithTimeout('/api/transcript/' + recent.id + '/activity?tail=10', 4000);
         // Stash the latest assistant reply for the Overview hero ("Last thing
-        // it did: …") — reuses this already-fetched transcript, no new request.
+        // it did: …") — rides along with the activity rows, no new request.
         try {
-          for (var _mi = transcript.messages.length - 1; _mi >= 0; _mi--) {
-            var _m = transcript.messages[_mi];
-            if (_m && _m.role === 'assistant' && _m.content && String(_m.content).trim()) {
-              window._cmLastAgentSay = { text: String(_m.content).trim(), when: _m.timestamp || null };
-              break;
-            }
-          }
+          if (feed.lastReply) window._cmLastAgentSay = { text: feed.lastReply.text, when: feed.lastReply.when || null };
           try { if (typeof _renderOverviewHero === 'function') _renderOverviewHero(); } catch (_e_hero) {}
           try { if (typeof _renderWasteSummary === 'function') _renderWasteSummary(); } catch (_e2) {}
           try { if (typeof _renderOutLoopSources === 'function') _renderOutLoopSources(); } catch (_e3) {}
         } catch (_e) {}
 
-        recentMessages.forEach(function(msg) {
-          if (msg.role === 'assistant' && msg.content) {
-            var content = msg.content.toLowerCase();
-            var activity = '';
-            var time = new Date(msg.timestamp || Date.now()).toLocaleTimeString();
-            
-            if (content.includes('searching') || content.includes('search')) {
-              activity = time + ' 🔍 Searching web for information';
-            } else if (content.includes('reading') || content.includes('file')) {
-              activity = time + ' 📖 Reading files';
-            } else if (content.includes('writing') || content.includes('edit')) {
-              activity = time + ' ✏️ Editing files'; 
-            } else if (content.includes('exec') || content.includes('command')) {
-              activity = time + ' ⚡ Running commands';
-            } else if (content.includes('browser') || content.includes('screenshot')) {
-              activity = time + ' 🌐 Browser automation';
-            } else if (msg.content.length > 50) {
-              var preview = msg.content.substring(0, 80).replace(/[^\w\s]/g, ' ').trim();
-              activity = time + ' 💭 ' + preview + '...';
-            }
-            
-            if (activity) activities.push(activity);
-          }
+        (feed.activity || []).forEach(function(row) {
+          var time = new Date(row.ts || Date.now()).toLocaleTimeString();
+          var label = row.tag === 'thought' ? '💭 ' + row.preview + '...' : _ACTIVITY_LABELS[row.tag];
+          if (label) activities.push(time + ' ' + label);
         });
       } catch(e) {}
     }
@@ -4012,11 +4233,14 @@ async function loadActivityStream() {
       ];
     }
     
-    var html = activities.slice(-8).map(function(a) {
-      return '<div style="padding:4px 0; border-bottom:1px solid #1a1a30; color:#ccc;">' + escHtml(a) + '</div>';
-    }).join('');
+    var rows = activities.slice(-8).map(function(a) {
+      var row = _tplRow('tpl-activity-item');
+      row.textContent = a;
+      return row;
+    });
     
-    document.getElementById('activity-stream').innerHTML = html;
+    var streamEl = document.getElementById('activity-stream');
+    streamEl.replaceChildren.apply(streamEl, rows);
   } catch(e) {
     document.getElementById('activity-stream').innerHTML = '<div style="color:#666;">' + t("app.error_loading_activity_stream", null, "Error loading activity stream") + '</div>';
   }
@@ -6505,7 +6729,7 @@ function _buildSourcesList(events) {
 async function loadContextInspector() {
   try {
     // Fetch overview for model + token info
-    var ov = await fetchJsonWithTimeout('/api/overview', 5000).catch(function(){return {};});
+    var ov = await getOverview().catch(function(){return {};});
     // Fetch brain history for compaction events + turn count
     var brain = await fetchJsonWithTimeout('/api/brain-history?limit=300', 8000).catch(function(){return {events:[]};});
     // Skills header token count. Prefer the OSS↔cloud-shared
@@ -8373,62 +8597,131 @@ function showGenericModal(title, bodyHtml) {
   document.body.appendChild(overlay);
 }
 
-function renderLogs(elId, lines) {
-  var html = '';
-  lines.forEach(function(l) {
-    var cls = 'msg';
-    var display = l;
-    try {
-      var obj = JSON.parse(l);
-      var ts = '';
-      if (obj.time || (obj._meta && obj._meta.date)) {
-        var d = new Date(obj.time || obj._meta.date);
-        ts = d.toLocaleTimeString('en-GB', {hour:'2-digit', minute:'2-digit', second:'2-digit'});
-      }
-      var level = (obj.logLevelName || obj.level || 'info').toLowerCase();
-      if (level === 'error' || level === 'fatal') cls = 'err';
-      else if (level === 'warn' || level === 'warning') cls = 'warn';
-      else if (level === 'debug') cls = 'msg';
-      else cls = 'info';
-      var msg = obj.msg || obj.message || obj.name || '';
-      var extras = [];
-      // Field "0" is usually a JSON string like {"subsystem":"gateway/ws"} - extract subsystem
-      var subsystem = '';
-      if (obj["0"]) {
-        try { var sub = JSON.parse(obj["0"]); subsystem = sub.subsystem || ''; } catch(e) { subsystem = String(obj["0"]); }
-      }
-      // Field "1" can be a string or object - stringify objects
-      function flatVal(v) { return (typeof v === 'object' && v !== null) ? JSON.stringify(v) : String(v); }
-      if (obj["1"]) {
-        if (typeof obj["1"] === 'object') {
-          var parts = [];
-          for (var k in obj["1"]) { if (k !== 'cause') parts.push(k + '=' + flatVal(obj["1"][k])); else parts.unshift(flatVal(obj["1"][k])); }
-          extras.push(parts.join(' '));
-        } else {
-          extras.push(String(obj["1"]));
-        }
+// One historical log line → {cls, ts, msg, text}. Richer than parseLogLine
+// (subsystem prefix, flattened field "1"/"2"); self-contained apart from
+// _parseLogJson, _logTextClass and the clock formatter, so _logParseWorker can ship it to a
+// worker as source.
+function _logRowFromLine(l) {
+  var cls = 'msg';
+  var display = l;
+  var obj = _parseLogJson(l);
+  if (obj) try {
+    var ts = '';
+    if (obj.time || (obj._meta && obj._meta.date)) {
+      var d = new Date(obj.time || obj._meta.date);
+      ts = _fmtDate(_DTF_CLOCK, d);
+    }
+    var level = (obj.logLevelName || obj.level || 'info').toLowerCase();
+    if (level === 'error' || level === 'fatal') cls = 'err';
+    else if (level === 'warn' || level === 'warning') cls = 'warn';
+    else if (level === 'debug') cls = 'msg';
+    else cls = 'info';
+    var msg = obj.msg || obj.message || obj.name || '';
+    var extras = [];
+    // Field "0" is usually a JSON string like {"subsystem":"gateway/ws"} - extract subsystem
+    var subsystem = '';
+    if (obj["0"]) {
+      try { var sub = JSON.parse(obj["0"]); subsystem = sub.subsystem || ''; } catch(e) { subsystem = String(obj["0"]); }
+    }
+    // Field "1" can be a string or object - stringify objects
+    function flatVal(v) { return (typeof v === 'object' && v !== null) ? JSON.stringify(v) : String(v); }
+    if (obj["1"]) {
+      if (typeof obj["1"] === 'object') {
+        var parts = [];
+        for (var k in obj["1"]) { if (k !== 'cause') parts.push(k + '=' + flatVal(obj["1"][k])); else parts.unshift(flatVal(obj["1"][k])); }
+        extras.push(parts.join(' '));
+      } else {
+        extras.push(String(obj["1"]));
       }
-      if (obj["2"]) extras.push(flatVal(obj["2"]));
-      // Build display
-      var prefix = subsystem ? '[' + subsystem + '] ' : '';
-      if (msg && extras.length) display = prefix + msg + ' ' + extras.join(' ');
-      else if (extras.length) display = prefix + extras.join(' ');
-      else if (msg) display = prefix + msg;
-      else display = l.substring(0, 200);
-      if (ts) display = '<span class="ts">' + ts + '</span> ' + escHtml(display);
-      else display = escHtml(display);
-    } catch(e) {
-      if (l.includes('Error') || l.includes('failed')) cls = 'err';
-      else if (l.includes('WARN')) cls = 'warn';
-      display = escHtml(l.substring(0, 300));
-    }
-    html += '<div class="log-line"><span class="' + cls + '">' + display + '</span></div>';
+    }
+    if (obj["2"]) extras.push(flatVal(obj["2"]));
+    // Build display
+    var prefix = subsystem ? '[' + subsystem + '] ' : '';
+    if (msg && extras.length) display = prefix + msg + ' ' + extras.join(' ');
+    else if (extras.length) display = prefix + extras.join(' ');
+    else if (msg) display = prefix + msg;
+    else display = l.substring(0, 200);
+    var text = (ts ? ts + ' ' : '') + display;
+  } catch(e) { obj = null; }
+  if (!obj) {
+    // The history view has no 'info' tier for plain text lines.
+    cls = _logTextClass(l);
+    if (cls === 'info') cls = 'msg';
+    ts = '';
+    display = text = l.substring(0, 300);
+  }
+  return { cls: cls, ts: ts, msg: display, text: text.toLowerCase() };
+}
+
+// Big historical loads (the Logs tab offers up to 1000 lines) are parsed in a
+// worker so the JSON work doesn't hold the main thread; the worker is built
+// from the functions above, so there's one copy of the parsing rules. Small
+// loads, or browsers where the worker can't start, parse inline, so a small
+// newer load can finish before a large older one: renderLogs takes the load's
+// sequence number and drops a parse that has been superseded.
+var LOG_WORKER_MIN_LINES = 200;
+var _logWorker = null;
+var _logWorkerQueue = [];
+
+function _logParseWorker() {
+  if (_logWorker !== null) return _logWorker;
+  _logWorker = false;
+  try {
+    var src = [_parseLogJson, _logTextClass, _fmtDate, _logRowFromLine].map(String).join('\n')
+      + '\nvar _LOG_CLASS_RE = ' + String(_LOG_CLASS_RE) + ';'
+      + '\nvar _DTF_CLOCK = new Intl.DateTimeFormat("en-GB", ' + JSON.stringify(_DTF_CLOCK_OPTS) + ');'
+      + '\nonmessage = function(e) { postMessage(e.data.map(_logRowFromLine)); };';
+    var w = new Worker(URL.createObjectURL(new Blob([src], { type: 'text/javascript' })));
+    w.onmessage = function(e) { _logWorkerQueue.shift().resolve(e.data); };
+    w.onerror = function() {
+      // Finish whatever was queued inline and stop using the worker.
+      _logWorker = false;
+      w.terminate();
+      _logWorkerQueue.splice(0).forEach(function(job) { job.resolve(job.lines.map(_logRowFromLine)); });
+    };
+    _logWorker = w;
+  } catch (e) {}
+  return _logWorker;
+}
+
+function _parseLogLines(lines) {
+  var w = lines.length >= LOG_WORKER_MIN_LINES ? _logParseWorker() : null;
+  if (!w) return Promise.resolve(lines.map(_logRowFromLine));
+  return new Promise(function(resolve) {
+    _logWorkerQueue.push({ lines: lines, resolve: resolve });
+    w.postMessage(lines);
   });
-  document.getElementById(elId).innerHTML = html || '<span style="color:#555">No logs</span>';
-  document.getElementById(elId).scrollTop = document.getElementById(elId).scrollHeight;
 }
 
-function escHtml(s) { s=String(s||''); return s.replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;'); }
+// Live rows that _logsAppendRows adds while the parse is pending are kept
+// after the history instead of being replaced by it.
+async function renderLogs(elId, lines, seq) {
+  var el = document.getElementById(elId);
+  var v = _vlistFor(el);
+  var appended = v.appended;
+  var rows = await _parseLogLines(lines);
+  if (seq !== undefined && seq !== _logsLoadSeq) return;
+  v = _vlistFor(el);
+  var fresh = v.appended - appended;
+  if (fresh > 0) rows = rows.concat(v.rows.slice(-fresh));
+  if (!rows.length) {
+    el.innerHTML = '<span style="color:#555">No logs</span>';
+    return;
+  }
+  v.rows = rows;
+  _logsRefilter(v);
+  _vlistRender(v, true);
+  el.scrollTop = el.scrollHeight;
+  _vlistRender(v);
+}
+
+// Strings with nothing to escape (most names and model ids) are returned
+// as-is; the rest take a single replace pass. Self-contained (no module
+// state) because the unit tests load it on its own.
+function escHtml(s) {
+  s = String(s || '');
+  return /[&<>]/.test(s) ? s.replace(/[&<>]/g, function(c) { return c === '&' ? '&amp;' : c === '<' ? '&lt;' : '&gt;'; }) : s;
+}
 
 async function viewFile(path) {
   var viewer = document.getElementById('file-viewer');
@@ -8808,8 +9101,7 @@ async function _cmLoadDetectedRuntimes() {
       var sp = await window.__cmSnap();
       det = sp && sp.detectedRuntimes;            // daemon-detected, server-blind
     } else {
-      var ov = await fetch('/api/overview', { credentials: 'same-origin' })
-        .then(function(r) { return r.json(); }).catch(function() { return null; });
+      var ov = await getOverview().catch(function() { return null; });
       det = ov && (ov.detectedRuntimes || ov.detected_runtimes);
     }
     var run = {};
@@ -9444,8 +9736,7 @@ async function _cmInitGlobalRuntimeSwitcher() {
   // appear without a manual page reload. The refresher only re-renders when a
   // count actually rises, so an open dropdown is never yanked shut.
   if (!window._cmRtCountsTimer) {
-    window._cmRtCountsTimer = setInterval(function() {
-      if (document.hidden) return; // no polling for a tab nobody is looking at
+    window._cmRtCountsTimer = visibilitySetInterval(function() {
       _cmRefreshRuntimeCounts(false).catch(function() {});
     }, 60000);
   }
@@ -9507,7 +9798,7 @@ async function loadSessions() {
   }
   var [sessData, saData, anomalyData, costData, chainData, riskBrain, evalData, loopData] = await Promise.all([
     fetch('/api/sessions').then(r => r.json()).catch(function() { return {sessions:[]}; }),
-    fetch('/api/subagents').then(r => r.json()).catch(function() { return {subagents:[]}; }),
+    fetchSubagentsShared().catch(function() { return {subagents:[]}; }),
     fetch('/api/usage/anomalies').then(r => r.json()).catch(function() { return {anomalies:[]}; }),
     fetch('/api/sessions/cost-breakdown').then(r => r.json()).catch(function() { return {sessions:[]}; }),
     fetch('/api/delegation-tree').then(r => r.json()).catch(function() { return {chains:[], total_subagents:0, total_chain_cost_usd:0}; }),
@@ -9564,8 +9855,12 @@ async function loadSessions() {
   // Main sessions (non-subagent)
   var mainSessions = sessData.sessions.filter(function(s) { return !(s.sessionId || '').includes('subagent'); });
   var subagents = saData.subagents || [];
+  // One string per session row, joined once: each row is built from dozens
+  // of appends, and accumulating them all into one string copies it as it grows.
+  var rowParts = new Array(mainSessions.length);
   
-  mainSessions.forEach(function(s) {
+  mainSessions.forEach(function(s, rowIdx) {
+    var html = '';
     var anomaly = anomalySet[s.sessionId];
     var sid = s.sessionId || s.id || s.key || '';
     var sparkId = 'session-burn-' + Math.random().toString(36).slice(2);
@@ -9686,7 +9981,9 @@ async function loadSessions() {
       html += '</div>';
     }
     html += '</div>';
+    rowParts[rowIdx] = html;
   });
+  html = rowParts.join('');
   
   // Show orphan sessions that aren't main
   var subSessions = sessData.sessions.filter(function(s) { return (s.sessionId || '').includes('subagent'); });
@@ -11137,6 +11434,10 @@ function cronToHuman(expr) {
   return '';
 }
 
+// A newer load (the line-count select, the reload button) supersedes the one
+// in flight; a reply that arrives after it is dropped.
+var _logsLoadSeq = 0;
+
 async function loadLogs() {
   if (window.CLOUD_MODE) {
     var el = document.getElementById('logs-full');
@@ -11144,8 +11445,10 @@ async function loadLogs() {
     return;
   }
   var lines = document.getElementById('log-lines').value;
+  var seq = ++_logsLoadSeq;
   var data = await fetch('/api/logs?lines=' + lines).then(r => r.json());
-  renderLogs('logs-full', data.lines);
+  if (seq !== _logsLoadSeq) return;
+  renderLogs('logs-full', data.lines, seq);
 }
 
 async function loadMemoryAnalytics() {
@@ -12242,28 +12545,28 @@ async function _loadMemoryAllFiles() {
     if (parts.length <= 1) { roots.push(f); }
     else { var dir = parts.slice(0, -1).join('/'); if (!folders[dir]) folders[dir] = []; folders[dir].push(f); }
   });
-  var html = '';
+  var parts = [];
   roots.forEach(function(f) {
     var icon = f.path.endsWith('.md') ? '📝' : '📄';
     var sz = f.size > 1024 ? (f.size/1024).toFixed(1) + 'K' : f.size + 'B';
-    html += '<div class="mem-file" data-path="' + escHtml(f.path) + '" style="display:flex;align-items:center;gap:6px;padding:5px 14px;cursor:pointer;font-size:12px;color:var(--text-secondary)">' +
+    parts.push('<div class="mem-file" data-path="' + escHtml(f.path) + '" style="display:flex;align-items:center;gap:6px;padding:5px 14px;cursor:pointer;font-size:12px;color:var(--text-secondary)">' +
       '<span style="flex-shrink:0">' + icon + '</span>' +
       '<span style="flex:1;overflow:hidden;text-overflow:ellipsis;white-space:nowrap">' + escHtml(f.path) + '</span>' +
-      '<span style="color:var(--text-muted);font-size:10px;flex-shrink:0">' + sz + '</span></div>';
+      '<span style="color:var(--text-muted);font-size:10px;flex-shrink:0">' + sz + '</span></div>');
   });
   Object.keys(folders).sort().forEach(function(dir) {
-    html += '<div style="padding:8px 14px 4px;font-size:10px;font-weight:700;text-transform:uppercase;letter-spacing:0.5px;color:var(--text-muted);display:flex;align-items:center;gap:4px"><span>📁</span>' + escHtml(dir) + '</div>';
+    parts.push('<div style="padding:8px 14px 4px;font-size:10px;font-weight:700;text-transform:uppercase;letter-spacing:0.5px;color:var(--text-muted);display:flex;align-items:center;gap:4px"><span>📁</span>' + escHtml(dir) + '</div>');
     folders[dir].forEach(function(f) {
       var icon = f.path.endsWith('.md') ? '📝' : '📄';
       var short = f.path.split('/').pop();
       var sz = f.size > 1024 ? (f.size/1024).toFixed(1) + 'K' : f.size + 'B';
-      html += '<div class="mem-file" data-path="' + escHtml(f.path) + '" style="display:flex;align-items:center;gap:6px;padding:5px 14px 5px 28px;cursor:pointer;font-size:12px;color:var(--text-secondary)">' +
+      parts.push('<div class="mem-file" data-path="' + escHtml(f.path) + '" style="display:flex;align-items:center;gap:6px;padding:5px 14px 5px 28px;cursor:pointer;font-size:12px;color:var(--text-secondary)">' +
         '<span style="flex-shrink:0">' + icon + '</span>' +
         '<span style="flex:1;overflow:hidden;text-overflow:ellipsis;white-space:nowrap">' + escHtml(short) + '</span>' +
-        '<span style="color:var(--text-muted);font-size:10px;flex-shrink:0">' + sz + '</span></div>';
+        '<span style="color:var(--text-muted);font-size:10px;flex-shrink:0">' + sz + '</span></div>');
     });
   });
-  sidebar.innerHTML = html || '<div style="padding:16px;color:var(--text-muted)">No files</div>';
+  sidebar.innerHTML = parts.join('') || '<div style="padding:16px;color:var(--text-muted)">No files</div>';
   // Click to load file content in viewer
   sidebar.querySelectorAll('.mem-file').forEach(function(row) {
     row.onclick = async function() {
@@ -12298,17 +12601,21 @@ async function _loadMemoryAllFiles() {
 // been removed. If MC ever returns, restore from git history.
 
 // ===== Health Checks =====
+function _applyHealthChecks(checks) {
+  checks.forEach(function(c) {
+    var dotEl = cachedEl('health-dot-' + c.id);
+    var detailEl = cachedEl('health-detail-' + c.id);
+    var itemEl = cachedEl('health-' + c.id);
+    if (dotEl) setClass(dotEl, 'health-dot ' + c.color);
+    if (detailEl) setText(detailEl, c.detail);
+    if (itemEl) setClass(itemEl, 'health-item ' + c.status);
+  });
+}
+
 async function loadHealth() {
   try {
     var data = await fetch('/api/health').then(r => r.json());
-    data.checks.forEach(function(c) {
-      var dotEl = document.getElementById('health-dot-' + c.id);
-      var detailEl = document.getElementById('health-detail-' + c.id);
-      var itemEl = document.getElementById('health-' + c.id);
-      if (dotEl) { dotEl.className = 'health-dot ' + c.color; }
-      if (detailEl) { detailEl.textContent = c.detail; }
-      if (itemEl) { itemEl.className = 'health-item ' + c.status; }
-    });
+    _applyHealthChecks(data.checks);
   } catch(e) {}
 }
 
@@ -12320,15 +12627,7 @@ function startHealthStream() {
   healthStream = new EventSource('/api/health-stream' + (localStorage.getItem('clawmetry-token') ? '?token=' + encodeURIComponent(localStorage.getItem('clawmetry-token')) : ''));
   healthStream.onmessage = function(e) {
     try {
-      var data = JSON.parse(e.data);
-      data.checks.forEach(function(c) {
-        var dotEl = document.getElementById('health-dot-' + c.id);
-        var detailEl = document.getElementById('health-detail-' + c.id);
-        var itemEl = document.getElementById('health-' + c.id);
-        if (dotEl) { dotEl.className = 'health-dot ' + c.color; }
-        if (detailEl) { detailEl.textContent = c.detail; }
-        if (itemEl) { itemEl.className = 'health-item ' + c.status; }
-      });
+      _applyHealthChecks(JSON.parse(e.data).checks);
     } catch(ex) {}
   };
   healthStream.onerror = function() { setTimeout(startHealthStream, 30000); };
@@ -13068,6 +13367,31 @@ async function loadSandboxStatus() {
   }
 }
 
+// ===== Shared heatmap tooltip =====
+// One #heatmap-tooltip node serves every heatmap: a delegated listener per grid
+// asks tipAt(e) for the text under the pointer (by default the hovered cell's
+// data-tip), so cells carry no pseudo-element and the native title tooltip
+// never races it. Grids are re-rendered in place but the grid element itself
+// persists, so binding once is enough.
+function bindHeatmapTooltip(grid, tipAt) {
+  var tip = document.getElementById('heatmap-tooltip');
+  if (!grid || !tip || grid.dataset.tipBound) return;
+  grid.dataset.tipBound = '1';
+  tipAt = tipAt || function(e) {
+    var cell = e.target.closest('.heatmap-cell');
+    return cell ? cell.dataset.tip : '';
+  };
+  grid.addEventListener('mousemove', function(e) {
+    var text = tipAt(e);
+    if (!text) { tip.style.display = 'none'; return; }
+    if (tip.textContent !== text) tip.textContent = text;
+    tip.style.display = 'block';
+    tip.style.left = (e.clientX + 12) + 'px';
+    tip.style.top = (e.clientY - 28) + 'px';
+  });
+  grid.addEventListener('mouseleave', function() { tip.style.display = 'none'; });
+}
+
 // ===== 30-day Session Activity Heatmap (#875) =====
 async function loadActivityHeatmap() {
   var card = document.getElementById('activity-heatmap-card');
@@ -13078,24 +13402,150 @@ async function loadActivityHeatmap() {
   var days = (data && data.days) || [];
   if (!days.length) return;
   var maxSessions = Math.max.apply(null, days.map(function(d){ return d.sessions || 0; }));
-  var shades = ['#12122a','#1a3a2a','#2a6a3a','#4a9a2a','#6adb3a'];
-  var html = '';
-  days.forEach(function(day) {
+  // Cells are built once and then only re-classed (.h0–.h4) and re-tipped on
+  // later loads; the strip is rebuilt only if the number of days changes.
+  if (grid.children.length !== days.length || !grid.firstElementChild.classList.contains('heatmap-cell')) {
+    var frag = document.createDocumentFragment();
+    days.forEach(function() {
+      var div = document.createElement('div');
+      div.className = 'heatmap-cell h0';
+      frag.appendChild(div);
+    });
+    grid.replaceChildren(frag);
+  }
+  days.forEach(function(day, i) {
     var s = day.sessions || 0;
     var idx = (maxSessions > 0 && s > 0) ? Math.min(4, Math.ceil(s / maxSessions * 4)) : 0;
     var tooltip = day.label + ': ' + s + ' session' + (s !== 1 ? 's' : '')
       + ', ' + (day.tokens || 0).toLocaleString() + ' tokens'
       + (day.cost > 0 ? ', $' + day.cost.toFixed(4) : '');
-    html += '<div class="heatmap-cell" style="background:' + shades[idx] + ';" title="' + tooltip + '"></div>';
+    var cell = grid.children[i];
+    setClass(cell, 'heatmap-cell h' + idx);
+    if (cell.dataset.tip !== tooltip) cell.dataset.tip = tooltip;
   });
-  grid.innerHTML = html;
+  bindHeatmapTooltip(grid);
   var legend = document.getElementById('activity-heatmap-legend');
-  if (legend) legend.innerHTML = 'Less <div class="heatmap-legend-cell" style="background:#12122a"></div><div class="heatmap-legend-cell" style="background:#1a3a2a"></div><div class="heatmap-legend-cell" style="background:#2a6a3a"></div><div class="heatmap-legend-cell" style="background:#4a9a2a"></div><div class="heatmap-legend-cell" style="background:#6adb3a"></div> More';
+  if (legend && !legend.firstElementChild) legend.innerHTML = 'Less ' + HEATMAP_SHADES.map(function(c) { return '<div class="heatmap-legend-cell" style="background:' + c + '"></div>'; }).join('') + ' More';
   card.style.display = '';
 }
 
 // ===== Activity Heatmap =====
+// Drawn on one <canvas> rather than days×24 cell divs: a 30-day view was 720
+// styled nodes to lay out and paint on every toggle. Cells are batched into
+// one Path2D per shade so a redraw is five fills plus the labels; hover maps
+// the pointer back to (day, hour) arithmetically for the shared tooltip. The
+// grid arrives packed (/api/heatmap?format=q8): one base64 string of uint8
+// intensities, 255 = the window's max, instead of days×24 JSON numbers.
 var _heatmapDays = 7;
+var HEATMAP_SHADES = ['#12122a', '#1a3a2a', '#2a6a3a', '#4a9a2a', '#6adb3a'];
+var HEATMAP_LAYOUT = { labelW: 60, headH: 18, cellH: 16, gap: 2 };
+
+function heatmapShadeIndex(q) {
+  if (q === 0) return 0;
+  if (q < 64) return 1;
+  if (q < 128) return 2;
+  if (q < 192) return 3;
+  return 4;
+}
+
+// Backends that predate ?format=q8 (e.g. cloud) ignore it and send
+// {days:[{label, hours}]}; quantize those here so the renderer has one shape.
+function decodeHeatmapQ8(data) {
+  var q, i;
+  if (data.q === undefined && data.days) {
+    var scale = data.max ? 255 / data.max : 0;
+    q = new Uint8Array(data.days.length * 24);
+    data.days.forEach(function(day, d) {
+      for (i = 0; i < 24; i++) {
+        var v = day.hours[i] || 0;
+        q[d * 24 + i] = v ? Math.max(1, Math.round(v * scale)) : 0;
+      }
+    });
+    return { labels: data.days.map(function(day) { return day.label; }), q: q, max: data.max || 0 };
+  }
+  var raw = atob(data.q || '');
+  q = new Uint8Array(raw.length);
+  for (i = 0; i < raw.length; i++) q[i] = raw.charCodeAt(i);
+  return { labels: data.labels || [], q: q, max: data.max || 0 };
+}
+
+function drawHeatmapCanvas(grid, data) {
+  var L = HEATMAP_LAYOUT;
+  var canvas = grid.querySelector('canvas.heatmap-canvas');
+  if (!canvas) {
+    grid.innerHTML = '<canvas class="heatmap-canvas"></canvas>';
+    canvas = grid.firstChild;
+  }
+  var labels = data.labels, q = data.q;
+  var dpr = window.devicePixelRatio || 1;
+  var W = grid.clientWidth || 650;
+  var H = L.headH + labels.length * (L.cellH + L.gap);
+  var cellW = (W - L.labelW - 24 * L.gap) / 24;
+  canvas.width = W * dpr; canvas.height = H * dpr;
+  canvas.style.width = W + 'px'; canvas.style.height = H + 'px';
+  var ctx = canvas.getContext('2d');
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.clearRect(0, 0, W, H);
+
+  var paths = HEATMAP_SHADES.map(function() { return new Path2D(); });
+  for (var i = 0; i < q.length; i++) {
+    var p = paths[heatmapShadeIndex(q[i])];
+    var x = L.labelW + L.gap + (i % 24) * (cellW + L.gap);
+    var y = L.headH + Math.floor(i / 24) * (L.cellH + L.gap);
+    if (p.roundRect) p.roundRect(x, y, cellW, L.cellH, 3);
+    else p.rect(x, y, cellW, L.cellH);
+  }
+  paths.forEach(function(p, i) { ctx.fillStyle = HEATMAP_SHADES[i]; ctx.fill(p); });
+
+  var font = getComputedStyle(grid).fontFamily;
+  ctx.textBaseline = 'middle';
+  ctx.font = '10px ' + font; ctx.fillStyle = '#555'; ctx.textAlign = 'center';
+  for (var h = 0; h < 24; h++) {
+    ctx.fillText((h < 10 ? '0' : '') + h, L.labelW + L.gap + h * (cellW + L.gap) + cellW / 2, L.headH / 2 - 1);
+  }
+  ctx.font = '11px ' + font; ctx.fillStyle = '#666'; ctx.textAlign = 'right';
+  labels.forEach(function(label, d) {
+    ctx.fillText(label, L.labelW - 8, L.headH + d * (L.cellH + L.gap) + L.cellH / 2);
+  });
+  canvas._heatmap = { data: data, cellW: cellW, W: W, dpr: dpr };
+}
+
+// The canvas is drawn at a fixed pixel width, so unlike the CSS grid it
+// replaced it does not reflow. Redraw from the kept data when the grid's
+// width or the device pixel ratio (browser zoom) changes, at most once a
+// frame. Height changes from the redraw itself are ignored.
+function watchHeatmapResize(grid) {
+  if (!grid || grid._heatmapRO || typeof ResizeObserver === 'undefined') return;
+  var raf = 0;
+  grid._heatmapRO = new ResizeObserver(function() {
+    if (raf) return;
+    raf = requestAnimationFrame(function() {
+      raf = 0;
+      var canvas = grid.querySelector('canvas.heatmap-canvas');
+      var hm = canvas && canvas._heatmap;
+      if (!hm) return;
+      if (hm.W === (grid.clientWidth || 650) && hm.dpr === (window.devicePixelRatio || 1)) return;
+      drawHeatmapCanvas(grid, hm.data);
+    });
+  });
+  grid._heatmapRO.observe(grid);
+}
+
+function heatmapTipAt(e) {
+  var canvas = e.target;
+  var hm = canvas && canvas._heatmap;
+  if (!hm) return '';
+  var L = HEATMAP_LAYOUT;
+  var x = e.offsetX - L.labelW - L.gap, y = e.offsetY - L.headH;
+  if (x < 0 || y < 0) return '';
+  var h = Math.floor(x / (hm.cellW + L.gap)), d = Math.floor(y / (L.cellH + L.gap));
+  var label = hm.data.labels[d];
+  if (label === undefined || h > 23) return '';
+  // Exact while max <= 255 (quantization step < 1); approximate beyond.
+  var n = Math.round(hm.data.q[d * 24 + h] * hm.data.max / 255);
+  return label + ' ' + (h < 10 ? '0' : '') + h + ':00 — ' + (hm.data.max > 255 ? '~' : '') + n + ' events';
+}
+
 async function loadHeatmap(days) {
   if (days) _heatmapDays = days;
   // Update toggle buttons
@@ -13104,28 +13554,14 @@ async function loadHeatmap(days) {
   if (btn7) btn7.className = _heatmapDays === 7 ? 'time-btn active' : 'time-btn';
   if (btn30) btn30.className = _heatmapDays === 30 ? 'time-btn active' : 'time-btn';
   try {
-    var data = await fetch('/api/heatmap?days=' + _heatmapDays).then(r => r.json());
+    var data = await fetch('/api/heatmap?format=q8&days=' + _heatmapDays).then(r => r.json());
     var grid = document.getElementById('heatmap-grid');
     if (!grid) return;
-    var maxVal = Math.max(1, data.max);
-    var html = '<div class="heatmap-label"></div>';
-    for (var h = 0; h < 24; h++) { html += '<div class="heatmap-hour-label">' + (h < 10 ? '0' : '') + h + '</div>'; }
-    data.days.forEach(function(day) {
-      html += '<div class="heatmap-label">' + day.label + '</div>';
-      day.hours.forEach(function(val, hi) {
-        var intensity = val / maxVal;
-        var color;
-        if (val === 0) color = '#12122a';
-        else if (intensity < 0.25) color = '#1a3a2a';
-        else if (intensity < 0.5) color = '#2a6a3a';
-        else if (intensity < 0.75) color = '#4a9a2a';
-        else color = '#6adb3a';
-        html += '<div class="heatmap-cell" style="background:' + color + ';" title="' + day.label + ' ' + (hi < 10 ? '0' : '') + hi + ':00 — ' + val + ' events"></div>';
-      });
-    });
-    grid.innerHTML = html;
+    drawHeatmapCanvas(grid, decodeHeatmapQ8(data));
+    bindHeatmapTooltip(grid, heatmapTipAt);
+    watchHeatmapResize(grid);
     var legend = document.getElementById('heatmap-legend');
-    if (legend) legend.innerHTML = 'Less <div class="heatmap-legend-cell" style="background:#12122a"></div><div class="heatmap-legend-cell" style="background:#1a3a2a"></div><div class="heatmap-legend-cell" style="background:#2a6a3a"></div><div class="heatmap-legend-cell" style="background:#4a9a2a"></div><div class="heatmap-legend-cell" style="background:#6adb3a"></div> More';
+    if (legend) legend.innerHTML = 'Less ' + HEATMAP_SHADES.map(function(c) { return '<div class="heatmap-legend-cell" style="background:' + c + '"></div>'; }).join('') + ' More';
   } catch(e) {
     var grid2 = document.getElementById('heatmap-grid');
     if (grid2) grid2.innerHTML = '<span style="color:#555">' + t("app.no_activity_data", null, "No activity data") + '</span>';
@@ -13350,17 +13786,15 @@ async function loadUsage() {
       if (_uChart) _uChart.innerHTML = '<div style="background:#fff7ed;border:1px solid #f59e0b;color:#92400e;padding:12px 16px;border-radius:6px;"><strong>' + t("app.ingest_temporarily_offline", null, "Ingest temporarily offline.") + '</strong> Token usage data unavailable; the local_store writer is not responding.</div>';
       return;
     }
-    function fmtTokens(n) { return n >= 1000000 ? (n/1000000).toFixed(1) + 'M' : n >= 1000 ? (n/1000).toFixed(0) + 'K' : String(n); }
-    function fmtCost(c) { return c >= 0.01 ? '$' + c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
     // QW3: dollars are the headline (card-value), tokens the sub-line; the
     // estimation marker is the word "about", never the ≈ glyph.
     function setUsageCard(valId, cost, tokens) {
-      var v = document.getElementById(valId);
-      var s = document.getElementById(valId + '-cost');
+      var v = cachedEl(valId);
+      var s = cachedEl(valId + '-cost');
       var costStr = fmtCost(cost || 0);
       var tokStr = fmtTokens(tokens || 0);
-      if (v) v.textContent = t('usage.cost_about', { cost: costStr }, 'about ' + costStr);
-      if (s) s.textContent = t('usage.tokens_sub', { tokens: tokStr }, tokStr + ' tokens');
+      if (v) setText(v, t('usage.cost_about', { cost: costStr }, 'about ' + costStr));
+      if (s) setText(s, t('usage.tokens_sub', { tokens: tokStr }, tokStr + ' tokens'));
     }
     setUsageCard('usage-today', data.todayCost, data.today);
     setUsageCard('usage-week', data.weekCost, data.week);
@@ -13390,15 +13824,7 @@ async function loadUsage() {
     var _uHasChartData = _uDays.some(function(d) { return d && d.tokens > 0; });
     _setUsageChartSectionVisible(_uHasChartData);
     if (_uHasChartData) {
-      var maxTokens = Math.max.apply(null, _uDays.map(function(d){return d.tokens;})) || 1;
-      var chartHtml = '';
-      _uDays.forEach(function(d) {
-        var pct = Math.max(1, (d.tokens / maxTokens) * 100);
-        var label = d.date.substring(5);
-        var val = d.tokens >= 1000 ? (d.tokens/1000).toFixed(0) + 'K' : d.tokens;
-        chartHtml += '<div class="usage-bar-wrap"><div class="usage-bar" style="height:' + pct + '%"><div class="usage-bar-value">' + (d.tokens > 0 ? val : '') + '</div></div><div class="usage-bar-label">' + label + '</div></div>';
-      });
-      document.getElementById('usage-chart').innerHTML = chartHtml;
+      _renderUsageBars(document.getElementById('usage-chart'), _uDays);
     }
     // Issue #1448 surface 2 — OSS / Cloud-Free callers get clamped to 24h
     // of history; render the upgrade CTA above the chart so users see why
@@ -13434,7 +13860,7 @@ async function loadUsage() {
     tableHtml += '<tr><td>This Week</td><td>' + fmtTokens(data.week) + '</td><td>' + fmtCost(data.weekCost) + '</td></tr>';
     tableHtml += '<tr><td>This Month</td><td>' + fmtTokens(data.month) + '</td><td>' + fmtCost(data.monthCost) + '</td></tr>';
     tableHtml += '</tbody>';
-    document.getElementById('usage-cost-table').innerHTML = tableHtml;
+    setHtml(document.getElementById('usage-cost-table'), tableHtml);
     // Issue #68 — per-session cost breakdown table.
     renderTopSessionsByCost(data.sessions || []);
     // OTLP-specific sections
@@ -13456,7 +13882,7 @@ async function loadUsage() {
           mHtml += '<tr><td><span class="badge model">' + escHtml(m.model) + '</span></td><td>' + fmtTokens(m.tokens) + '</td><td>' + escHtml(hint) + '</td></tr>';
         });
         mHtml += '</tbody>';
-        document.getElementById('usage-model-table').innerHTML = mHtml;
+        setHtml(document.getElementById('usage-model-table'), mHtml);
       }
     } else {
       otelExtra.style.display = 'none';
@@ -13551,6 +13977,33 @@ function _refreshNemoCapBanner(anchorId) {
   } catch (_e) { /* never block render */ }
 }
 
+// Token Usage bars. The bar nodes are built once per day count and reused:
+// a refresh only moves each bar's --pct (height is calc()'d in CSS) and
+// rewrites labels that changed, instead of re-parsing the chart's markup.
+function _renderUsageBars(chart, days) {
+  if (!chart) return;
+  var maxTokens = Math.max.apply(null, days.map(function(d){return d.tokens;})) || 1;
+  if (chart.children.length !== days.length || !chart.querySelector('.usage-bar')) {
+    var frag = document.createDocumentFragment();
+    days.forEach(function() {
+      var wrap = document.createElement('div');
+      wrap.className = 'usage-bar-wrap';
+      wrap.innerHTML = '<div class="usage-bar"><div class="usage-bar-value"></div></div><div class="usage-bar-label"></div>';
+      frag.appendChild(wrap);
+    });
+    chart.replaceChildren(frag);
+  }
+  days.forEach(function(d, i) {
+    var wrap = chart.children[i];
+    var bar = wrap.firstChild;
+    var pct = String(Math.max(1, (d.tokens / maxTokens) * 100));
+    if (bar.style.getPropertyValue('--pct') !== pct) bar.style.setProperty('--pct', pct);
+    var val = d.tokens >= 1000 ? (d.tokens/1000).toFixed(0) + 'K' : d.tokens;
+    setText(bar.firstChild, d.tokens > 0 ? val : '');
+    setText(wrap.lastChild, d.date.substring(5));
+  });
+}
+
 // Issue #1448 surface 2 — render the OSS / Cloud-Free retention upsell
 // row above the Token Usage chart when /api/usage reports capped_at_24h.
 // Sibling of _renderFlowRunsCap (PR #1445).
@@ -13583,8 +14036,6 @@ function _renderUsageCapCTA(capped) {
 function renderTopSessionsByCost(rows) {
   var el = document.getElementById('usage-top-sessions-table');
   if (!el) return;
-  function fmtCost(c) { return c >= 0.01 ? '$' + c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
-  function fmtTokens(n) { return n >= 1000000 ? (n/1000000).toFixed(1) + 'M' : n >= 1000 ? (n/1000).toFixed(0) + 'K' : String(n); }
   function fmtDate(iso) {
     if (!iso) return '—';
     var d = String(iso).slice(0, 10);
@@ -13681,7 +14132,6 @@ async function loadCompressionPotential() {
     var byType = d.by_type || {};
 
     function fmtToks(n) { return n >= 1e6 ? (n/1e6).toFixed(1)+'M' : n >= 1e3 ? (n/1e3).toFixed(0)+'K' : String(n||0); }
-    function fmtCost(c) { return c >= 0.01 ? '$'+c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
 
     var html = '<div style="display:flex;gap:24px;flex-wrap:wrap;align-items:flex-start;">'
       + '<div style="min-width:140px;text-align:center;">'
@@ -13729,7 +14179,6 @@ async function loadCacheAnalytics() {
     var cwToks = tot.cache_write_tokens || 0;
 
     function fmtToks(n) { return n >= 1e6 ? (n/1e6).toFixed(1)+'M' : n >= 1e3 ? (n/1e3).toFixed(0)+'K' : String(n||0); }
-    function fmtCost(c) { return c >= 0.01 ? '$'+c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
 
     var html = '<div style="display:flex;flex-wrap:wrap;gap:16px;align-items:flex-start;">'
       + '<div style="min-width:120px;text-align:center;">'
@@ -14369,7 +14818,6 @@ async function loadSkillAttribution() {
     var top5 = data.top5_week || [];
     var allSkills = data.skills || [];
     var totalCost = data.total_cost || 0;
-    function fmtCost(c) { return c >= 0.01 ? '$' + c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
     if (top5.length === 0) {
       el.innerHTML = '<span style="color:var(--text-muted);font-size:13px;">' + t("app.no_skill_invocations_detected_yet_skills_are_detec", null, "No skill invocations detected yet. Skills are detected when SKILL.md files are read during sessions.") + '</span>';
       return;
@@ -14402,7 +14850,6 @@ function loadAllSkills() {
   if (!el) return;
   fetch('/api/skill-attribution').then(function(r) { return r.json(); }).then(function(data) {
     var allSkills = data.skills || [];
-    function fmtCost(c) { return c >= 0.01 ? '$' + c.toFixed(2) : c > 0 ? '<$0.01' : '$0.00'; }
     var html = '<table class="usage-table" style="width:100%;">';
     html += '<thead><tr><th>Skill</th><th style="text-align:right;">Invocations</th><th style="text-align:right;">Avg Cost</th><th style="text-align:right;">Total Cost</th><th></th></tr></thead><tbody>';
     allSkills.forEach(function(s) {
@@ -14535,6 +14982,10 @@ function showTranscriptList() {
 window._replayEvents = [];
 window._replayIndex = 0;
 window._replayFilter = 'all';
+// How many events before the current one are in the DOM; see
+// _replayRenderCurrent. Grows by REPLAY_WINDOW per "Show earlier".
+var REPLAY_WINDOW = 200;
+window._replayShown = REPLAY_WINDOW;
 window._replayPlaying = false;
 window._replayInterval = null;
 
@@ -14683,6 +15134,9 @@ function toggleToolDive(id) {
   if (caret) caret.textContent = open ? '▸' : '▾';
 }
 
+// Enough characters to fill the 200px clamp of a collapsed turn.
+var MSG_PREVIEW_CHARS = 1200;
+
 function _renderReplayEvent(ev, highlighted) {
   var role = ev.role;
   // Handle compaction events specially
@@ -14733,14 +15187,15 @@ function _renderReplayEvent(ev, highlighted) {
   var cls = role === 'user' ? 'user' : role === 'assistant' ? 'assistant' : role === 'system' ? 'system' : 'tool';
   var content = ev.content;
   var needsTruncate = content.length > 800;
-  var displayContent = needsTruncate ? content.substring(0, 800) : content;
   var highlightStyle = highlighted ? 'box-shadow:0 0 0 2px #6366f1;' : '';
   var html = '<div class="chat-msg ' + cls + '" id="replay-msg-' + ev.originalIndex + '" style="' + highlightStyle + '">';
   html += '<div class="chat-role">' + escHtml(role) + '</div>';
   if (needsTruncate) {
-    html += '<div class="chat-content-truncated" id="msg-' + ev.originalIndex + '-short" style="white-space:pre-wrap;word-break:break-word;">' + escHtml(displayContent) + '</div>';
-    html += '<div id="msg-' + ev.originalIndex + '-full" style="display:none;white-space:pre-wrap;word-break:break-word;">' + escHtml(content) + '</div>';
-    html += '<div class="chat-expand" onclick="toggleMsg(' + ev.originalIndex + ')" style="color:#6366f1;cursor:pointer;font-size:11px;margin-top:4px;">Show more (' + content.length + ' chars)</div>';
+    // Only the head that the CSS clamp (.chat-content-truncated) can show is
+    // rendered; toggleMsg mounts the full text from _replayEvents the first
+    // time the turn is expanded, so a collapsed 50KB tool dump costs ~1KB of DOM.
+    html += '<div class="chat-content-truncated" id="msg-' + ev.originalIndex + '-body" style="white-space:pre-wrap;word-break:break-word;">' + escHtml(content.slice(0, MSG_PREVIEW_CHARS)) + '</div>';
+    html += '<div class="chat-expand" onclick="toggleMsg(' + ev.originalIndex + ', this)" style="color:#6366f1;cursor:pointer;font-size:11px;margin-top:4px;">Show more (' + content.length + ' chars)</div>';
   } else {
     html += '<div style="white-space:pre-wrap;word-break:break-word;">' + escHtml(content) + '</div>';
   }
@@ -14821,12 +15276,20 @@ function _replayRenderCurrent() {
   if (idx >= filtered.length) idx = filtered.length - 1;
   window._replayIndex = idx;
 
-  // Render all filtered events up to current index (show history)
-  var html = '';
-  for (var i = 0; i <= idx; i++) {
-    html += _renderReplayEvent(filtered[i], i === idx);
+  // Render the history up to the current index, but only the last
+  // _replayShown events of it: a long transcript would otherwise rebuild
+  // thousands of bubbles on every step. Earlier ones load on demand.
+  var start = Math.max(0, idx + 1 - window._replayShown);
+  var parts = [];
+  if (start > 0) {
+    parts.push('<div class="replay-earlier" onclick="replayShowEarlier()">'
+      + t("app.show_earlier_events", { n: Math.min(start, REPLAY_WINDOW) }, 'Show ' + Math.min(start, REPLAY_WINDOW) + ' earlier events')
+      + '</div>');
   }
-  document.getElementById('transcript-messages').innerHTML = html;
+  for (var i = start; i <= idx; i++) {
+    parts.push(_renderReplayEvent(filtered[i], i === idx));
+  }
+  document.getElementById('transcript-messages').innerHTML = parts.join('');
   document.getElementById('replay-pos').textContent = (idx + 1) + '/' + filtered.length;
   var scrubber = document.getElementById('replay-scrubber');
   scrubber.max = filtered.length - 1;
@@ -14838,6 +15301,11 @@ function _replayRenderCurrent() {
   _updateReplayStatePanel(filtered[idx] ? filtered[idx].timestamp : null);
 }
 
+function replayShowEarlier() {
+  window._replayShown += REPLAY_WINDOW;
+  _replayRenderCurrent();
+}
+
 function replayNext() {
   var filtered = _replayFilteredEvents();
   if (window._replayIndex < filtered.length - 1) {
@@ -14861,6 +15329,7 @@ function replayJumpTo(index) {
 function replayFilter(type) {
   window._replayFilter = type;
   window._replayIndex = 0;
+  window._replayShown = REPLAY_WINDOW;
   // Update pill styles
   document.querySelectorAll('.replay-filter').forEach(function(btn) {
     var isActive = btn.getAttribute('data-type') === type;
@@ -15126,18 +15595,16 @@ async function _loadAuthorityPanel(sessionId) {
   } catch(e) { /* non-critical — panel stays hidden on error */ }
 }
 
-function toggleMsg(idx) {
-  var short = document.getElementById('msg-' + idx + '-short');
-  var full = document.getElementById('msg-' + idx + '-full');
-  if (short.style.display === 'none') {
-    short.style.display = '';
-    full.style.display = 'none';
-    short.nextElementSibling.nextElementSibling.textContent = t("app.show_more", null, "Show more");
-  } else {
-    short.style.display = 'none';
-    full.style.display = '';
-    event.target.textContent = t("app.show_less", null, "Show less");
+function toggleMsg(idx, btn) {
+  var body = document.getElementById('msg-' + idx + '-body');
+  if (!body) return;
+  var ev = window._replayEvents[idx];
+  if (!body.dataset.full && ev && ev.originalIndex === idx) {
+    body.textContent = ev.content;
+    body.dataset.full = '1';
   }
+  var collapsed = body.classList.toggle('chat-content-truncated');
+  if (btn) btn.textContent = collapsed ? t("app.show_more", null, "Show more") : t("app.show_less", null, "Show less");
 }
 
 
@@ -15367,103 +15834,163 @@ setTimeout(function(){ try { cmSyncInit(); } catch (e) {} }, 800);
 // ── Sub-Agent Tree ────────────────────────────────────────────────────────
 var _subagentsTimer = null;
 var _subagentsExpanded = {};
-
-async function loadSubagents() {
+// ETag of the payload currently rendered. /api/subagents answers the 5s poll
+// with a 304 when nothing changed (the browser revalidates and hands back the
+// cached body), so an unchanged tag means the tree is already up to date.
+var _subagentsEtag = null;
+// Last payload rendered, so expanding or collapsing a branch re-renders from
+// it instead of refetching /api/subagents.
+var _subagentsData = null;
+
+async function loadSubagents(force) {
   var el = document.getElementById('subagents-list');
   if (!el) return;
   try {
-    var data = await fetch('/api/subagents').then(function(r) { return r.json(); });
-    var agents = data.subagents || [];
-    var counts = data.counts || {};
-    if (agents.length === 0) {
-      el.innerHTML = '<div style="color:var(--text-muted);font-size:13px;padding:24px;text-align:center;">' + t("app.no_sub_agents_found_sub_agents_appear_here_when_sp", null, "No sub-agents found. Sub-agents appear here when spawned by the main session.") + '</div>';
-      return;
+    var resp = await fetch('/api/subagents');
+    var etag = resp.headers.get('ETag');
+    if (!force && etag && etag === _subagentsEtag && el.childElementCount) return;
+    var data = await resp.json();
+    _subagentsEtag = etag;
+    _subagentsData = data;
+    _saRenderTree(el, data);
+  } catch(e) {
+    _subagentsEtag = null;
+    _subagentsData = null;
+    el.innerHTML = '<div style="color:#e74c3c;font-size:13px;padding:16px;">' + t("app.failed_to_load_sub_agents", null, "Failed to load sub-agents") + ': ' + escHtml(String(e)) + '</div>';
+  }
+}
+
+function _saRenderTree(el, data) {
+  var agents = data.subagents || [];
+  var counts = data.counts || {};
+  if (agents.length === 0) {
+    el.innerHTML = '<div style="color:var(--text-muted);font-size:13px;padding:24px;text-align:center;">' + t("app.no_sub_agents_found_sub_agents_appear_here_when_sp", null, "No sub-agents found. Sub-agents appear here when spawned by the main session.") + '</div>';
+    return;
+  }
+  var byId = {};
+  agents.forEach(function(a) { byId[a.sessionId] = a; });
+  var roots = [];
+  var childrenOf = {};
+  agents.forEach(function(a) {
+    var p = a.parent;
+    if (p && byId[p]) {
+      if (!childrenOf[p]) childrenOf[p] = [];
+      childrenOf[p].push(a);
+    } else {
+      roots.push(a);
     }
-    var byId = {};
-    agents.forEach(function(a) { byId[a.sessionId] = a; });
-    var roots = [];
-    var childrenOf = {};
-    agents.forEach(function(a) {
-      var p = a.parent;
-      if (p && byId[p]) {
-        if (!childrenOf[p]) childrenOf[p] = [];
-        childrenOf[p].push(a);
+  });
+  function renderAgent(a, depth) {
+    var sid = a.sessionId;
+    var hasChildren = !!(childrenOf[sid] && childrenOf[sid].length > 0);
+    var isExpanded = _subagentsExpanded[sid] !== false;
+    var indent = depth > 0 ? 'padding-left:' + (depth * 22 + 12) + 'px;' : 'padding-left:12px;';
+    var toggleBtn = hasChildren
+      ? '<button class="sa-toggle" style="background:none;border:none;cursor:pointer;font-size:11px;color:var(--text-muted);padding:0 4px 0 0;line-height:1;min-width:16px;">' + (isExpanded ? '▼' : '▶') + '</button>'
+      : '<span style="display:inline-block;min-width:16px;"></span>';
+    var tokens = a.totalTokens >= 1000 ? (a.totalTokens / 1000).toFixed(1) + 'K' : a.totalTokens;
+    var depthBadge = a.depth > 0 ? '<span style="font-size:10px;background:var(--bg-secondary);border:1px solid var(--border-primary);border-radius:4px;padding:1px 5px;color:var(--text-muted);margin-left:6px;">d' + a.depth + '</span>' : '';
+    // Click row → subagent detail modal (same call used by Active Tasks cards).
+    // Clicks are handled by one listener on the tree (_saTreeClick), which
+    // reads these data attributes; hover is the .subagent-tree-row:hover rule.
+    var dataAttrs = ' data-sid="' + escapeHtmlSafe(sid || '') + '" data-name="' + escapeHtmlSafe(a.displayName || '') + '" data-key="' + escapeHtmlSafe(a.key || sid || '') + '"';
+    var html = '<div class="subagent-tree-row"' + dataAttrs + ' style="display:flex;align-items:center;gap:6px;' + indent + 'padding-top:8px;padding-bottom:8px;padding-right:12px;border-bottom:1px solid var(--border-secondary);cursor:pointer;transition:background 0.1s;">';
+    html += toggleBtn;
+    // Dot colour comes from the row's data-status (set in _saRenderRows),
+    // so an active/idle flip only touches that attribute.
+    html += '<span class="sa-dot"></span>';
+    var nameHtml = escHtml(a.displayName);
+    html += '<span style="font-weight:600;font-size:13px;color:var(--text-primary);flex:1;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;" title="' + nameHtml + '">' + nameHtml + '</span>';
+    html += depthBadge;
+    if (a.status === 'failed') {
+      html += '<span style="font-size:10px;background:rgba(239,68,68,0.12);color:#ef4444;border:1px solid rgba(239,68,68,0.4);border-radius:4px;padding:1px 6px;margin-left:6px;font-weight:700;">FAILED</span>';
+    }
+    html += '<span style="font-size:11px;color:var(--text-muted);white-space:nowrap;margin-left:8px;">' + escHtml(a.model || '') + '</span>';
+    html += '<span style="font-size:11px;color:var(--text-muted);white-space:nowrap;margin-left:8px;">' + tokens + ' tok</span>';
+    html += '<span style="font-size:11px;color:var(--text-faint);white-space:nowrap;margin-left:8px;">' + escHtml(a.runtime || '') + '</span>';
+    if (a.status !== 'failed' && a.status !== 'stale' && a.status !== 'stopped') {
+      var isPaused = a.status === 'paused';
+      html += '<span class="sa-controls" style="margin-left:8px;display:inline-flex;gap:4px;flex-shrink:0;">';
+      if (isPaused) {
+        html += '<button data-sa-action="resume" style="font-size:10px;padding:2px 6px;border-radius:4px;border:1px solid #16a34a;background:transparent;color:#16a34a;cursor:pointer;">Resume</button>';
       } else {
-        roots.push(a);
-      }
-    });
-    function statusDot(status) {
-      var colors = { active: '#16a34a', idle: '#d97706', stale: '#6b7280', failed: '#ef4444', paused: '#7c3aed' };
-      var glow = status === 'active' ? 'box-shadow:0 0 6px rgba(22,163,74,0.6);'
-               : status === 'failed' ? 'box-shadow:0 0 6px rgba(239,68,68,0.5);'
-               : status === 'paused' ? 'box-shadow:0 0 6px rgba(124,58,237,0.5);' : '';
-      return '<span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:' + (colors[status] || '#6b7280') + ';' + glow + 'flex-shrink:0;margin-right:4px;"></span>';
-    }
-    function renderAgent(a, depth) {
-      var sid = a.sessionId;
-      var hasChildren = !!(childrenOf[sid] && childrenOf[sid].length > 0);
-      var isExpanded = _subagentsExpanded[sid] !== false;
-      var indent = depth > 0 ? 'padding-left:' + (depth * 22 + 12) + 'px;' : 'padding-left:12px;';
-      var toggleBtn = hasChildren
-        ? '<button onclick="event.stopPropagation();_saToggle(' + JSON.stringify(sid) + ')" style="background:none;border:none;cursor:pointer;font-size:11px;color:var(--text-muted);padding:0 4px 0 0;line-height:1;min-width:16px;">' + (isExpanded ? '▼' : '▶') + '</button>'
-        : '<span style="display:inline-block;min-width:16px;"></span>';
-      var tokens = a.totalTokens >= 1000 ? (a.totalTokens / 1000).toFixed(1) + 'K' : a.totalTokens;
-      var depthBadge = a.depth > 0 ? '<span style="font-size:10px;background:var(--bg-secondary);border:1px solid var(--border-primary);border-radius:4px;padding:1px 5px;color:var(--text-muted);margin-left:6px;">d' + a.depth + '</span>' : '';
-      // Click row → subagent detail modal (same call used by Active Tasks cards).
-      // Stop-propagation on the toggle button already handles tree expansion.
-      var name = (a.displayName || '').replace(/"/g,'&quot;').replace(/'/g,"\\'");
-      var sidEsc = (a.sessionId || '').replace(/'/g,"\\'");
-      var keyEsc = (a.key || a.sessionId || '').replace(/'/g,"\\'");
-      var clickAttr = ' onclick="openTaskModal(\'' + sidEsc + '\',\'' + name + '\',\'' + keyEsc + '\')"';
-      var cursor = 'cursor:pointer;';
-      var html = '<div' + clickAttr + ' style="display:flex;align-items:center;gap:6px;' + indent + 'padding-top:8px;padding-bottom:8px;padding-right:12px;border-bottom:1px solid var(--border-secondary);' + cursor + 'transition:background 0.1s;" onmouseover="this.style.background=\'var(--bg-hover)\'" onmouseout="this.style.background=\'\'">';
-      html += toggleBtn;
-      html += statusDot(a.status);
-      html += '<span style="font-weight:600;font-size:13px;color:var(--text-primary);flex:1;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;" title="' + escHtml(a.displayName) + '">' + escHtml(a.displayName) + '</span>';
-      html += depthBadge;
-      if (a.status === 'failed') {
-        html += '<span style="font-size:10px;background:rgba(239,68,68,0.12);color:#ef4444;border:1px solid rgba(239,68,68,0.4);border-radius:4px;padding:1px 6px;margin-left:6px;font-weight:700;">FAILED</span>';
+        html += '<button data-sa-action="pause" style="font-size:10px;padding:2px 6px;border-radius:4px;border:1px solid var(--border-primary);background:transparent;color:var(--text-muted);cursor:pointer;">Pause</button>';
       }
-      html += '<span style="font-size:11px;color:var(--text-muted);white-space:nowrap;margin-left:8px;">' + escHtml(a.model || '') + '</span>';
-      html += '<span style="font-size:11px;color:var(--text-muted);white-space:nowrap;margin-left:8px;">' + tokens + ' tok</span>';
-      html += '<span style="font-size:11px;color:var(--text-faint);white-space:nowrap;margin-left:8px;">' + escHtml(a.runtime || '') + '</span>';
-      if (a.status !== 'failed' && a.status !== 'stale' && a.status !== 'stopped') {
-        var keyBtn = (a.key || a.sessionId || '').replace(/\\/g,'\\\\').replace(/'/g,"\\'");
-        var isPaused = a.status === 'paused';
-        html += '<span onclick="event.stopPropagation();" style="margin-left:8px;display:inline-flex;gap:4px;flex-shrink:0;">';
-        if (isPaused) {
-          html += '<button onclick="event.stopPropagation();controlAgent(\'' + keyBtn + '\',\'resume\')" style="font-size:10px;padding:2px 6px;border-radius:4px;border:1px solid #16a34a;background:transparent;color:#16a34a;cursor:pointer;">Resume</button>';
-        } else {
-          html += '<button onclick="event.stopPropagation();controlAgent(\'' + keyBtn + '\',\'pause\')" style="font-size:10px;padding:2px 6px;border-radius:4px;border:1px solid var(--border-primary);background:transparent;color:var(--text-muted);cursor:pointer;">Pause</button>';
-        }
-        html += '<button onclick="event.stopPropagation();controlAgent(\'' + keyBtn + '\',\'stop\')" style="font-size:10px;padding:2px 6px;border-radius:4px;border:1px solid rgba(239,68,68,0.5);background:transparent;color:#ef4444;cursor:pointer;">Stop</button>';
-        html += '</span>';
-      }
-      html += '</div>';
-      if (hasChildren && isExpanded) {
-        childrenOf[sid].forEach(function(child) { html += renderAgent(child, depth + 1); });
-      }
-      return html;
-    }
-    var summaryHtml = '<div style="display:flex;gap:16px;padding:8px 14px;background:var(--bg-secondary);border-bottom:1px solid var(--border-primary);font-size:12px;flex-wrap:wrap;">';
-    summaryHtml += '<span style="color:var(--text-muted);"><strong style="color:var(--text-primary);">' + (counts.total || 0) + '</strong> total</span>';
-    if (counts.active) summaryHtml += '<span style="color:#16a34a;"><strong>' + counts.active + '</strong> active</span>';
-    if (counts.idle) summaryHtml += '<span style="color:#d97706;"><strong>' + counts.idle + '</strong> idle</span>';
-    if (counts.stale) summaryHtml += '<span style="color:var(--text-muted);"><strong>' + counts.stale + '</strong> stale</span>';
-    if (counts.failed) summaryHtml += '<span style="color:#ef4444;"><strong>' + counts.failed + '</strong> failed</span>';
-    summaryHtml += '</div>';
-    var treeHtml = '<div style="border:1px solid var(--border-primary);border-radius:10px;overflow:hidden;">' + summaryHtml;
-    roots.forEach(function(a) { treeHtml += renderAgent(a, 0); });
-    treeHtml += '</div>';
-    el.innerHTML = treeHtml;
-  } catch(e) {
-    el.innerHTML = '<div style="color:#e74c3c;font-size:13px;padding:16px;">' + t("app.failed_to_load_sub_agents", null, "Failed to load sub-agents") + ': ' + escHtml(String(e)) + '</div>';
+      html += '<button data-sa-action="stop" style="font-size:10px;padding:2px 6px;border-radius:4px;border:1px solid rgba(239,68,68,0.5);background:transparent;color:#ef4444;cursor:pointer;">Stop</button>';
+      html += '</span>';
+    }
+    html += '</div>';
+    rows.push({ key: sid, html: html, status: a.status });
+    if (hasChildren && isExpanded) {
+      childrenOf[sid].forEach(function(child) { renderAgent(child, depth + 1); });
+    }
+  }
+  var summaryHtml = '<div style="display:flex;gap:16px;padding:8px 14px;background:var(--bg-secondary);border-bottom:1px solid var(--border-primary);font-size:12px;flex-wrap:wrap;">';
+  summaryHtml += '<span style="color:var(--text-muted);"><strong style="color:var(--text-primary);">' + (counts.total || 0) + '</strong> total</span>';
+  if (counts.active) summaryHtml += '<span style="color:#16a34a;"><strong>' + counts.active + '</strong> active</span>';
+  if (counts.idle) summaryHtml += '<span style="color:#d97706;"><strong>' + counts.idle + '</strong> idle</span>';
+  if (counts.stale) summaryHtml += '<span style="color:var(--text-muted);"><strong>' + counts.stale + '</strong> stale</span>';
+  if (counts.failed) summaryHtml += '<span style="color:#ef4444;"><strong>' + counts.failed + '</strong> failed</span>';
+  summaryHtml += '</div>';
+  var rows = [{ key: '', html: summaryHtml }];
+  roots.forEach(function(a) { renderAgent(a, 0); });
+  _saRenderRows(el, rows);
+}
+
+// Keyed row reconcile for the sub-agent tree: each row's markup is cached by
+// sessionId and only rows whose markup changed are re-parsed; unchanged rows
+// keep their element and are at most moved. Status is not part of the markup
+// but a data-status attribute, so a status-only change re-parses nothing. The old path re-parsed the whole
+// tree through innerHTML on every change.
+var _saRowCache = new Map();
+var _saTemplate = document.createElement('template');
+
+function _saRenderRows(el, rows) {
+  var box = el.querySelector(':scope > .subagent-tree');
+  if (!box) {
+    el.innerHTML = '<div class="subagent-tree" style="border:1px solid var(--border-primary);border-radius:10px;overflow:hidden;"></div>';
+    box = el.firstChild;
+    box.addEventListener('click', _saTreeClick);
+    _saRowCache.clear();
+  }
+  var next = new Map();
+  var els = rows.map(function(r, i) {
+    var key = next.has(r.key) ? r.key + '#' + i : r.key;
+    var hit = _saRowCache.get(key);
+    if (!hit || hit.html !== r.html) {
+      _saTemplate.innerHTML = r.html;
+      hit = { html: r.html, el: _saTemplate.content.firstElementChild };
+    }
+    if (r.status && hit.el.dataset.status !== r.status) hit.el.dataset.status = r.status;
+    next.set(key, hit);
+    return hit.el;
+  });
+  _saRowCache = next;
+  var cur = box.children;
+  if (cur.length !== els.length || els.some(function(e, i) { return cur[i] !== e; })) {
+    box.replaceChildren.apply(box, els);
   }
 }
 
+// Single click handler for every row in the tree (see renderAgent's data-*).
+function _saTreeClick(e) {
+  var row = e.target.closest('.subagent-tree-row');
+  if (!row) return;
+  var d = row.dataset;
+  var action = e.target.closest('[data-sa-action]');
+  if (action) { controlAgent(d.key, action.dataset.saAction); return; }
+  if (e.target.closest('.sa-controls')) return;
+  if (e.target.closest('.sa-toggle')) { _saToggle(d.sid); return; }
+  openTaskModal(d.sid, d.name, d.key);
+}
+
 function _saToggle(sid) {
   _subagentsExpanded[sid] = (_subagentsExpanded[sid] === false) ? true : false;
-  loadSubagents();
+  var el = document.getElementById('subagents-list');
+  // The keyed reconcile in _saRenderRows then only touches the toggled row
+  // (its arrow) and inserts or drops its children.
+  if (el && _subagentsData) _saRenderTree(el, _subagentsData);
+  else loadSubagents(true);
 }
 
 async function loadOrchestration() {
@@ -15497,7 +16024,8 @@ async function loadOrchestration() {
       html += '<div style="flex:0 0 auto;min-width:155px;max-width:215px;border:1px solid var(--border-primary);border-radius:8px;padding:8px 10px;background:var(--bg-card);' + glow + '">';
       html += '<div style="display:flex;align-items:center;gap:5px;margin-bottom:4px;">';
       html += '<span style="width:8px;height:8px;border-radius:50%;background:' + color + ';display:inline-block;flex-shrink:0;"></span>';
-      html += '<span style="font-size:12px;font-weight:600;color:var(--text-primary);overflow:hidden;text-overflow:ellipsis;white-space:nowrap;flex:1;" title="' + escHtml(a.displayName) + '">' + escHtml(a.displayName) + '</span>';
+      var nameHtml = escHtml(a.displayName);
+      html += '<span style="font-size:12px;font-weight:600;color:var(--text-primary);overflow:hidden;text-overflow:ellipsis;white-space:nowrap;flex:1;" title="' + nameHtml + '">' + nameHtml + '</span>';
       html += depthBadge;
       html += '</div>';
       if (a.model && a.model !== 'unknown') {
@@ -16564,7 +17092,7 @@ async function loadMainActivity() {
       var t = ev.time ? new Date(ev.time) : null;
       var ts = '';
       if (t && !isNaN(t.getTime())) {
-        ts = t.toLocaleTimeString('en-GB', {hour:'2-digit',minute:'2-digit',second:'2-digit'});
+        ts = _DTF_CLOCK.format(t);
       }
       var type = (ev.type || 'TOOL').toUpperCase();
       var style = TYPE_STYLE[type] || {c:'#c0c0c0', icon:'•'};
@@ -16704,12 +17232,9 @@ function startLogStream() {
   };
   logStream.onmessage = function(e) {
     var data = JSON.parse(e.data);
-    streamBuffer.push(data.line);
-    if (streamBuffer.length > MAX_STREAM_LINES) streamBuffer.shift();
-    appendLogLine('ov-logs', data.line);
-    appendLogLine('logs-full', data.line);
-    processFlowEvent(data.line);
-    document.getElementById('refresh-time').textContent = 'Live \u2022 ' + new Date().toLocaleTimeString();
+    var obj = _parseLogJson(data.line);
+    _queueLogLine(data.line, obj);
+    processFlowEvent(data.line, obj);
   };
   // Named events emitted by _generate_openclaw_json_logs() in routes/infra.py.
   // EventSource.onmessage only fires for unnamed data: events; named events
@@ -16727,11 +17252,7 @@ function startLogStream() {
     try {
       var notice = JSON.parse(e.data);
       var msg = notice.message || notice.reason || JSON.stringify(notice);
-      var line = '[NOTICE] ' + msg;
-      streamBuffer.push(line);
-      if (streamBuffer.length > MAX_STREAM_LINES) streamBuffer.shift();
-      appendLogLine('ov-logs', line);
-      appendLogLine('logs-full', line);
+      _queueLogLine('[NOTICE] ' + msg);
     } catch(ex) {}
   });
   logStream.onerror = function() {
@@ -16745,13 +17266,40 @@ function startLogStream() {
   };
 }
 
-function parseLogLine(line) {
-  try {
-    var obj = JSON.parse(line);
+// Gateway log lines are mostly JSON objects, with some plain text mixed in.
+// Checking the first character before JSON.parse keeps plain lines off the
+// exception path: a throw per line costs far more than the parse itself.
+function _parseLogJson(line) {
+  var c = line.charCodeAt(0);
+  if (c !== 123 && !(c <= 32 && /^\s*\{/.test(line))) return null;
+  try { var obj = JSON.parse(line); } catch (e) { return null; }
+  return (obj && typeof obj === 'object') ? obj : null;
+}
+
+// Plain-text lines are classed by keyword. One global regex walks the line
+// once instead of a separate includes() scan per keyword; an Error/failed
+// anywhere still wins over an earlier WARN, as the old check order did.
+var _LOG_CLASS_RE = /(Error|failed)|(WARN)|(run start|inbound)/g;
+function _logTextClass(line) {
+  var cls = 'msg', m;
+  _LOG_CLASS_RE.lastIndex = 0;
+  while ((m = _LOG_CLASS_RE.exec(line))) {
+    if (m[1]) return 'err';
+    if (m[2]) cls = 'warn';
+    else if (cls === 'msg') cls = 'info';
+  }
+  return cls;
+}
+
+// ``obj`` is the already-parsed line when the caller has it (the SSE handler
+// parses once for both this and processFlowEvent).
+function parseLogLine(line, obj) {
+  if (obj === undefined) obj = _parseLogJson(line);
+  if (obj) try {
     var ts = '';
     if (obj.time || (obj._meta && obj._meta.date)) {
       var d = new Date(obj.time || obj._meta.date);
-      ts = d.toLocaleTimeString('en-GB', {hour:'2-digit', minute:'2-digit', second:'2-digit'});
+      ts = _fmtDate(_DTF_CLOCK, d);
     }
     var level = (obj.logLevelName || obj.level || 'info').toLowerCase();
     var cls = 'info';
@@ -16767,45 +17315,59 @@ function parseLogLine(line) {
     else if (extras.length) display = extras.join(' ');
     else if (!msg) display = line.substring(0, 200);
     else display = msg;
-    if (ts) display = '<span class="ts">' + ts + '</span> ' + escHtml(display);
-    else display = escHtml(display);
-    return {cls: cls, html: display};
-  } catch(e) {
-    var cls = 'msg';
-    if (line.includes('Error') || line.includes('failed')) cls = 'err';
-    else if (line.includes('WARN')) cls = 'warn';
-    else if (line.includes('run start') || line.includes('inbound')) cls = 'info';
-    return {cls: cls, html: escHtml(line.substring(0, 300))};
+    var text = (ts ? ts + ' ' : '') + display;
+    return {cls: cls, ts: ts, msg: display, text: text.toLowerCase()};
+  } catch(e) {}
+  var raw = line.substring(0, 300);
+  return {cls: _logTextClass(line), ts: '', msg: raw, text: raw.toLowerCase()};
+}
+
+// One log row ({cls, ts, msg}) as a clone of #tpl-log-line, filled through
+// textContent: no HTML parse and no escaping pass per line.
+function _logRowNode(row) {
+  var node = _tplRow('tpl-log-line');
+  var span = node.firstChild;
+  span.className = row.cls;
+  if (row.ts) {
+    span.firstChild.textContent = row.ts;
+    span.appendChild(document.createTextNode(' ' + row.msg));
+  } else {
+    span.firstChild.replaceWith(row.msg);
   }
+  return node;
+}
+
+// Streamed lines are parsed into rows on arrival, queued, and written once per
+// animation frame: a burst of SSE messages becomes one append per log list
+// and a single scroll write, instead of a layout per message. The queue keeps at most
+// MAX_STREAM_LINES, since older lines would be trimmed on append anyway.
+var _logPending = [];
+var _logFlushRaf = 0;
+
+function _queueLogLine(line, obj) {
+  streamBuffer.push(line);
+  if (streamBuffer.length > MAX_STREAM_LINES) streamBuffer.shift();
+  _logPending.push(parseLogLine(line, obj));
+  if (_logPending.length > MAX_STREAM_LINES) _logPending.shift();
+  if (!_logFlushRaf) _logFlushRaf = requestAnimationFrame(_flushLogLines);
+}
+
+function _flushLogLines() {
+  _logFlushRaf = 0;
+  var rows = _logPending;
+  _logPending = [];
+  ['ov-logs', 'logs-full'].forEach(function(id) {
+    var el = document.getElementById(id);
+    if (el) _logsAppendRows(el, rows);
+  });
+  var rt = document.getElementById('refresh-time');
+  if (rt) rt.textContent = 'Live \u2022 ' + new Date().toLocaleTimeString();
 }
 
 function appendLogLine(elId, line) {
   var el = document.getElementById(elId);
   if (!el) return;
-  var parsed = parseLogLine(line);
-  var div = document.createElement('div');
-  div.className = 'log-line';
-  div.innerHTML = '<span class="' + parsed.cls + '">' + parsed.html + '</span>';
-  el.appendChild(div);
-  while (el.children.length > MAX_STREAM_LINES) el.removeChild(el.firstChild);
-  // Apply live filter for logs-full
-  if (elId === 'logs-full') {
-    var span = el.lastElementChild ? el.lastElementChild.querySelector('span') : null;
-    var cls = span ? span.className : '';
-    var text = el.lastElementChild ? el.lastElementChild.textContent.toLowerCase() : '';
-    var query = (document.getElementById('log-filter') ? document.getElementById('log-filter').value : '').toLowerCase();
-    var levelOk = _logLevelFilter === 'all'
-      || (_logLevelFilter === 'error' && cls === 'err')
-      || (_logLevelFilter === 'warn'  && (cls === 'warn' || cls === 'err'))
-      || (_logLevelFilter === 'info'  && (cls === 'info' || cls === 'warn' || cls === 'err'));
-    if (!levelOk || (query && !text.includes(query))) el.lastElementChild.style.display = 'none';
-  }
-  var autoScroll = document.getElementById('log-autoscroll');
-  if (!autoScroll || autoScroll.checked) {
-    if (el.scrollHeight - el.scrollTop - el.clientHeight < 150) {
-      el.scrollTop = el.scrollHeight;
-    }
-  }
+  _logsAppendRows(el, [parseLogLine(line)]);
 }
 
 
@@ -16821,19 +17383,114 @@ function setLogLevel(level, btn) {
 
 function filterLogLines() {
   var el = document.getElementById('logs-full');
-  if (!el) return;
-  var query = (document.getElementById('log-filter') ? document.getElementById('log-filter').value : '').toLowerCase();
-  Array.from(el.children).forEach(function(div) {
-    var span = div.querySelector('span');
-    var cls = span ? span.className : '';
-    var text = div.textContent.toLowerCase();
-    var levelOk = _logLevelFilter === 'all'
-      || (_logLevelFilter === 'error' && cls === 'err')
-      || (_logLevelFilter === 'warn'  && (cls === 'warn' || cls === 'err'))
-      || (_logLevelFilter === 'info'  && (cls === 'info' || cls === 'warn' || cls === 'err'));
-    var queryOk = !query || text.includes(query);
-    div.style.display = levelOk && queryOk ? '' : 'none';
-  });
+  var v = el && _vlists.get(el);
+  if (!v || v.body.parentNode !== el) return;
+  _logsRefilter(v);
+  _vlistRender(v, true);
+}
+
+function _logRowMatches(row, query) {
+  var cls = row.cls;
+  var levelOk = _logLevelFilter === 'all'
+    || (_logLevelFilter === 'error' && cls === 'err')
+    || (_logLevelFilter === 'warn'  && (cls === 'warn' || cls === 'err'))
+    || (_logLevelFilter === 'info'  && (cls === 'info' || cls === 'warn' || cls === 'err'));
+  return levelOk && (!query || row.text.includes(query));
+}
+
+function _logFilterQuery() {
+  var f = document.getElementById('log-filter');
+  return (f ? f.value : '').toLowerCase();
+}
+
+function _logsRefilter(v) {
+  var query = _logFilterQuery();
+  v.shown = v.rows.filter(function(row) { return _logRowMatches(row, query); });
+}
+
+function _logsAppendRows(el, rows) {
+  var v = _vlistFor(el);
+  var atBottom = el.scrollHeight - el.scrollTop - el.clientHeight < 150;
+  Array.prototype.push.apply(v.rows, rows);
+  v.appended += rows.length;
+  if (v.rows.length > MAX_STREAM_LINES) {
+    v.rows.splice(0, v.rows.length - MAX_STREAM_LINES);
+    _logsRefilter(v);
+  } else {
+    var query = _logFilterQuery();
+    rows.forEach(function(row) { if (_logRowMatches(row, query)) v.shown.push(row); });
+  }
+  var autoScroll = document.getElementById('log-autoscroll');
+  if (atBottom && (!autoScroll || autoScroll.checked)) {
+    _vlistRender(v, true);
+    el.scrollTop = el.scrollHeight;
+    _vlistRender(v);
+  } else {
+    // Scrolled up: the rows in view are unchanged, so unless the buffer was
+    // trimmed from the top only the bottom spacer grows.
+    _vlistRender(v, v.rows.length >= MAX_STREAM_LINES);
+  }
+}
+
+// ===== Windowed list =====
+// Keeps only the rows in view (plus _VLIST_OVERSCAN either side) in the DOM
+// of a scroll container; spacer divs above and below stand in for the rest
+// so the scrollbar still reflects the whole list. Rows must share one height,
+// measured from the first rendered row. Re-rendering is triggered by the
+// spacers entering the viewport rather than by every scroll event. A hidden
+// container (another tab, or the display:none #ov-logs) keeps its rows in
+// JS only; the spacers' observer renders them once it is shown.
+var _VLIST_OVERSCAN = 20;
+var _vlists = new WeakMap();
+
+function _vlistFor(el) {
+  var v = _vlists.get(el);
+  if (v && v.body.parentNode === el) return v;
+  el.innerHTML = '<div class="vlist-pad"></div><div class="vlist-rows"></div><div class="vlist-pad"></div>';
+  v = { el: el, rows: [], shown: [], appended: 0, rowH: 0, start: -1, end: -1, raf: 0,
+        top: el.children[0], body: el.children[1], bottom: el.children[2] };
+  if (typeof IntersectionObserver === 'function') {
+    v.io = new IntersectionObserver(function(entries) {
+      if (entries.some(function(e) { return e.isIntersecting; })) _vlistSchedule(v);
+    }, { root: el });
+    v.io.observe(v.top);
+    v.io.observe(v.bottom);
+  } else {
+    el.addEventListener('scroll', function() { _vlistSchedule(v); }, { passive: true });
+  }
+  _vlists.set(el, v);
+  return v;
+}
+
+function _vlistSchedule(v) {
+  if (v.raf) return;
+  v.raf = requestAnimationFrame(function() { v.raf = 0; _vlistRender(v); });
+}
+
+function _vlistRender(v, force) {
+  var el = v.el, n = v.shown.length;
+  if (!el.clientHeight) { v.start = v.end = -1; return; }
+  if (!v.rowH && n) {
+    v.body.replaceChildren(_logRowNode(v.shown[0]));
+    // getBoundingClientRect includes the #zoom-wrapper scale (and any zoom
+    // transition in progress) while scrollTop/clientHeight are layout px, so
+    // divide the scale back out using the container measured the same way.
+    // offsetHeight alone would round away fractional row heights.
+    var box = el.getBoundingClientRect().height;
+    v.rowH = v.body.firstChild.getBoundingClientRect().height * (box ? el.offsetHeight / box : 1);
+    force = true;
+  }
+  var h = v.rowH || 21;
+  var start = Math.max(0, Math.floor(el.scrollTop / h) - _VLIST_OVERSCAN);
+  var end = Math.min(n, start + Math.ceil(el.clientHeight / h) + _VLIST_OVERSCAN * 2);
+  v.bottom.style.height = ((n - end) * h) + 'px';
+  if (!force && start === v.start && end === v.end) return;
+  v.start = start;
+  v.end = end;
+  v.top.style.height = (start * h) + 'px';
+  var frag = document.createDocumentFragment();
+  for (var i = start; i < end; i++) frag.appendChild(_logRowNode(v.shown[i]));
+  v.body.replaceChildren(frag);
 }
 
 // ===== Flow Visualization Engine =====
@@ -17049,8 +17706,7 @@ function _startFlowSse() {
         // Layer 2: pulse the brain→tool edge for this bucket + accent Tools.
         _flowPulseEdge('path-brain-' + toolName);
         _flowRailSetStage('tools');
-        var toolNames = {exec:'running a command',browser:'browsing the web',search:'searching the web',cron:'scheduling',tts:'generating speech',memory:'accessing memory'};
-        addFlowFeedItem('⚡ ' + (toolName || 'tool') + ': ' + (toolNames[toolName] || 'using ' + toolName), '#f0c040', 'tool');
+        addFlowFeedItem('⚡ ' + (toolName || 'tool') + ': ' + _flowFeedLabelForTool(toolName), '#f0c040', 'tool');
         flowStats.events++;
       } else if (type === 'tool_result') {
         var resultTool = evt.tool || 'tool';
@@ -17325,13 +17981,15 @@ function initFlow() {
 
   // Hide unconfigured channels in the flow SVG
   hideUnconfiguredChannels(document);
+  _flowPrewarm('flow-svg');
 
-  fetchJsonWithTimeout('/api/overview', 5000).then(async function(d) {
-    if (!d.model || d.model === 'unknown') {
+  getOverview().then(async function(d) {
+    var model = d.model;
+    if (!model || model === 'unknown') {
       var fm = await resolvePrimaryModelFallback();
-      if (fm && fm !== 'unknown') d.model = fm;
+      if (fm && fm !== 'unknown') model = fm;
     }
-    if (d.model) applyBrainModelToAll(d.model);
+    if (model) applyBrainModelToAll(model);
     var tok = document.getElementById('flow-tokens');
     if (tok) tok.textContent = (d.mainTokens / 1000).toFixed(0) + 'K';
 
@@ -17374,7 +18032,7 @@ function initFlow() {
   // app.js:606 etc.) and use visibilitySetInterval so the poll pauses when
   // the browser tab is hidden — completes Phase 2 coverage.
   if (window._flowStatsTimer) { try { clearInterval(window._flowStatsTimer); } catch(e){} }
-  window._flowStatsTimer = visibilitySetInterval(updateFlowStats, updateInterval);
+  window._flowStatsTimer = visibilitySetInterval(scheduleFlowStatsUpdate, updateInterval);
   // Issue #721: session lanes panel — initial load + 30 s refresh.
   loadFlowLanes();
   if (window._flowLanesTimer) { try { clearInterval(window._flowLanesTimer); } catch(e){} }
@@ -17496,11 +18154,34 @@ function _brainTypeToFlowTool(t) {
 }
 
 // Pretty label for the live feed — keeps the same surface as flow-events.
+var _FLOW_TOOL_VERBS = {exec:'running a command',browser:'browsing the web',search:'searching the web',cron:'scheduling',tts:'generating speech',memory:'accessing memory'};
 function _flowFeedLabelForTool(toolName) {
-  var toolNames = {exec:'running a command',browser:'browsing the web',search:'searching the web',cron:'scheduling',tts:'generating speech',memory:'accessing memory'};
-  return toolNames[toolName] || 'using ' + toolName;
+  return _FLOW_TOOL_VERBS[toolName] || 'using ' + toolName;
 }
 
+// Raw tool name (from a gateway log line) → Flow diagram bucket. Names not
+// listed fall back to 'browser' when they mention it, otherwise 'exec'.
+var _FLOW_TOOL_BUCKET = {
+  exec: 'exec', read: 'exec', write: 'exec', edit: 'exec', process: 'exec',
+  canvas: 'browser', web_search: 'search', web_fetch: 'search',
+  cron: 'cron', sessions_spawn: 'cron', sessions_send: 'cron', tts: 'tts',
+  memory_search: 'memory', memory_get: 'memory'
+};
+
+// processFlowEvent's keyword fallback for lines that mention a tool without a
+// tool= field: first bucket (in this order) with a matching keyword wins.
+// One compiled alternation per bucket instead of an includes() per keyword.
+var _FLOW_TOOL_ARG_RE = /tool=(\w+)/;
+var _FLOW_TOOL_MENTION_RE = /tool|invoke|calling/;
+var _FLOW_TOOL_KEYWORDS = [
+  ['exec', /exec|shell|command/],
+  ['browser', /browser|screenshot|snapshot/],
+  ['search', /web_search|web_fetch/],
+  ['cron', /cron|schedule/],
+  ['tts', /tts|speech|voice/],
+  ['memory', /memory_search|memory_get/]
+];
+
 // ── Layer 2: live "what's firing right now" packet view ─────────────────────
 // Flow STAYS a live view (turn-replay lives on the Tracing screen). These two
 // helpers make the diagram + rail visibly track real events as they fire:
@@ -17617,7 +18298,7 @@ function _backfillFlowEventCount() {
     // counted more live events than the backfill (don't shrink a live counter).
     if (isFinite(today) && today > 0 && today > flowStats.events) {
       flowStats.events = today;
-      updateFlowStats();
+      scheduleFlowStatsUpdate();
     }
   }).catch(function(){});
 }
@@ -17657,7 +18338,7 @@ function _backfillFlowFromBrain() {
       } catch(e) {}
       seen++;
     }
-    if (seen > 0) updateFlowStats();
+    if (seen > 0) scheduleFlowStatsUpdate();
   }).catch(function(){});
 }
 
@@ -17744,35 +18425,19 @@ function _populateFlowSkills() {
 
 // Add subtle animation to help users understand the flow
 function enhanceArchitectureClarity() {
-  // Gentle pulse on key nodes to show importance hierarchy
-  var keyNodes = ['node-human', 'node-gateway', 'node-brain'];
-  keyNodes.forEach(function(nodeId, index) {
-    setTimeout(function() {
-      var node = document.getElementById(nodeId);
-      if (node) {
-        node.style.animation = 'none';
-        setTimeout(function() {
-          node.style.animation = '';
-        }, 100);
-      }
-    }, index * 800);
-  });
-  
-  // Highlight the main message flow path briefly
-  var paths = ['path-human-tg', 'path-tg-gw', 'path-gw-brain'];
-  paths.forEach(function(pathId, index) {
-    setTimeout(function() {
-      var path = document.getElementById(pathId);
-      if (path) {
-        path.style.opacity = '0.8';
-        path.style.strokeWidth = '3';
-        path.style.transition = 'all 0.5s ease';
-        setTimeout(function() {
-          path.style.opacity = '';
-          path.style.strokeWidth = '';
-        }, 1500);
-      }
-    }, index * 200);
+  // Highlight the main message flow path briefly. The stagger is CSS
+  // (.flow-intro + --intro-delay), so this is three class writes rather than
+  // a chain of timers waking the main thread.
+  ['path-human-tg', 'path-tg-gw', 'path-gw-brain'].forEach(function(pathId, index) {
+    var path = document.getElementById(pathId);
+    if (!path || path.classList.contains('flow-intro')) return;
+    path.style.setProperty('--intro-delay', (index * 200) + 'ms');
+    path.addEventListener('animationend', function done(e) {
+      if (e.animationName !== 'flowIntro') return;
+      path.classList.remove('flow-intro');
+      path.removeEventListener('animationend', done);
+    });
+    path.classList.add('flow-intro');
   });
 }
 
@@ -17786,24 +18451,48 @@ function _fmtFlowTokens(tokens) {
   return n < 1000 ? String(n) : n < 1e6 ? Math.round(n / 1000) + 'K' : (n / 1e6).toFixed(1) + 'M';
 }
 
+// The token count polls /api/overview at most every FLOW_TOKENS_POLL_MS
+// (jittered), backing off to FLOW_TOKENS_POLL_MAX_MS while it fails. It used
+// to poll whenever the event count was a multiple of 15, which includes every
+// tick of an idle Flow tab (0 events).
+var FLOW_TOKENS_POLL_MS = 5000;
+var FLOW_TOKENS_POLL_MAX_MS = 30000;
+var _flowTokensNextAt = 0;
+var _flowTokensBackoff = FLOW_TOKENS_POLL_MS;
+
+// The stat cards are refreshed from a timer and from the one-shot backfills;
+// requests landing in the same frame share one updateFlowStats pass.
+var _flowStatsRaf = 0;
+function scheduleFlowStatsUpdate() {
+  if (_flowStatsRaf) return;
+  _flowStatsRaf = requestAnimationFrame(function() {
+    _flowStatsRaf = 0;
+    updateFlowStats();
+  });
+}
+
 function updateFlowStats() {
   // Tab-scoped: this polls /api/overview for the Flow tab's live stats. It
   // must NOT fire on every other screen — it was hitting /api/overview ~9x/15s
   // on unrelated tabs (e.g. Memory). Pause off Flow/Overview; resume on return.
   if (window._cmCurrentTab && window._cmCurrentTab !== 'flow' && window._cmCurrentTab !== 'overview') return;
   var now = Date.now();
-  flowStats.msgTimestamps = flowStats.msgTimestamps.filter(function(t){return now - t < 60000;});
-  var el1 = document.getElementById('flow-msg-rate');
-  if (el1) el1.textContent = flowStats.msgTimestamps.length;
-  var el2 = document.getElementById('flow-event-count');
-  if (el2) el2.textContent = flowStats.events;
+  // Timestamps are pushed in Date.now() order, so only a prefix can be stale:
+  // drop it in one splice instead of filtering into a new array each update.
+  var ts = flowStats.msgTimestamps, stale = 0;
+  while (stale < ts.length && now - ts[stale] >= 60000) stale++;
+  if (stale) ts.splice(0, stale);
+  var el1 = cachedEl('flow-msg-rate');
+  if (el1) setText(el1, flowStats.msgTimestamps.length);
+  var el2 = cachedEl('flow-event-count');
+  if (el2) setText(el2, flowStats.events);
   var names = Object.keys(flowStats.activeTools).filter(function(k){return flowStats.activeTools[k];});
-  var el3 = document.getElementById('flow-active-tools');
+  var el3 = cachedEl('flow-active-tools');
   if (el3) {
     // Show the COUNT (numeric, matches the other stat cards) rather than the
     // comma-joined list, which overflowed the small card. The full list stays
     // available as a hover tooltip.
-    el3.textContent = names.length > 0 ? String(names.length) : '0';
+    setText(el3, names.length);
     try { el3.title = names.length > 0 ? names.join(', ') : ''; } catch (e) {}
   }
   // Journey rail sub-stats \u2014 wired to the same live data every tick. Each is
@@ -17832,36 +18521,190 @@ function updateFlowStats() {
       }
     }
   } catch (e) {}
-  if (flowStats.events % 15 === 0) {
-    fetchJsonWithTimeout('/api/overview', 5000).then(function(d) {
+  if (now >= _flowTokensNextAt) {
+    _flowTokensNextAt = Infinity; // one poll in flight at a time
+    getOverview().then(function(d) {
+      _flowTokensBackoff = FLOW_TOKENS_POLL_MS;
       var tok = document.getElementById('flow-tokens');
       if (tok) tok.textContent = _fmtFlowTokens(d.mainTokens);
-    }).catch(function(){});
+    }, function() {
+      _flowTokensBackoff = Math.min(_flowTokensBackoff * 2, FLOW_TOKENS_POLL_MAX_MS);
+    }).then(function() {
+      _flowTokensNextAt = Date.now() + _flowTokensBackoff * (0.9 + Math.random() * 0.2);
+    });
   }
 }
 
-// Enhanced particle animation with performance optimizations and better mobile support
-var particlePool = [];
-var trailPool = [];
-var maxParticles = window.innerWidth < 768 ? 3 : 8; // Limit particles on mobile
+// Particles are painted on a <canvas> laid over each flow SVG instead of being
+// SVG circles: a circle per particle (plus its trail dots, each with a CSS
+// drop-shadow/blur filter) dirtied the whole diagram's style and paint every
+// frame. Nodes and paths stay SVG; one requestAnimationFrame loop advances
+// every in-flight particle, clears each overlay and redraws it with one
+// fill per colour, and stops itself when nothing is in flight.
+// Per-diagram cap on particles in flight. The old 8/3 limit was sized for
+// SVG circles; on the canvas a particle is two arcs in a batched fill, so a
+// busy burst can show every hop instead of silently dropping most of them.
+var maxParticles = window.innerWidth < 768 ? 8 : 24;
 var trailInterval = window.innerWidth < 768 ? 8 : 4; // Fewer trails on mobile
+var FLOW_PATH_SAMPLES = 96;
+var FLOW_TRAIL_MS = 450;
+var FLOW_TRAIL_DOTS = 6;
+var FLOW_GLOW_LINGER_MS = 400; // must not exceed FLOW_TRAIL_MS
+var _flowParticles = [];
+var _flowTickerId = 0;
+var _flowPathCache = new WeakMap();
+var _flowLayers = new Map(); // svg -> {canvas, ctx, w, h, dpr}
+var _flowGlowCounts = new WeakMap(); // path -> {glowCls: particles in flight}
+
+// Sample a path once into a flat [x0,y0,x1,y1,...] array so a frame does a
+// lerp instead of getPointAtLength; re-sampled if the path's d changes
+// (channel nodes are repositioned at runtime).
+function _flowPathPoints(path) {
+  var d = path.getAttribute('d');
+  var hit = _flowPathCache.get(path);
+  if (hit && hit.d === d) return hit.pts;
+  var len = path.getTotalLength();
+  var pts = new Float32Array((FLOW_PATH_SAMPLES + 1) * 2);
+  for (var i = 0; i <= FLOW_PATH_SAMPLES; i++) {
+    var pt = path.getPointAtLength(len * i / FLOW_PATH_SAMPLES);
+    pts[i * 2] = pt.x; pts[i * 2 + 1] = pt.y;
+  }
+  _flowPathCache.set(path, { d: d, pts: pts });
+  return pts;
+}
+
+function _flowPointAt(pts, t, out) {
+  var f = t * FLOW_PATH_SAMPLES, i = Math.min(f | 0, FLOW_PATH_SAMPLES - 1), k = f - i;
+  out.x = pts[i * 2] + (pts[i * 2 + 2] - pts[i * 2]) * k;
+  out.y = pts[i * 2 + 1] + (pts[i * 2 + 3] - pts[i * 2 + 1]) * k;
+  return out;
+}
+
+function _flowLayerFor(svg) {
+  var layer = _flowLayers.get(svg);
+  if (layer && layer.canvas.isConnected) return layer;
+  var canvas = document.createElement('canvas');
+  canvas.className = 'flow-particle-layer';
+  svg.parentNode.insertBefore(canvas, svg.nextSibling);
+  layer = { canvas: canvas, ctx: canvas.getContext('2d'), w: 0, h: 0, dpr: 0 };
+  _flowLayers.set(svg, layer);
+  return layer;
+}
 
-function getPooledParticle(isTrail) {
-  var pool = isTrail ? trailPool : particlePool;
-  if (pool.length > 0) return pool.pop();
-  var elem = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
-  elem.setAttribute('r', isTrail ? '2' : '5');
-  return elem;
+// Build a diagram's overlay now and sample its paths when the page is idle,
+// so the first burst of particles doesn't pay for the canvas, its context
+// and a getPointAtLength pass per path mid-animation.
+function _flowPrewarm(svgId) {
+  var svg = document.getElementById(svgId);
+  if (!svg || !svg.parentNode) return;
+  _flowLayerFor(svg);
+  var later = typeof requestIdleCallback === 'function' ? requestIdleCallback : function(fn) { setTimeout(fn, 200); };
+  later(function() {
+    svg.querySelectorAll('path.flow-path[id]').forEach(function(path) {
+      try { _flowPathPoints(path); } catch (e) {}
+    });
+  });
+}
+
+// Match the overlay to the SVG box and map viewBox units to device pixels
+// (preserveAspectRatio="xMidYMid meet"). Measurements for every layer are
+// read before any of them is written so a frame forces at most one layout.
+// SVG elements have no offsetLeft, so the offset inside the (positioned)
+// .flow-container comes from the two client rects, divided by the zoom
+// wrapper's scale so it is in the container's own CSS pixels.
+function _flowLayerMeasure(svg, layer) {
+  var parent = svg.parentNode, sr = svg.getBoundingClientRect(), pr = parent.getBoundingClientRect();
+  var k = parent.offsetWidth ? pr.width / parent.offsetWidth : 1;
+  layer.m = {
+    w: svg.clientWidth, h: svg.clientHeight,
+    left: Math.round((sr.left - pr.left) / k - parent.clientLeft),
+    top: Math.round((sr.top - pr.top) / k - parent.clientTop),
+  };
 }
 
-function returnToPool(elem, isTrail) {
-  var pool = isTrail ? trailPool : particlePool;
-  elem.style.opacity = '0';
-  elem.style.transform = '';
-  if (pool.length < 20) pool.push(elem); // Pool size limit
-  else if (elem.parentNode) elem.parentNode.removeChild(elem);
+function _flowLayerApply(svg, layer) {
+  var m = layer.m, dpr = window.devicePixelRatio || 1, st = layer.canvas.style;
+  if (m.w !== layer.w || m.h !== layer.h || dpr !== layer.dpr) {
+    layer.w = m.w; layer.h = m.h; layer.dpr = dpr;
+    layer.canvas.width = m.w * dpr; layer.canvas.height = m.h * dpr;
+    st.width = m.w + 'px'; st.height = m.h + 'px';
+  }
+  // One transform write instead of left + top: moving the overlay is then
+  // a compositor offset, not a layout change for the flow container.
+  if (layer.left !== m.left || layer.top !== m.top) {
+    layer.left = m.left; layer.top = m.top;
+    st.transform = 'translate(' + m.left + 'px,' + m.top + 'px)';
+  }
+  var ctx = layer.ctx;
+  ctx.setTransform(1, 0, 0, 1, 0, 0);
+  ctx.clearRect(0, 0, layer.canvas.width, layer.canvas.height);
+  var vb = svg.viewBox.baseVal;
+  if (!m.w || !m.h || !vb || !vb.width || !vb.height) return false;
+  var scale = Math.min(m.w / vb.width, m.h / vb.height);
+  var tx = (m.w - vb.width * scale) / 2 - vb.x * scale;
+  var ty = (m.h - vb.height * scale) / 2 - vb.y * scale;
+  ctx.setTransform(dpr * scale, 0, 0, dpr * scale, dpr * tx, dpr * ty);
+  return true;
 }
 
+function _flowTick(now) {
+  // Compacted in place so a frame doesn't allocate a fresh particle list.
+  var alive = _flowParticles, n = 0;
+  for (var i = 0; i < alive.length; i++) if (_flowStepParticle(alive[i], now)) alive[n++] = alive[i];
+  alive.length = n;
+  // A layer with nothing in flight is cleared once and then left alone, so
+  // an idle overlay (the Overview clone during a Flow-tab burst) costs no
+  // layout reads per frame. All reads still precede all canvas writes.
+  var busy = new Set();
+  alive.forEach(function(p) { busy.add(p.svg); });
+  var draw = [];
+  _flowLayers.forEach(function(layer, svg) {
+    if (!layer.canvas.isConnected) { _flowLayers.delete(svg); return; }
+    if (!busy.has(svg) && !layer.painted) return;
+    layer.painted = busy.has(svg);
+    _flowLayerMeasure(svg, layer);
+    draw.push(svg);
+  });
+  draw.forEach(function(svg) {
+    var layer = _flowLayers.get(svg);
+    if (!_flowLayerApply(svg, layer)) return;
+    var ctx = layer.ctx, byColor = {};
+    alive.forEach(function(p) {
+      if (p.svg !== svg) return;
+      ctx.fillStyle = p.color;
+      for (var k = 0, tr = p.trail; k < p.trailLen * 3; k += 3) {
+        var a = 1 - (now - tr[k + 2]) / FLOW_TRAIL_MS;
+        if (a <= 0) continue;
+        ctx.globalAlpha = 0.6 * a;
+        ctx.beginPath(); ctx.arc(tr[k], tr[k + 1], 2 * (0.3 + 0.7 * a), 0, 6.2832); ctx.fill();
+      }
+      if (!p.done) (byColor[p.color] = byColor[p.color] || []).push(p);
+    });
+    Object.keys(byColor).forEach(function(color) {
+      ctx.fillStyle = color;
+      // Soft halo standing in for the old drop-shadow filter, then the core.
+      [[10, 0.25], [5, 1]].forEach(function(ring) {
+        ctx.globalAlpha = ring[1];
+        ctx.beginPath();
+        byColor[color].forEach(function(p) { ctx.moveTo(p.x + ring[0], p.y); ctx.arc(p.x, p.y, ring[0], 0, 6.2832); });
+        ctx.fill();
+      });
+    });
+    ctx.globalAlpha = 1;
+  });
+  _flowTickerId = alive.length ? requestAnimationFrame(_flowTick) : 0;
+}
+
+function _flowStartParticle(entry) {
+  _flowParticles.push(entry);
+  if (!_flowTickerId) _flowTickerId = requestAnimationFrame(_flowTick);
+}
+
+var _FLOW_GLOW_CLS = {
+  '#60a0ff': 'glow-blue', '#f0c040': 'glow-yellow', '#50e080': 'glow-green',
+  '#40a0b0': 'glow-cyan', '#c0a0ff': 'glow-purple'
+};
+
 function animateParticle(pathId, color, duration, reverse) {
   // Animate on main Flow SVG
   _animateParticleOn(pathId, 'flow-svg', color, duration, reverse);
@@ -17869,91 +18712,70 @@ function animateParticle(pathId, color, duration, reverse) {
   _animateParticleOn('ov-' + pathId, 'overview-flow-svg', color, duration, reverse);
 }
 function _animateParticleOn(pathId, svgId, color, duration, reverse) {
-  var path = document.getElementById(pathId);
+  var path = cachedEl(pathId);
   if (!path) return;
-  var svg = document.getElementById(svgId);
-  if (!svg) return;
+  var svg = cachedEl(svgId);
+  if (!svg || !svg.parentNode) return;
   
   // Skip if too many particles (performance)
-  var activeParticles = svg.querySelectorAll('circle[data-particle]').length;
+  var activeParticles = 0;
+  for (var i = 0; i < _flowParticles.length; i++) if (_flowParticles[i].svg === svg && !_flowParticles[i].done) activeParticles++;
   if (activeParticles > maxParticles) return;
   
-  var len = path.getTotalLength();
-  var particle = getPooledParticle(false);
-  particle.setAttribute('data-particle', 'true');
-  particle.setAttribute('fill', color);
-  particle.style.filter = 'drop-shadow(0 0 8px ' + color + ')';
-  particle.style.opacity = '1';
-  svg.appendChild(particle);
-  
-  var glowCls = color === '#60a0ff' ? 'glow-blue' : color === '#f0c040' ? 'glow-yellow' : color === '#50e080' ? 'glow-green' : color === '#40a0b0' ? 'glow-cyan' : color === '#c0a0ff' ? 'glow-purple' : 'glow-red';
-  path.classList.add(glowCls);
+  var pts;
+  try { pts = _flowPathPoints(path); } catch (e) { return; }
+  _flowLayerFor(svg);
   
-  var startT = performance.now();
-  var trailN = 0;
-  var trailElements = [];
+  // Glow classes are counted per path: overlapping particles on one path add
+  // the class once and the last to finish removes it, instead of each one
+  // toggling it (and an early finisher stripping a later particle's glow).
+  var glowCls = _FLOW_GLOW_CLS[color] || 'glow-red';
+  var glows = _flowGlowCounts.get(path) || {};
+  if (!glows[glowCls]) path.classList.add(glowCls);
+  glows[glowCls] = (glows[glowCls] || 0) + 1;
+  _flowGlowCounts.set(path, glows);
   
-  function step(now) {
-    var t = Math.min((now - startT) / duration, 1);
-    var dist = reverse ? (1 - t) * len : t * len;
-    
-    try {
-      var pt = path.getPointAtLength(dist);
-      particle.setAttribute('cx', pt.x);
-      particle.setAttribute('cy', pt.y);
-    } catch(e) { 
-      cleanup();
-      return; 
-    }
-    
-    // Create trail less frequently, and only if not too many already
-    if (trailN++ % trailInterval === 0 && trailElements.length < 6) {
-      var tr = getPooledParticle(true);
-      tr.setAttribute('cx', particle.getAttribute('cx'));
-      tr.setAttribute('cy', particle.getAttribute('cy'));
-      tr.setAttribute('fill', color);
-      tr.style.opacity = '0.6';
-      tr.style.filter = 'blur(0.5px)';
-      svg.insertBefore(tr, particle);
-      trailElements.push(tr);
-      
-      // Fade trail with CSS transition instead of JS animation
-      setTimeout(function() {
-        tr.style.transition = 'opacity 400ms ease-out, transform 400ms ease-out';
-        tr.style.opacity = '0';
-        tr.style.transform = 'scale(0.3)';
-        setTimeout(function() { 
-          if (tr.parentNode) tr.parentNode.removeChild(tr);
-          returnToPool(tr, true);
-        }, 450);
-      }, 50);
-    }
-    
-    if (t < 1) {
-      requestAnimationFrame(step);
-    } else {
-      cleanup();
-    }
-  }
-  
-  function cleanup() {
-    if (particle.parentNode) particle.parentNode.removeChild(particle);
-    returnToPool(particle, false);
-    setTimeout(function() { 
-      path.classList.remove(glowCls); 
-    }, 400);
-  }
-  
-  requestAnimationFrame(step);
+  _flowStartParticle({
+    svg: svg, path: path, pts: pts, color: color, glowCls: glowCls, glows: glows,
+    start: performance.now(), dur: duration, reverse: !!reverse, x: 0, y: 0, done: false,
+    trail: new Float64Array(FLOW_TRAIL_DOTS * 3), trailLen: 0, trailNext: 0, trailN: 0, lastAt: 0
+  });
+}
+
+// Advances one particle; false once it has arrived and its trail has faded.
+// The path's glow is released here too, FLOW_GLOW_LINGER_MS after arrival,
+// rather than from a timer per particle.
+function _flowStepParticle(p, now) {
+  if (p.done) {
+    var since = now - p.lastAt;
+    if (p.glows && since >= FLOW_GLOW_LINGER_MS) {
+      if (--p.glows[p.glowCls] <= 0) { delete p.glows[p.glowCls]; p.path.classList.remove(p.glowCls); }
+      p.glows = null;
+    }
+    return since < FLOW_TRAIL_MS;
+  }
+  var t = Math.min((now - p.start) / p.dur, 1);
+  _flowPointAt(p.pts, p.reverse ? 1 - t : t, p);
+  // Drop a trail dot every few frames into the particle's ring of
+  // FLOW_TRAIL_DOTS (x, y, at) slots; dots fade out over FLOW_TRAIL_MS.
+  if (p.trailN++ % trailInterval === 0 || t >= 1) {
+    var o = p.trailNext * 3;
+    p.trail[o] = p.x; p.trail[o + 1] = p.y; p.trail[o + 2] = now;
+    p.trailNext = (p.trailNext + 1) % FLOW_TRAIL_DOTS;
+    if (p.trailLen < FLOW_TRAIL_DOTS) p.trailLen++;
+    p.lastAt = now;
+  }
+  if (t >= 1) p.done = true;
+  return true;
 }
 
 function highlightNode(nodeId, dur) {
-  var node = document.getElementById(nodeId);
+  var node = cachedEl(nodeId);
   if (!node) return;
   node.classList.add('active');
   setTimeout(function() { node.classList.remove('active'); }, dur || 2000);
   // Also highlight on overview clone
-  var ovNode = document.getElementById('ov-' + nodeId);
+  var ovNode = cachedEl('ov-' + nodeId);
   if (ovNode) {
     ovNode.classList.add('active');
     setTimeout(function() { ovNode.classList.remove('active'); }, dur || 2000);
@@ -17977,7 +18799,7 @@ function _chPathKey(ch) {
 function _chNodeId(ch) {
   // Prefer a dedicated node-<channel>; fall back to signal (the shared slot).
   var byName = 'node-' + (ch || 'telegram').toLowerCase();
-  return document.getElementById(byName) ? byName : 'node-signal';
+  return cachedEl(byName) ? byName : 'node-signal';
 }
 
 function triggerInbound(ch) {
@@ -17993,7 +18815,7 @@ function triggerInbound(ch) {
     animateParticle('path-gw-brain', '#60a0ff', 600, false);
     highlightNode('node-brain', 2500);
   }, 1050);
-  setTimeout(function() { triggerInfraNetwork(); }, 300);
+  setTimeout(function() { triggerInfra('network'); }, 300);
 }
 
 function triggerToolCall(toolName) {
@@ -18003,16 +18825,16 @@ function triggerToolCall(toolName) {
   setTimeout(function() {
     animateParticle(pathId, '#f0c040', 700, true);
   }, 900);
-  var ind = document.getElementById('ind-' + toolName);
+  var ind = cachedEl('ind-' + toolName);
   if (ind) { ind.classList.add('active'); setTimeout(function() { ind.classList.remove('active'); }, 4000); }
   flowStats.activeTools[toolName] = true;
   setTimeout(function() { delete flowStats.activeTools[toolName]; }, 5000);
   if (toolName === 'exec') {
-    setTimeout(function() { triggerInfraMachine(); triggerInfraRuntime(); }, 400);
+    setTimeout(function() { triggerInfra('machine'); triggerInfra('runtime'); }, 400);
   } else if (toolName === 'browser' || toolName === 'search') {
-    setTimeout(function() { triggerInfraNetwork(); }, 400);
+    setTimeout(function() { triggerInfra('network'); }, 400);
   } else if (toolName === 'memory') {
-    setTimeout(function() { triggerInfraStorage(); }, 400);
+    setTimeout(function() { triggerInfra('storage'); }, 400);
   }
 }
 
@@ -18028,31 +18850,26 @@ function triggerOutbound(ch) {
     animateParticle('path-human-' + key, '#50e080', 550, true);
     highlightNode('node-human', 1800);
   }, 1200);
-  setTimeout(function() { triggerInfraNetwork(); }, 200);
+  setTimeout(function() { triggerInfra('network'); }, 200);
 }
 
 function triggerError() {
-  var brain = document.getElementById('node-brain');
+  var brain = cachedEl('node-brain');
   if (!brain) return;
   var r = brain.querySelector('rect');
   if (r) { r.style.stroke = '#e04040'; setTimeout(function() { r.style.stroke = '#f0c040'; }, 2500); }
 }
 
-function triggerInfraNetwork() {
-  animateParticle('path-brain-infra', '#40a0b0', 1200, false);
-  highlightNode('node-network', 2500);
-}
-function triggerInfraRuntime() {
-  animateParticle('path-brain-infra', '#40a0b0', 1000, false);
-  highlightNode('node-runtime', 2200);
-}
-function triggerInfraMachine() {
-  animateParticle('path-brain-infra', '#40a0b0', 1050, false);
-  highlightNode('node-machine', 2200);
-}
-function triggerInfraStorage() {
-  animateParticle('path-brain-infra', '#40a0b0', 700, false);
-  highlightNode('node-storage', 2000);
+// Infra node → [particle duration, highlight duration]. Every infra hop
+// travels path-brain-infra in the same colour.
+var _FLOW_INFRA = {
+  network: [1200, 2500], runtime: [1000, 2200],
+  machine: [1050, 2200], storage: [700, 2000]
+};
+function triggerInfra(kind) {
+  var d = _FLOW_INFRA[kind];
+  animateParticle('path-brain-infra', '#40a0b0', d[0], false);
+  highlightNode('node-' + kind, d[1]);
 }
 
 // Live feed for Flow tab - shows recent events in plain English
@@ -18092,47 +18909,80 @@ function addFlowFeedItem(text, color, category) {
   var now = new Date();
   var time = now.toLocaleTimeString('en-GB', {hour:'2-digit',minute:'2-digit',second:'2-digit'});
   var cat = category || 'system';
-  _flowFeedItems.push({time: time, text: text, color: color || '#888', cat: cat});
+  var item = {time: time, text: text, color: color || '#888', cat: cat};
+  _flowFeedItems.push(item);
   if (_flowFeedItems.length > _flowFeedMax) _flowFeedItems.shift();
-  renderToolStream();
-  var countEl = document.getElementById('flow-feed-count');
+  renderToolStream(item);
+  var countEl = cachedEl('flow-feed-count');
   if (countEl) countEl.textContent = flowStats.events + ' events';
 }
 
-function renderToolStream() {
-  var el = document.getElementById('flow-live-feed');
+// Newest first, at most FLOW_FEED_SHOWN rows. Rows are built as nodes with
+// textContent (feed text carries raw channel and tool names from events).
+var FLOW_FEED_SHOWN = 60;
+
+function _flowFeedMatches(item, filter) {
+  return !filter || item.text.toLowerCase().includes(filter) || item.cat.toLowerCase().includes(filter);
+}
+
+function _flowFeedRow(item) {
+  var row = document.createElement('div');
+  row.className = 'flow-feed-row';
+  row.style.cssText = 'display:flex;gap:6px;align-items:baseline;padding:1px 0;';
+  var parts = [
+    ['color:#444;flex-shrink:0;', item.time],
+    ['color:' + (_toolCategoryColors[item.cat] || '#666') + ';font-size:9px;flex-shrink:0;text-transform:uppercase;letter-spacing:0.5px;min-width:42px;', item.cat],
+    ['color:' + item.color + ';word-break:break-word;', item.text]
+  ];
+  parts.forEach(function(p) {
+    var span = document.createElement('span');
+    span.style.cssText = p[0];
+    span.textContent = p[1];
+    row.appendChild(span);
+  });
+  return row;
+}
+
+// ``added`` is the item addFlowFeedItem just pushed: when the feed already
+// shows rows, that one row is prepended (and the oldest dropped) instead of
+// re-rendering the whole list.
+function renderToolStream(added) {
+  var el = cachedEl('flow-live-feed');
   if (!el) return;
   var filter = _toolStreamFilter;
+  if (added && el.firstElementChild && el.firstElementChild.className === 'flow-feed-row') {
+    if (!_flowFeedMatches(added, filter)) return;
+    el.insertBefore(_flowFeedRow(added), el.firstChild);
+    while (el.childElementCount > FLOW_FEED_SHOWN) el.removeChild(el.lastElementChild);
+    return;
+  }
   var filtered = filter
-    ? _flowFeedItems.filter(function(item) { return item.text.toLowerCase().includes(filter) || item.cat.toLowerCase().includes(filter); })
+    ? _flowFeedItems.filter(function(item) { return _flowFeedMatches(item, filter); })
     : _flowFeedItems;
   if (filtered.length === 0) {
     el.innerHTML = filter ? '<div style="color:#555;">No matching events.</div>' : '<div style="color:#555;">Waiting for activity...</div>';
     return;
   }
-  var html = '';
-  for (var i = filtered.length - 1; i >= Math.max(0, filtered.length - 60); i--) {
-    var item = filtered[i];
-    var catColor = _toolCategoryColors[item.cat] || '#666';
-    html += '<div style="display:flex;gap:6px;align-items:baseline;padding:1px 0;">'
-      + '<span style="color:#444;flex-shrink:0;">' + item.time + '</span>'
-      + '<span style="color:' + catColor + ';font-size:9px;flex-shrink:0;text-transform:uppercase;letter-spacing:0.5px;min-width:42px;">' + item.cat + '</span>'
-      + '<span style="color:' + item.color + ';word-break:break-word;">' + item.text + '</span>'
-      + '</div>';
+  var frag = document.createDocumentFragment();
+  for (var i = filtered.length - 1; i >= Math.max(0, filtered.length - FLOW_FEED_SHOWN); i--) {
+    frag.appendChild(_flowFeedRow(filtered[i]));
   }
-  el.innerHTML = html;
+  el.replaceChildren(frag);
 }
 
 var flowThrottles = {};
-function processFlowEvent(line) {
+function processFlowEvent(line, obj) {
   flowStats.events++;
   var now = Date.now();
   var msg = '', level = '';
-  try {
-    var obj = JSON.parse(line);
+  if (obj === undefined) obj = _parseLogJson(line);
+  // Plain-text lines (obj null) used to reach the catch below via a TypeError
+  // on obj.msg; they now take the text path directly.
+  if (!obj) msg = line.toLowerCase();
+  else try {
     msg = ((obj.msg || '') + ' ' + (obj.message || '') + ' ' + (obj.name || '') + ' ' + (obj['0'] || '') + ' ' + (obj['1'] || '')).toLowerCase();
     level = (obj.logLevelName || obj.level || (obj._meta && obj._meta.logLevelName) || '').toLowerCase();
-  } catch(e) { msg = line.toLowerCase(); }
+  } catch(e) { obj = null; msg = line.toLowerCase(); }
 
   if (level === 'error' || level === 'fatal') { triggerError(); return; }
 
@@ -18164,46 +19014,23 @@ function processFlowEvent(line) {
 
   if ((msg.includes('tool start') || msg.includes('tool-call') || msg.includes('tool_use')) && !msg.includes('tool end')) {
     var toolName = '';
-    var toolMatch = msg.match(/tool=(\w+)/);
+    var toolMatch = _FLOW_TOOL_ARG_RE.exec(msg);
     if (toolMatch) toolName = toolMatch[1].toLowerCase();
-    var flowTool = 'exec';
-    if (toolName === 'exec' || toolName === 'read' || toolName === 'write' || toolName === 'edit' || toolName === 'process') {
-      flowTool = 'exec';
-    } else if (toolName.includes('browser') || toolName === 'canvas') {
-      flowTool = 'browser';
-    } else if (toolName === 'web_search' || toolName === 'web_fetch') {
-      flowTool = 'search';
-    } else if (toolName === 'cron' || toolName === 'sessions_spawn' || toolName === 'sessions_send') {
-      flowTool = 'cron';
-    } else if (toolName === 'tts') {
-      flowTool = 'tts';
-    } else if (toolName === 'memory_search' || toolName === 'memory_get') {
-      flowTool = 'memory';
-    } else if (toolName === 'message') {
+    if (toolName === 'message') {
       if (now - (flowThrottles['outbound']||0) < 500) return;
       flowThrottles['outbound'] = now;
       triggerOutbound('tg'); return;
     }
+    var flowTool = _FLOW_TOOL_BUCKET[toolName] || (toolName.includes('browser') ? 'browser' : 'exec');
     if (now - (flowThrottles['tool-'+flowTool]||0) < 300) return;
     flowThrottles['tool-'+flowTool] = now;
-    var toolNames = {exec:'running a command',browser:'browsing the web',search:'searching the web',cron:'scheduling a task',tts:'generating speech',memory:'accessing memory'};
-    addFlowFeedItem('⚡ ' + flowTool + ': ' + (toolNames[flowTool] || 'using ' + flowTool), '#f0c040', 'tool');
+    addFlowFeedItem('⚡ ' + flowTool + ': ' + _flowFeedLabelForTool(flowTool), '#f0c040', 'tool');
     triggerToolCall(flowTool); return;
   }
 
-  var toolMap = {
-    'exec': ['exec','shell','command'],
-    'browser': ['browser','screenshot','snapshot'],
-    'search': ['web_search','web_fetch'],
-    'cron': ['cron','schedule'],
-    'tts': ['tts','speech','voice'],
-    'memory': ['memory_search','memory_get']
-  };
-  if (msg.includes('tool') || msg.includes('invoke') || msg.includes('calling')) {
-    for (var t in toolMap) {
-      for (var i = 0; i < toolMap[t].length; i++) {
-        if (msg.includes(toolMap[t][i])) { triggerToolCall(t); return; }
-      }
+  if (_FLOW_TOOL_MENTION_RE.test(msg)) {
+    for (var i = 0; i < _FLOW_TOOL_KEYWORDS.length; i++) {
+      if (_FLOW_TOOL_KEYWORDS[i][1].test(msg)) { triggerToolCall(_FLOW_TOOL_KEYWORDS[i][0]); return; }
     }
   }
 
@@ -18242,11 +19069,7 @@ function processFlowEvent(line) {
     return;
   }
   if (msg.includes('session state') && (msg.includes('new=completed') || msg.includes('new=error') || msg.includes('new=cancelled') || msg.includes('new=aborted'))) {
-    try {
-      var termObj = JSON.parse(line);
-      var termSid = termObj.session_key || termObj.session || termObj.sessionId || termObj.id || '';
-      _clearStuckBanner(termSid);
-    } catch(e) {}
+    if (obj) _clearStuckBanner(obj.session_key || obj.session || obj.sessionId || obj.id || '');
     return;
   }
   if (msg.includes('lane enqueue') && msg.includes('main')) {
@@ -18276,12 +19099,13 @@ function processFlowEvent(line) {
     flowThrottles['stuck'] = now;
     addFlowFeedItem('⚠️ Session stuck detected', '#e04040');
     _diagPush({kind:'session.stuck', value:1, ts:now});
-    try {
-      var stuckObj = JSON.parse(line);
-      var stuckSid = stuckObj.session_key || stuckObj.session || stuckObj.sessionId || stuckObj.id || '';
-      var stuckAge = stuckObj.age_ms ? Math.round(stuckObj.age_ms / 1000) : (stuckObj.age_s || 0);
+    if (obj) {
+      var stuckSid = obj.session_key || obj.session || obj.sessionId || obj.id || '';
+      var stuckAge = obj.age_ms ? Math.round(obj.age_ms / 1000) : (obj.age_s || 0);
       _showStuckBanner(stuckSid, stuckAge);
-    } catch(e) { _showStuckBanner('', 0); }
+    } else {
+      _showStuckBanner('', 0);
+    }
     return;
   }
   if (msg.includes('tool end') || msg.includes('tool_end')) {
@@ -18440,6 +19264,7 @@ function initOverviewFlow() {
   });
   container.innerHTML = '';
   container.appendChild(clone);
+  _flowPrewarm('overview-flow-svg');
   // Hide unconfigured channels in the overview clone too
   // Clone has IDs prefixed with 'ov-', so we use a wrapper approach
   fetch('/api/channels').then(function(r){return r.json();}).then(function(d) {
@@ -19353,8 +20178,10 @@ function loadSignalMessages(isRefresh) {
   });
 }
 
+// Same output as serializing a text node (what this used to do through a
+// throwaway <div>), without creating and parsing an element per call.
 function escapeHtml(s) {
-  var d = document.createElement('div'); d.textContent = s; return d.innerHTML;
+  return s == null ? '' : escHtml(String(s));
 }
 
 function renderMarkdown(text) {
@@ -20945,7 +21772,7 @@ async function _renderModalSpawnInfo(sessionIdOrKey, reason) {
     el.innerHTML = '<div style="padding:20px;color:var(--text-muted);">' + t("app.loading_subagent_info", null, "Loading subagent info...") + '</div>';
   }
   try {
-    var saData = await fetch('/api/subagents').then(function(r){return r.json();}).catch(function(){return {subagents:[]};});
+    var saData = await fetchSubagentsShared().catch(function(){return {subagents:[]};});
     var entries = saData.subagents || [];
     var match = entries.find(function(a) {
       return a.sessionId === sessionIdOrKey || a.key === sessionIdOrKey;
@@ -21170,7 +21997,7 @@ async function _renderModalBrainEvents(match) {
       var style = TYPE_STYLE[type] || {c:'#c0c0c0', icon:'•'};
       var t = ev.time ? new Date(ev.time) : null;
       var ts = t && !isNaN(t.getTime())
-        ? t.toLocaleTimeString('en-GB', {hour:'2-digit',minute:'2-digit',second:'2-digit'})
+        ? _DTF_CLOCK.format(t)
         : '';
       var detail = escHtml(ev.detail || '');
       if (detail.length > 200) detail = detail.substring(0, 197) + '…';
@@ -22258,7 +23085,7 @@ async function updateFromBanner() {
   }
 }
 
-setInterval(checkUpdateStatus, 3600000);
+visibilitySetInterval(checkUpdateStatus, 3600000);
 setTimeout(checkUpdateStatus, 5000);
 
 // ── Per-screen runtime chip (2nd switch point) ───────────────────────────────
@@ -22369,7 +23196,7 @@ setTimeout(checkUpdateStatus, 5000);
       };
       window.switchTab.__cmChipWrapped = true;
     }
-    setInterval(function () { try { window._cmRenderRuntimeChip(); } catch (e) {} }, 5000);
+    visibilitySetInterval(function () { window._cmRenderRuntimeChip(); }, 5000);
   }
   if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', function () { setTimeout(_boot, 800); });
   else setTimeout(_boot, 800);
@@ -22400,30 +23227,29 @@ var _SWIMLANE_TOOL_COLORS = {
 
 function _swimlaneLanes() {
   try {
-    var raw = localStorage.getItem('cm-swimlane-lanes');
+    var raw = readPref('cm-swimlane-lanes');
     var arr = raw ? JSON.parse(raw) : [];
     return Array.isArray(arr) ? arr.slice(0, 4) : [];
   } catch (e) { return []; }
 }
 function _swimlaneSetLanes(arr) {
-  try { localStorage.setItem('cm-swimlane-lanes', JSON.stringify((arr || []).slice(0, 4))); }
-  catch (e) {}
+  persistPrefOnIdle('cm-swimlane-lanes', JSON.stringify((arr || []).slice(0, 4)));
 }
 function _swimlaneMode() {
-  try { return localStorage.getItem('cm-swimlane-mode') || 'swimlane'; }
+  try { return readPref('cm-swimlane-mode') || 'swimlane'; }
   catch (e) { return 'swimlane'; }
 }
 function _swimlaneRaceSort() {
-  try { return localStorage.getItem('cm-swimlane-race-sort') || 'cost'; }
+  try { return readPref('cm-swimlane-race-sort') || 'cost'; }
   catch (e) { return 'cost'; }
 }
 
 function setSwimlaneMode(mode) {
-  try { localStorage.setItem('cm-swimlane-mode', mode); } catch (e) {}
+  persistPrefOnIdle('cm-swimlane-mode', mode);
   loadSwimlane();
 }
 function setSwimlaneRaceSort(sort) {
-  try { localStorage.setItem('cm-swimlane-race-sort', sort); } catch (e) {}
+  persistPrefOnIdle('cm-swimlane-race-sort', sort);
   loadSwimlane();
 }
 
@@ -44,6 +44,9 @@ import glob
 import json
 import socket
 from collections import deque, defaultdict
+from itertools import islice
+from bisect import bisect_right
+from functools import lru_cache
 
 # In-process ring-buffer for quick action history (last 50 entries)
 _quick_action_log = deque(maxlen=50)
@@ -796,13 +799,8 @@ def _otel_cost_is_fresh(since_ts: float) -> bool:
     for daily rules). Even one fresh OTLP row covering the period means the
     in-memory buffer is the source of truth — DuckDB fallback is unnecessary.
     """
-    cutoff = time.time() - _OTLP_FRESH_WINDOW_SEC
-    with _metrics_lock:
-        for entry in metrics_store["cost"]:
-            ts = entry.get("timestamp", 0)
-            if ts >= cutoff and ts >= since_ts:
-                return True
-    return False
+    cutoff = max(time.time() - _OTLP_FRESH_WINDOW_SEC, since_ts)
+    return bool(_metrics_since("cost", cutoff))
 
 
 def _duckdb_cost_since(since_iso: str) -> float:
@@ -886,7 +884,7 @@ def _get_budget_status():
     cost_source = "otlp"
 
     with _metrics_lock:
-        for entry in metrics_store["cost"]:
+        for entry in list(metrics_store["cost"]):
             ts = entry.get("timestamp", 0)
             usd = entry.get("usd", 0)
             if ts >= month_start:
@@ -1202,7 +1200,7 @@ def _agent_spend_for_period(agent_id, period_start):
     matching how the rest of the dashboard names the primary agent."""
     total = 0.0
     with _metrics_lock:
-        for entry in metrics_store["cost"]:
+        for entry in list(metrics_store["cost"]):
             ts = entry.get("timestamp", 0)
             if ts < period_start:
                 continue
@@ -1397,7 +1395,7 @@ def _budget_check():
         pass
     try:
         with _metrics_lock:
-            for entry in metrics_store["cost"]:
+            for entry in list(metrics_store["cost"]):
                 agents_to_check.add(entry.get("agent", "main") or "main")
     except Exception:
         pass
@@ -9065,19 +9063,63 @@ def detect_agent_install():
 
 
 # ── OTLP Metrics Store ─────────────────────────────────────────────────
+# Optional: orjson encodes the metrics snapshot several times faster than the
+# stdlib. Not a dependency; falls back to json when absent.
+try:
+    import orjson as _orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _orjson = None
+    _HAS_ORJSON = False
+
+
+def _json_dumps(obj):
+    """Serialize ``obj`` to UTF-8 JSON bytes (orjson when available)."""
+    if _HAS_ORJSON:
+        return _orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(raw):
+    """Parse JSON from bytes/str (orjson when available).
+
+    orjson rejects the NaN/Infinity literals the stdlib encoder emits, so a
+    snapshot written by an older build retries with ``json.loads`` before it
+    is treated as corrupt.
+    """
+    if _HAS_ORJSON:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 METRICS_FILE = None  # Set via CLI/env, defaults to {WORKSPACE}/.clawmetry-metrics.json
 _metrics_lock = threading.Lock()
 _otel_last_received = 0  # timestamp of last OTLP data received
 
+# Flush cadence: persist as soon as METRICS_FLUSH_BATCH entries are pending,
+# otherwise every METRICS_FLUSH_INTERVAL seconds if anything arrived at all.
+METRICS_FLUSH_INTERVAL = 60
+METRICS_FLUSH_BATCH = 256
+METRICS_FLUSH_MIN_GAP = 5  # seconds between batch-triggered flushes
+_metrics_flush_event = threading.Event()
+_metrics_pending = 0  # appends since the last flush (approximate; lock-free)
+
+MAX_STORE_ENTRIES = 10_000
+
+# Each category is a bounded ring: deque(maxlen) drops the oldest entry on
+# append in O(1), so the cap never costs a full-list slice copy.
 metrics_store = {
-    "tokens": [],  # [{timestamp, input, output, total, model, channel, provider}]
-    "cost": [],  # [{timestamp, usd, model, channel, provider}]
-    "runs": [],  # [{timestamp, duration_ms, model, channel}]
-    "messages": [],  # [{timestamp, channel, outcome, duration_ms}]
-    "webhooks": [],  # [{timestamp, channel, type}]
-    "queues": [],  # [{timestamp, channel, depth}]
+    "tokens": deque(maxlen=MAX_STORE_ENTRIES),  # [{timestamp, input, output, total, model, channel, provider}]
+    "cost": deque(maxlen=MAX_STORE_ENTRIES),  # [{timestamp, usd, model, channel, provider}]
+    "runs": deque(maxlen=MAX_STORE_ENTRIES),  # [{timestamp, duration_ms, model, channel}]
+    "messages": deque(maxlen=MAX_STORE_ENTRIES),  # [{timestamp, channel, outcome, duration_ms}]
+    "webhooks": deque(maxlen=MAX_STORE_ENTRIES),  # [{timestamp, channel, type}]
+    "queues": deque(maxlen=MAX_STORE_ENTRIES),  # [{timestamp, channel, depth}]
 }
-MAX_STORE_ENTRIES = 10_000
 STORE_RETENTION_DAYS = 14
 
 
@@ -9097,12 +9139,16 @@ def _load_metrics_from_disk():
     if not os.path.exists(path):
         return
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
         if isinstance(data, dict):
             for key in metrics_store:
                 if key in data and isinstance(data[key], list):
-                    metrics_store[key] = data[key][-MAX_STORE_ENTRIES:]
+                    entries = deque(data[key], maxlen=MAX_STORE_ENTRIES)
+                    for entry in entries:
+                        if isinstance(entry, dict):
+                            _intern_metric_labels(entry)
+                    metrics_store[key] = entries
             _otel_last_received = data.get("_last_received", 0)
         _expire_old_entries()
     except json.JSONDecodeError as e:
@@ -9121,27 +9167,39 @@ def _load_metrics_from_disk():
 
 
 def _save_metrics_to_disk():
-    """Persist metrics store to JSON file."""
+    """Persist metrics store to JSON file.
+
+    Streams one category at a time: each deque is copied under the lock and
+    encoded after releasing it, so the lock is held for a reference copy per
+    category rather than for the whole serialization.
+    """
     path = _metrics_file_path()
     try:
         d = os.path.dirname(path)
         if d:
             os.makedirs(d, exist_ok=True)
-        data = {}
-        with _metrics_lock:
-            for k in metrics_store:
-                data[k] = list(metrics_store[k])
-        data["_last_received"] = _otel_last_received
-        data["_saved_at"] = time.time()
         tmp = path + ".tmp"
-        with open(tmp, "w") as f:
-            json.dump(data, f)
+        with open(tmp, "wb") as f:
+            f.write(b"{")
+            for k in list(metrics_store):
+                with _metrics_lock:
+                    items = list(metrics_store[k])
+                f.write(_json_dumps(k) + b":" + _json_dumps(items) + b",")
+            f.write(
+                b'"_last_received":'
+                + _json_dumps(_otel_last_received)
+                + b',"_saved_at":'
+                + _json_dumps(time.time())
+                + b"}"
+            )
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, path)
     except OSError as e:
         print(f"[warn]  Warning: Failed to save metrics to {path}: {e}")
         if "No space left on device" in str(e):
             print("💾 Disk full! Consider cleaning up old files or expanding storage.")
-    except json.JSONEncodeError as e:
+    except (TypeError, ValueError) as e:
         print(f"[warn]  Warning: Failed to serialize metrics data: {e}")
     except Exception as e:
         print(f"[warn]  Warning: Unexpected error saving metrics: {e}")
@@ -9151,20 +9209,43 @@ def _expire_old_entries():
     """Remove entries older than STORE_RETENTION_DAYS."""
     cutoff = time.time() - (STORE_RETENTION_DAYS * 86400)
     with _metrics_lock:
-        for key in metrics_store:
-            metrics_store[key] = [
-                e for e in metrics_store[key] if e.get("timestamp", 0) > cutoff
-            ][-MAX_STORE_ENTRIES:]
+        for entries in metrics_store.values():
+            # Trim in place: _add_metric appends without the lock, so swapping
+            # in a rebuilt deque could drop an entry appended mid-rebuild.
+            # Entries arrive in time order, so only the head can be stale.
+            while entries and entries[0].get("timestamp", 0) <= cutoff:
+                entries.popleft()
+
+
+# Low-cardinality label fields repeated on most entries. Each decoded OTLP
+# attribute (and each JSON-loaded value) is a fresh str; interning makes a
+# full ring share one object per distinct model/channel/provider.
+_METRIC_LABEL_FIELDS = ("model", "channel", "provider")
+
+
+def _intern_metric_labels(entry):
+    """Intern ``entry``'s label strings in place."""
+    for field in _METRIC_LABEL_FIELDS:
+        value = entry.get(field)
+        if type(value) is str:
+            entry[field] = sys.intern(value)
 
 
 def _add_metric(category, entry):
-    """Add an entry to the metrics store (thread-safe)."""
-    global _otel_last_received
-    with _metrics_lock:
-        metrics_store[category].append(entry)
-        if len(metrics_store[category]) > MAX_STORE_ENTRIES:
-            metrics_store[category] = metrics_store[category][-MAX_STORE_ENTRIES:]
-        _otel_last_received = time.time()
+    """Add an entry to the metrics store (thread-safe).
+
+    Lock-free on purpose: deque.append is atomic under the GIL and the
+    ``maxlen`` cap needs no follow-up truncation, so concurrent OTLP
+    requests don't serialize on ``_metrics_lock``. Readers iterate a
+    ``list()`` snapshot; expiry and persistence still take the lock.
+    """
+    global _otel_last_received, _metrics_pending
+    _intern_metric_labels(entry)
+    metrics_store[category].append(entry)
+    _otel_last_received = time.time()
+    _metrics_pending += 1
+    if _metrics_pending >= METRICS_FLUSH_BATCH:
+        _metrics_flush_event.set()
     # Check budget on cost entries
     if category == "cost":
         try:
@@ -9173,13 +9254,73 @@ def _add_metric(category, entry):
             pass
 
 
+def _metrics_tail(category, n):
+    """Return the newest ``n`` entries of a metrics category, oldest first.
+
+    Deques don't slice; walking from the right keeps this O(n) instead of
+    copying the whole ring. Caller holds ``_metrics_lock``.
+    """
+    entries = metrics_store.get(category, ())
+    return list(islice(reversed(entries), n))[::-1]
+
+
+def _metrics_since(category, cutoff):
+    """Entries of a metrics category timestamped at or after ``cutoff``.
+
+    Every producer stamps ``time.time()`` on arrival, so entries are in time
+    order: walk back from the newest and stop at the first older one. Windowed
+    readers (last 5 min / hour / day) pay for the window, not the whole ring.
+
+    Appends are lock-free, so a walk that races one raises RuntimeError
+    (deque mutated during iteration). It is retried a few times, then falls
+    back to walking a ``list()`` snapshot.
+    """
+    ring = metrics_store.get(category)
+    if not ring:
+        return []
+    for _attempt in range(3):
+        window = []
+        try:
+            for e in reversed(ring):
+                if e.get("timestamp", 0) < cutoff:
+                    break
+                window.append(e)
+        except RuntimeError:
+            continue
+        window.reverse()
+        return window
+    entries = list(ring)
+    i = len(entries)
+    while i and entries[i - 1].get("timestamp", 0) >= cutoff:
+        i -= 1
+    return entries[i:]
+
+
+def _metrics_flush_cycle():
+    """Expire old entries and persist the store if anything new arrived.
+
+    Returns True when a snapshot was written. An idle store costs no disk IO.
+    """
+    global _metrics_pending
+    _expire_old_entries()
+    if not _metrics_pending:
+        return False
+    _metrics_pending = 0
+    _save_metrics_to_disk()
+    return True
+
+
 def _metrics_flush_loop():
-    """Background thread: save metrics to disk every 60 seconds."""
+    """Background thread: persist metrics once a batch is pending (signalled
+    by ``_add_metric``) or every ``METRICS_FLUSH_INTERVAL`` seconds."""
     while True:
-        time.sleep(60)
+        _metrics_flush_event.wait(timeout=METRICS_FLUSH_INTERVAL)
+        _metrics_flush_event.clear()
         try:
-            _expire_old_entries()
-            _save_metrics_to_disk()
+            if _metrics_flush_cycle():
+                # Under sustained ingest the batch threshold trips constantly;
+                # bound how often a full snapshot is rewritten.
+                time.sleep(METRICS_FLUSH_MIN_GAP)
         except KeyboardInterrupt:
             print("📊 Metrics flush loop shutting down...")
             break
@@ -10299,15 +10440,11 @@ def _budget_monitor_loop():
             window_start = now - 3600
             total_wh = 0
             error_wh = 0
-            with _metrics_lock:
-                for e in metrics_store.get("webhooks", []):
-                    ts = e.get("timestamp", 0)
-                    if ts < window_start:
-                        continue
-                    total_wh += 1
-                    et = str(e.get("type", "")).lower()
-                    if et.endswith(".error") or "error" in et:
-                        error_wh += 1
+            for e in _metrics_since("webhooks", window_start):
+                total_wh += 1
+                et = str(e.get("type", "")).lower()
+                if et.endswith(".error") or "error" in et:
+                    error_wh += 1
             if total_wh >= 10:
                 error_rate = (error_wh / total_wh) * 100.0
                 if error_rate >= 20.0:
@@ -10441,10 +10578,8 @@ def _budget_monitor_loop():
                     # Spike: cost in last hour > threshold x average hourly rate
                     hour_ago = now - 3600
                     hour_cost = 0
-                    with _metrics_lock:
-                        for e in metrics_store["cost"]:
-                            if e.get("timestamp", 0) >= hour_ago:
-                                hour_cost += e.get("usd", 0)
+                    for e in _metrics_since("cost", hour_ago):
+                        hour_cost += e.get("usd", 0)
                     avg_hourly = status["daily_spent"] / max(
                         1,
                         (
@@ -10574,16 +10709,20 @@ def _start_budget_monitor_thread():
 # ── OTLP Protobuf Helpers ──────────────────────────────────────────────
 
 
+# AnyValue oneof arms returned as-is; array/kvlist/bytes/unset values are
+# stringified.
+_OTEL_SCALAR_VALUE_FIELDS = frozenset(
+    ("string_value", "int_value", "double_value", "bool_value")
+)
+
+
 def _otel_attr_value(val):
     """Convert an OTel AnyValue to a Python value."""
-    if val.HasField("string_value"):
-        return val.string_value
-    if val.HasField("int_value"):
-        return val.int_value
-    if val.HasField("double_value"):
-        return val.double_value
-    if val.HasField("bool_value"):
-        return val.bool_value
+    # One WhichOneof() instead of up to four HasField() probes; this runs
+    # for every attribute of every data point / span / log record.
+    kind = val.WhichOneof("value")
+    if kind in _OTEL_SCALAR_VALUE_FIELDS:
+        return getattr(val, kind)
     return str(val)
 
 
@@ -10613,12 +10752,231 @@ def _get_dp_value(dp):
     return 0
 
 
+def _dp_number_value(dp):
+    """Value of a NumberDataPoint (sum / gauge)."""
+    return dp.as_double or dp.as_int
+
+
+def _dp_distribution_value(dp):
+    """Value of a HistogramDataPoint / SummaryDataPoint."""
+    return dp.sum or dp.count
+
+
+def _get_data_points_with_value(metric):
+    """Return ``(data_points, value_fn)`` for a metric.
+
+    Resolves the metric's point type once so the per-point loop calls a
+    type-specific accessor instead of probing ``hasattr`` for every field
+    on every data point (see ``_get_dp_value``).
+    """
+    if metric.HasField("sum"):
+        return metric.sum.data_points, _dp_number_value
+    elif metric.HasField("gauge"):
+        return metric.gauge.data_points, _dp_number_value
+    elif metric.HasField("histogram"):
+        return metric.histogram.data_points, _dp_distribution_value
+    elif metric.HasField("summary"):
+        return metric.summary.data_points, _dp_distribution_value
+    return (), _get_dp_value
+
+
 def _get_dp_attrs(dp):
     """Extract attributes from a data point."""
-    attrs = {}
-    for attr in dp.attributes:
-        attrs[attr.key] = _otel_attr_value(attr.value)
-    return attrs
+    return {attr.key: _otel_attr_value(attr.value) for attr in dp.attributes}
+
+
+def _otlp_tokens_metric(metric, resource_attrs, ts):
+    dps, dp_value = _get_data_points_with_value(metric)
+    for dp in dps:
+        attrs = _get_dp_attrs(dp)
+        _add_metric(
+            "tokens",
+            {
+                "timestamp": ts,
+                "input": attrs.get("input_tokens", 0),
+                "output": attrs.get("output_tokens", 0),
+                "total": dp_value(dp),
+                "model": attrs.get("model", resource_attrs.get("model", "")),
+                "channel": attrs.get("channel", resource_attrs.get("channel", "")),
+                "provider": attrs.get(
+                    "provider", resource_attrs.get("provider", "")
+                ),
+            },
+        )
+
+
+def _otlp_cost_metric(metric, resource_attrs, ts):
+    dps, dp_value = _get_data_points_with_value(metric)
+    for dp in dps:
+        attrs = _get_dp_attrs(dp)
+        _add_metric(
+            "cost",
+            {
+                "timestamp": ts,
+                "usd": dp_value(dp),
+                "model": attrs.get("model", resource_attrs.get("model", "")),
+                "channel": attrs.get("channel", resource_attrs.get("channel", "")),
+                "provider": attrs.get(
+                    "provider", resource_attrs.get("provider", "")
+                ),
+            },
+        )
+
+
+def _otlp_run_duration_metric(metric, resource_attrs, ts):
+    dps, dp_value = _get_data_points_with_value(metric)
+    for dp in dps:
+        attrs = _get_dp_attrs(dp)
+        _add_metric(
+            "runs",
+            {
+                "timestamp": ts,
+                "duration_ms": dp_value(dp),
+                "model": attrs.get("model", resource_attrs.get("model", "")),
+                "channel": attrs.get("channel", resource_attrs.get("channel", "")),
+            },
+        )
+
+
+def _otlp_context_tokens_metric(metric, resource_attrs, ts):
+    dps, dp_value = _get_data_points_with_value(metric)
+    for dp in dps:
+        attrs = _get_dp_attrs(dp)
+        value = dp_value(dp)
+        _add_metric(
+            "tokens",
+            {
+                "timestamp": ts,
+                "input": value,
+                "output": 0,
+                "total": value,
+                "model": attrs.get("model", resource_attrs.get("model", "")),
+                "channel": attrs.get("channel", resource_attrs.get("channel", "")),
+                "provider": attrs.get(
+                    "provider", resource_attrs.get("provider", "")
+                ),
+            },
+        )
+
+
+def _otlp_message_metric(outcome):
+    """Handler for one ``openclaw.message.*`` metric, outcome fixed up front."""
+    with_duration = outcome == "duration"
+
+    def _handle(metric, resource_attrs, ts):
+        dps, dp_value = _get_data_points_with_value(metric)
+        for dp in dps:
+            attrs = _get_dp_attrs(dp)
+            _add_metric(
+                "messages",
+                {
+                    "timestamp": ts,
+                    "channel": attrs.get(
+                        "channel", resource_attrs.get("channel", "")
+                    ),
+                    "outcome": outcome,
+                    "duration_ms": dp_value(dp) if with_duration else 0,
+                },
+            )
+
+    return _handle
+
+
+def _otlp_webhook_metric(wtype):
+    """Handler for one ``openclaw.webhook.*`` metric, type fixed up front."""
+
+    def _handle(metric, resource_attrs, ts):
+        dps, _dp_value = _get_data_points_with_value(metric)
+        for dp in dps:
+            attrs = _get_dp_attrs(dp)
+            _add_metric(
+                "webhooks",
+                {
+                    "timestamp": ts,
+                    "channel": attrs.get(
+                        "channel", resource_attrs.get("channel", "")
+                    ),
+                    "type": wtype,
+                },
+            )
+
+    return _handle
+
+
+# OTel GenAI metric semconv (OpenLLMetry / OTel SDK auto-instrument emit these
+# instead of the openclaw.* names). gen_ai.client.token.usage is a
+# histogram/sum keyed by gen_ai.token.type (input|output);
+# gen_ai.client.operation.duration is the request latency. Map them onto the
+# same tiles as the openclaw.* path so a "bring your own agent" install lights
+# the token / runs tiles.
+def _otlp_genai_token_usage_metric(metric, resource_attrs, ts):
+    dps, dp_value = _get_data_points_with_value(metric)
+    for dp in dps:
+        attrs = _get_dp_attrs(dp)
+        ttype = str(attrs.get("gen_ai.token.type", "")).lower()
+        try:
+            val = int(dp_value(dp))
+        except (TypeError, ValueError):
+            continue
+        model = attrs.get("gen_ai.request.model") or attrs.get(
+            "model", resource_attrs.get("model", "")
+        )
+        provider = attrs.get("gen_ai.system") or attrs.get(
+            "gen_ai.provider.name"
+        ) or attrs.get("provider", resource_attrs.get("provider", ""))
+        _add_metric(
+            "tokens",
+            {
+                "timestamp": ts,
+                "input": val if ttype == "input" else 0,
+                "output": val if ttype == "output" else 0,
+                "total": val,
+                "model": model,
+                "channel": attrs.get("channel", resource_attrs.get("channel", "")),
+                "provider": provider,
+            },
+        )
+
+
+def _otlp_genai_operation_duration_metric(metric, resource_attrs, ts):
+    dps, dp_value = _get_data_points_with_value(metric)
+    for dp in dps:
+        attrs = _get_dp_attrs(dp)
+        try:
+            # semconv unit is seconds; the runs tile stores ms.
+            dur_ms = float(dp_value(dp)) * 1000.0
+        except (TypeError, ValueError):
+            continue
+        model = attrs.get("gen_ai.request.model") or attrs.get(
+            "model", resource_attrs.get("model", "")
+        )
+        _add_metric(
+            "runs",
+            {
+                "timestamp": ts,
+                "duration_ms": dur_ms,
+                "model": model,
+                "channel": attrs.get("channel", resource_attrs.get("channel", "")),
+            },
+        )
+
+
+# metric.name -> handler(metric, resource_attrs, ts). One dict probe per
+# metric; names not listed here are silently dropped.
+_OTLP_METRIC_HANDLERS = {
+    "openclaw.tokens": _otlp_tokens_metric,
+    "openclaw.cost.usd": _otlp_cost_metric,
+    "openclaw.run.duration_ms": _otlp_run_duration_metric,
+    "openclaw.context.tokens": _otlp_context_tokens_metric,
+    "openclaw.message.processed": _otlp_message_metric("processed"),
+    "openclaw.message.queued": _otlp_message_metric("queued"),
+    "openclaw.message.duration_ms": _otlp_message_metric("duration"),
+    "openclaw.webhook.received": _otlp_webhook_metric("received"),
+    "openclaw.webhook.error": _otlp_webhook_metric("error"),
+    "openclaw.webhook.duration_ms": _otlp_webhook_metric("duration"),
+    "gen_ai.client.token.usage": _otlp_genai_token_usage_metric,
+    "gen_ai.client.operation.duration": _otlp_genai_operation_duration_metric,
+}
 
 
 def _process_otlp_metrics(pb_data, content_encoding=None, content_type=None):
@@ -10630,198 +10988,20 @@ def _process_otlp_metrics(pb_data, content_encoding=None, content_type=None):
         content_type,
     )
 
+    handlers = _OTLP_METRIC_HANDLERS
     for resource_metrics in req.resource_metrics:
         resource_attrs = {}
         if resource_metrics.resource:
-            for attr in resource_metrics.resource.attributes:
-                resource_attrs[attr.key] = _otel_attr_value(attr.value)
+            resource_attrs = {
+                attr.key: _otel_attr_value(attr.value)
+                for attr in resource_metrics.resource.attributes
+            }
 
         for scope_metrics in resource_metrics.scope_metrics:
             for metric in scope_metrics.metrics:
-                name = metric.name
-                ts = time.time()
-
-                if name == "openclaw.tokens":
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        _add_metric(
-                            "tokens",
-                            {
-                                "timestamp": ts,
-                                "input": attrs.get("input_tokens", 0),
-                                "output": attrs.get("output_tokens", 0),
-                                "total": _get_dp_value(dp),
-                                "model": attrs.get(
-                                    "model", resource_attrs.get("model", "")
-                                ),
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                                "provider": attrs.get(
-                                    "provider", resource_attrs.get("provider", "")
-                                ),
-                            },
-                        )
-                elif name == "openclaw.cost.usd":
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        _add_metric(
-                            "cost",
-                            {
-                                "timestamp": ts,
-                                "usd": _get_dp_value(dp),
-                                "model": attrs.get(
-                                    "model", resource_attrs.get("model", "")
-                                ),
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                                "provider": attrs.get(
-                                    "provider", resource_attrs.get("provider", "")
-                                ),
-                            },
-                        )
-                elif name == "openclaw.run.duration_ms":
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        _add_metric(
-                            "runs",
-                            {
-                                "timestamp": ts,
-                                "duration_ms": _get_dp_value(dp),
-                                "model": attrs.get(
-                                    "model", resource_attrs.get("model", "")
-                                ),
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                            },
-                        )
-                elif name == "openclaw.context.tokens":
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        _add_metric(
-                            "tokens",
-                            {
-                                "timestamp": ts,
-                                "input": _get_dp_value(dp),
-                                "output": 0,
-                                "total": _get_dp_value(dp),
-                                "model": attrs.get(
-                                    "model", resource_attrs.get("model", "")
-                                ),
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                                "provider": attrs.get(
-                                    "provider", resource_attrs.get("provider", "")
-                                ),
-                            },
-                        )
-                elif name in (
-                    "openclaw.message.processed",
-                    "openclaw.message.queued",
-                    "openclaw.message.duration_ms",
-                ):
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        outcome = (
-                            "processed"
-                            if "processed" in name
-                            else ("queued" if "queued" in name else "duration")
-                        )
-                        _add_metric(
-                            "messages",
-                            {
-                                "timestamp": ts,
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                                "outcome": outcome,
-                                "duration_ms": _get_dp_value(dp)
-                                if "duration" in name
-                                else 0,
-                            },
-                        )
-                elif name in (
-                    "openclaw.webhook.received",
-                    "openclaw.webhook.error",
-                    "openclaw.webhook.duration_ms",
-                ):
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        wtype = (
-                            "received"
-                            if "received" in name
-                            else ("error" if "error" in name else "duration")
-                        )
-                        _add_metric(
-                            "webhooks",
-                            {
-                                "timestamp": ts,
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                                "type": wtype,
-                            },
-                        )
-                # OTel GenAI metric semconv (OpenLLMetry / OTel SDK auto-instrument
-                # emit these instead of the openclaw.* names). gen_ai.client.
-                # token.usage is a histogram/sum keyed by gen_ai.token.type
-                # (input|output); gen_ai.client.operation.duration is the
-                # request latency. Map them onto the same tiles as the
-                # openclaw.* path so a "bring your own agent" install lights the
-                # token / runs tiles. Unknown metrics stay silently dropped.
-                elif name == "gen_ai.client.token.usage":
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        ttype = str(attrs.get("gen_ai.token.type", "")).lower()
-                        try:
-                            val = int(_get_dp_value(dp))
-                        except (TypeError, ValueError):
-                            continue
-                        model = attrs.get("gen_ai.request.model") or attrs.get(
-                            "model", resource_attrs.get("model", "")
-                        )
-                        provider = attrs.get("gen_ai.system") or attrs.get(
-                            "gen_ai.provider.name"
-                        ) or attrs.get("provider", resource_attrs.get("provider", ""))
-                        _add_metric(
-                            "tokens",
-                            {
-                                "timestamp": ts,
-                                "input": val if ttype == "input" else 0,
-                                "output": val if ttype == "output" else 0,
-                                "total": val,
-                                "model": model,
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                                "provider": provider,
-                            },
-                        )
-                elif name == "gen_ai.client.operation.duration":
-                    for dp in _get_data_points(metric):
-                        attrs = _get_dp_attrs(dp)
-                        try:
-                            # semconv unit is seconds; the runs tile stores ms.
-                            dur_ms = float(_get_dp_value(dp)) * 1000.0
-                        except (TypeError, ValueError):
-                            continue
-                        model = attrs.get("gen_ai.request.model") or attrs.get(
-                            "model", resource_attrs.get("model", "")
-                        )
-                        _add_metric(
-                            "runs",
-                            {
-                                "timestamp": ts,
-                                "duration_ms": dur_ms,
-                                "model": model,
-                                "channel": attrs.get(
-                                    "channel", resource_attrs.get("channel", "")
-                                ),
-                            },
-                        )
+                handler = handlers.get(metric.name)
+                if handler is not None:
+                    handler(metric, resource_attrs, time.time())
 
 
 _OTEL_SPAN_KIND_NAMES = {
@@ -11126,6 +11306,29 @@ def _otel_to_row(span, resource_attrs):
     }
 
 
+# Count a "run" for OpenClaw-shaped span names AND for GenAI LLM spans:
+# OpenLLMetry / traceloop-sdk name them ``openai.chat`` / ``anthropic.chat`` /
+# ``<vendor>.completion`` and tag the operation on ``gen_ai.operation.name``.
+# Without this a "bring your own agent" install records spans but the live
+# Runs tile stays at zero.
+_GENAI_RUN_OPERATIONS = frozenset(("chat", "text_completion", "generate_content"))
+
+
+@lru_cache(maxsize=4096)
+def _classify_span_name(name):
+    """Map a span name to the metrics category it feeds: run / message / "".
+
+    Span names come from a small, stable set, so the lowercase + substring
+    checks run once per distinct name instead of once per span.
+    """
+    lo = name.lower()
+    if "run" in lo or "completion" in lo or lo.endswith(".chat"):
+        return "run"
+    if "message" in lo:
+        return "message"
+    return ""
+
+
 def _process_otlp_traces(pb_data, content_encoding=None, content_type=None):
     """Decode OTLP traces protobuf and extract relevant span data.
 
@@ -11169,21 +11372,13 @@ def _process_otlp_traces(pb_data, content_encoding=None, content_type=None):
                 duration_ns = span.end_time_unix_nano - span.start_time_unix_nano
                 duration_ms = duration_ns / 1_000_000
 
-                span_name = span.name.lower()
-                # Count a "run" for OpenClaw-shaped span names AND for GenAI LLM
-                # spans: OpenLLMetry / traceloop-sdk name them ``openai.chat`` /
-                # ``anthropic.chat`` / ``<vendor>.completion`` and tag the
-                # operation on ``gen_ai.operation.name`` (chat / text_completion
-                # / generate_content). Without this a "bring your own agent"
-                # install records spans but the live Runs tile stays at zero.
-                _genai_op = (attrs.get("gen_ai.operation.name") or "").lower()
-                _is_genai_run = (
-                    _genai_op in ("chat", "text_completion", "generate_content")
-                    or span_name.endswith(".chat")
-                    or span_name.endswith(".completion")
-                    or span_name in ("openai.chat", "anthropic.chat")
-                )
-                if "run" in span_name or "completion" in span_name or _is_genai_run:
+                span_kind = _classify_span_name(span.name)
+                if span_kind != "run" and (
+                    (attrs.get("gen_ai.operation.name") or "").lower()
+                    in _GENAI_RUN_OPERATIONS
+                ):
+                    span_kind = "run"
+                if span_kind == "run":
                     _add_metric(
                         "runs",
                         {
@@ -11197,7 +11392,7 @@ def _process_otlp_traces(pb_data, content_encoding=None, content_type=None):
                             ),
                         },
                     )
-                elif "message" in span_name:
+                elif span_kind == "message":
                     _add_metric(
                         "messages",
                         {
@@ -11347,6 +11542,50 @@ def _process_otlp_logs(pb_data, content_encoding=None, content_type=None):
                         pass
 
 
+_day_window_cache = {"window": None}  # (key, bounds, labels)
+
+
+def _local_day_window(today, days_back):
+    """Local-midnight ``bounds`` and ``"YYYY-MM-DD"`` ``labels`` for the last
+    ``days_back`` days through ``today``, oldest first.
+
+    ``bounds`` has one extra entry (tomorrow's midnight) closing the last
+    day. Both depend only on the calendar date, so they are built once per
+    day and shared by every request.
+    """
+    key = (today.toordinal(), days_back)
+    window = _day_window_cache["window"]
+    if window is None or window[0] != key:
+        midnight = today.replace(hour=0, minute=0, second=0, microsecond=0)
+        starts = [midnight - timedelta(days=i) for i in range(days_back, -2, -1)]
+        window = (
+            key,
+            [d.timestamp() for d in starts],
+            [d.strftime("%Y-%m-%d") for d in starts[:-1]],
+        )
+        _day_window_cache["window"] = window
+    return window[1], window[2]
+
+
+def _local_day_bucketer(today, days_back):
+    """Return ``ts -> "YYYY-MM-DD"`` (local time) for the last ``days_back`` days.
+
+    Resolves each timestamp with a bisect over the cached local-midnight
+    boundaries from ``_local_day_window``, so aggregation never calls
+    strftime per entry. Timestamps outside the window fall back to
+    ``datetime.fromtimestamp``.
+    """
+    bounds, labels = _local_day_window(today, days_back)
+
+    def _day_of(ts):
+        i = bisect_right(bounds, ts) - 1
+        if 0 <= i < len(labels):
+            return labels[i]
+        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
+    return _day_of
+
+
 def _get_otel_usage_data():
     """Aggregate OTLP metrics into usage data for the Usage tab."""
     today = datetime.now()
@@ -11363,34 +11602,40 @@ def _get_otel_usage_data():
     daily_tokens = {}
     daily_cost = {}
     model_usage = {}
+    day_of = _local_day_bucketer(today, STORE_RETENTION_DAYS + 1)
 
+    # One lock hold for a consistent snapshot of every category we read;
+    # the aggregation below runs on the copies without blocking writers.
     with _metrics_lock:
-        for entry in metrics_store["tokens"]:
-            ts = entry.get("timestamp", 0)
-            day = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
-            total = entry.get("total", 0)
-            daily_tokens[day] = daily_tokens.get(day, 0) + total
-            model = entry.get("model", "unknown") or "unknown"
-            model_usage[model] = model_usage.get(model, 0) + total
-
-        for entry in metrics_store["cost"]:
-            ts = entry.get("timestamp", 0)
-            day = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
-            daily_cost[day] = daily_cost.get(day, 0) + entry.get("usd", 0)
-
-    days = []
-    for i in range(13, -1, -1):
-        d = today - timedelta(days=i)
-        ds = d.strftime("%Y-%m-%d")
-        days.append(
-            {
-                "date": ds,
-                "tokens": daily_tokens.get(ds, 0),
-                "cost": daily_cost.get(ds, 0),
-            }
-        )
+        tok_snap = list(metrics_store["tokens"])
+        cost_snap = list(metrics_store["cost"])
+        run_snap = list(metrics_store["runs"])
+        msg_count = len(metrics_store["messages"])
+
+    for entry in tok_snap:
+        ts = entry.get("timestamp", 0)
+        day = day_of(ts)
+        total = entry.get("total", 0)
+        daily_tokens[day] = daily_tokens.get(day, 0) + total
+        model = entry.get("model", "unknown") or "unknown"
+        model_usage[model] = model_usage.get(model, 0) + total
+
+    for entry in cost_snap:
+        ts = entry.get("timestamp", 0)
+        day = day_of(ts)
+        daily_cost[day] = daily_cost.get(day, 0) + entry.get("usd", 0)
+
+    day_labels = _local_day_window(today, STORE_RETENTION_DAYS + 1)[1]
+    days = [
+        {
+            "date": ds,
+            "tokens": daily_tokens.get(ds, 0),
+            "cost": daily_cost.get(ds, 0),
+        }
+        for ds in day_labels[-14:]
+    ]
 
-    today_str = today.strftime("%Y-%m-%d")
+    today_str = day_labels[-1]
     today_tok = daily_tokens.get(today_str, 0)
     week_tok = sum(v for k, v in daily_tokens.items() if _safe_date_ts(k) >= week_start)
     month_tok = sum(
@@ -11404,14 +11649,9 @@ def _get_otel_usage_data():
         v for k, v in daily_cost.items() if _safe_date_ts(k) >= month_start
     )
 
-    run_durations = []
-    with _metrics_lock:
-        for entry in metrics_store["runs"]:
-            run_durations.append(entry.get("duration_ms", 0))
+    run_durations = [entry.get("duration_ms", 0) for entry in run_snap]
     avg_run_ms = sum(run_durations) / len(run_durations) if run_durations else 0
 
-    msg_count = len(metrics_store["messages"])
-
     # Enhanced cost tracking for OTLP data
     trend_data = _analyze_usage_trends(daily_tokens)
     model_billing, billing_summary = _build_model_billing(model_usage)
@@ -11913,8 +12153,8 @@ def _detect_workspace_from_config():
     ]
     for cp in config_paths:
         try:
-            with open(cp) as f:
-                data = json.load(f)
+            with open(cp, "rb") as f:
+                data = _json_loads(f.read())
                 ws = data.get("workspace") or data.get("workspaceDir")
                 if ws:
                     return os.path.expanduser(ws)
@@ -12051,21 +12291,33 @@ def get_public_ip():
         return None
 
 
+_local_ip_cache = {"ts": 0.0, "ip": None}
+_LOCAL_IP_TTL = 60  # seconds; the IP is display-only, staleness is harmless
+
+
 def get_local_ip():
-    """Get the machine's LAN IP address."""
+    """Get the machine's LAN IP address (cached for ``_LOCAL_IP_TTL`` s).
+
+    The UDP connect() can block on misconfigured hosts, and the overview /
+    system panels ask on every poll.
+    """
+    now = time.monotonic()
+    if _local_ip_cache["ip"] and now - _local_ip_cache["ts"] < _LOCAL_IP_TTL:
+        return _local_ip_cache["ip"]
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(0.2)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.2)
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
     except (socket.error, OSError) as e:
         # Network unavailable or socket error - common in offline/restricted environments
-        return "127.0.0.1"
+        ip = "127.0.0.1"
     except Exception as e:
         print(f"[warn]  Warning: Unexpected error getting local IP: {e}")
-        return "127.0.0.1"
+        ip = "127.0.0.1"
+    _local_ip_cache["ts"] = now
+    _local_ip_cache["ip"] = ip
+    return ip
 
 
 # ── HTML Template ───────────────────────────────────────────────────────
@@ -12132,20 +12384,20 @@ DASHBOARD_HTML = r"""
   </div>
   {% if legacy_nav %}
   <div class="nav-tabs">
-    <div class="nav-tab" onclick="switchTab('flow')">Flow</div>
-    <div class="nav-tab" onclick="switchTab('brain')">Brain</div>
-    <div class="nav-tab active" onclick="switchTab('overview')">Overview <span id="nav-stuck-badge" style="display:none;background:#ef4444;color:#fff;border-radius:10px;padding:1px 6px;font-size:10px;font-weight:700;margin-left:4px;">0</span></div>
-    <div class="nav-tab" onclick="switchTab('approvals')" title="Cloud-mediated approval queue">Approvals <span id="nav-approvals-badge" style="display:none;background:#ef4444;color:#fff;border-radius:10px;padding:1px 6px;font-size:10px;font-weight:700;margin-left:4px;">0</span></div>
-    <div class="nav-tab" onclick="switchTab('alerts')" title="Get notified when something goes wrong">Alerts <span id="nav-alerts-badge" style="display:none;background:#ef4444;color:#fff;border-radius:10px;padding:1px 6px;font-size:10px;font-weight:700;margin-left:4px;">0</span></div>
-    <div class="nav-tab" onclick="switchTab('notifications')" title="Slack / Email / PagerDuty / Telegram channels">Notifications</div>
-    <div class="nav-tab" onclick="switchTab('context')" title="See what context the LLM receives each turn">Context</div>
-    <div class="nav-tab" onclick="switchTab('usage')">Tokens</div>
-    <div class="nav-tab" id="crons-tab" onclick="switchTab('crons')">Crons</div>
-    <div class="nav-tab" onclick="switchTab('memory')">Memory</div>
-    <div class="nav-tab" onclick="switchTab('security')">Security</div>
-    <div class="nav-tab" id="nemoclaw-tab" onclick="switchTab('nemoclaw')" style="display:none;">NemoClaw</div>
+    <div class="nav-tab" data-tab="flow">Flow</div>
+    <div class="nav-tab" data-tab="brain">Brain</div>
+    <div class="nav-tab active" data-tab="overview">Overview <span id="nav-stuck-badge" style="display:none;background:#ef4444;color:#fff;border-radius:10px;padding:1px 6px;font-size:10px;font-weight:700;margin-left:4px;">0</span></div>
+    <div class="nav-tab" data-tab="approvals" title="Cloud-mediated approval queue">Approvals <span id="nav-approvals-badge" style="display:none;background:#ef4444;color:#fff;border-radius:10px;padding:1px 6px;font-size:10px;font-weight:700;margin-left:4px;">0</span></div>
+    <div class="nav-tab" data-tab="alerts" title="Get notified when something goes wrong">Alerts <span id="nav-alerts-badge" style="display:none;background:#ef4444;color:#fff;border-radius:10px;padding:1px 6px;font-size:10px;font-weight:700;margin-left:4px;">0</span></div>
+    <div class="nav-tab" data-tab="notifications" title="Slack / Email / PagerDuty / Telegram channels">Notifications</div>
+    <div class="nav-tab" data-tab="context" title="See what context the LLM receives each turn">Context</div>
+    <div class="nav-tab" data-tab="usage">Tokens</div>
+    <div class="nav-tab" id="crons-tab" data-tab="crons">Crons</div>
+    <div class="nav-tab" data-tab="memory">Memory</div>
+    <div class="nav-tab" data-tab="security">Security</div>
+    <div class="nav-tab" id="nemoclaw-tab" data-tab="nemoclaw" style="display:none;">NemoClaw</div>
     <!-- History tab hidden until mature -->
-    <!-- <div class="nav-tab" onclick="switchTab('history')">History</div> -->
+    <!-- <div class="nav-tab" data-tab="history">History</div> -->
     {% if v2_enabled %}
     <a class="nav-tab v1-to-v2-link" href="/v2" style="text-decoration:none;color:#E5443A;border-color:rgba(229,68,58,0.35);" title="Open the v2 (beta) dashboard">&#10024; Try v2 (beta) &#8599;</a>
     {% endif %}
@@ -12186,33 +12438,33 @@ DASHBOARD_HTML = r"""
          Tier-1 items, every expert view inside the default-collapsed Developer
          group below, config-ish tabs under Advanced. data-tab ids are STABLE -
          only labels and grouping changed. #}
-      <div class="left-nav-item active" data-tab="overview" onclick="switchTab('overview')" data-i18n-title="nav.home_tooltip" title="Is everything OK, at a glance">
+      <div class="left-nav-item active" data-tab="overview" data-i18n-title="nav.home_tooltip" title="Is everything OK, at a glance">
         <span class="left-nav-icon" aria-hidden="true">&#8962;</span>
         <span class="left-nav-label" data-i18n="nav.home">Home</span>
         <span id="nav-stuck-badge" class="left-nav-badge" style="display:none;">0</span>
       </div>
-      <div class="left-nav-item" data-tab="inventory" onclick="switchTab('inventory')" data-i18n-title="nav.inventory_tooltip" title="Every agent on this machine: what it runs, what it costs, is it alive, who owns it">
+      <div class="left-nav-item" data-tab="inventory" data-i18n-title="nav.inventory_tooltip" title="Every agent on this machine: what it runs, what it costs, is it alive, who owns it">
         <span class="left-nav-icon" aria-hidden="true">&#9783;</span>
         <span class="left-nav-label" data-i18n="nav.inventory">Agents</span>
       </div>
-      <div class="left-nav-item" data-tab="brain" onclick="switchTab('brain')" data-i18n-title="nav.activity_tooltip" title="What your agents are doing right now, step by step">
+      <div class="left-nav-item" data-tab="brain" data-i18n-title="nav.activity_tooltip" title="What your agents are doing right now, step by step">
         <span class="left-nav-icon" aria-hidden="true">&#9679;</span>
         <span class="left-nav-label" data-i18n="nav.brain">Activity</span>
       </div>
-      <div class="left-nav-item" data-tab="usage" onclick="switchTab('usage')" data-i18n-title="nav.cost_tooltip" title="Token spend &amp; cost analytics">
+      <div class="left-nav-item" data-tab="usage" data-i18n-title="nav.cost_tooltip" title="Token spend &amp; cost analytics">
         <span class="left-nav-icon" aria-hidden="true">&#36;</span>
         <span class="left-nav-label" data-i18n="nav.cost">Cost</span>
       </div>
-      <div class="left-nav-item" data-tab="transcripts" onclick="switchTab('transcripts')" data-i18n-title="nav.session_replay_tooltip" title="Conversations across channels (Telegram, Signal, WhatsApp, &hellip;)">
+      <div class="left-nav-item" data-tab="transcripts" data-i18n-title="nav.session_replay_tooltip" title="Conversations across channels (Telegram, Signal, WhatsApp, &hellip;)">
         <span class="left-nav-icon" aria-hidden="true">&#9787;</span>
         <span class="left-nav-label"><span data-i18n="nav.session_replay">Conversations</span> <span class="left-nav-beta" data-i18n="nav.beta">(beta)</span></span>
       </div>
-      <div class="left-nav-item" data-tab="approvals" onclick="switchTab('approvals')" data-i18n-title="nav.approvals_tooltip" title="Cloud-mediated approval queue">
+      <div class="left-nav-item" data-tab="approvals" data-i18n-title="nav.approvals_tooltip" title="Cloud-mediated approval queue">
         <span class="left-nav-icon" aria-hidden="true">&#10003;</span>
         <span class="left-nav-label" data-i18n="nav.approvals">Approvals</span>
         <span id="nav-approvals-badge" class="left-nav-badge" style="display:none;">0</span>
       </div>
-      <div class="left-nav-item" data-tab="alerts" onclick="switchTab('alerts')" data-i18n-title="nav.alerts_tooltip" title="Get notified when something goes wrong with your agents">
+      <div class="left-nav-item" data-tab="alerts" data-i18n-title="nav.alerts_tooltip" title="Get notified when something goes wrong with your agents">
         <span class="left-nav-icon" aria-hidden="true">&#9873;</span>
         <span class="left-nav-label" data-i18n="nav.alerts">Alerts</span>
         <span id="nav-alerts-badge" class="left-nav-badge" style="display:none;">0</span>
@@ -12227,13 +12479,13 @@ DASHBOARD_HTML = r"""
         <button type="button" class="left-nav-group-chevron" id="left-nav-live-toggle" aria-expanded="false" aria-controls="left-nav-live-list" aria-label="Toggle Developer sub-items" onclick="event.stopPropagation(); toggleLiveDrawer();">&#9662;</button>
       </div>
       <div class="left-nav-group-list" id="left-nav-live-list" hidden>
-        <div class="left-nav-item left-nav-item-sub" data-tab="flow" onclick="switchTab('flow')">
+        <div class="left-nav-item left-nav-item-sub" data-tab="flow">
           <span class="left-nav-label" data-i18n="nav.flow">Flow</span>
         </div>
-        <div class="left-nav-item left-nav-item-sub" data-tab="models" onclick="switchTab('models')">
+        <div class="left-nav-item left-nav-item-sub" data-tab="models">
           <span class="left-nav-label" data-i18n="nav.models">Models</span>
         </div>
-        <div class="left-nav-item left-nav-item-sub" data-tab="context" onclick="switchTab('context')" data-i18n-title="nav.llm_context_tooltip" title="What the LLM sees on each turn">
+        <div class="left-nav-item left-nav-item-sub" data-tab="context" data-i18n-title="nav.llm_context_tooltip" title="What the LLM sees on each turn">
           <span class="left-nav-label" data-i18n="nav.llm_context">LLM Context</span>
         </div>
         {# Phase B (UX_AUDIT.md): Tracing, Turn timing and Compare sessions are
@@ -12241,19 +12493,19 @@ DASHBOARD_HTML = r"""
            session drill-down (openSessionDeepDive in app.js, wired into the
            Conversations viewer). Their pages + data-tab ids stay: deep links
            and switchTab('tracing'|'turn-anatomy'|'swimlane') still work. #}
-        <div class="left-nav-item left-nav-item-sub" id="left-nav-agents" data-tab="agents" onclick="switchTab('agents')" title="Cross-session agent spawn topology from span data">
+        <div class="left-nav-item left-nav-item-sub" id="left-nav-agents" data-tab="agents" title="Cross-session agent spawn topology from span data">
           <span class="left-nav-label" data-i18n="nav.agent_graph">Agent Graph</span>
         </div>
-        <div class="left-nav-item left-nav-item-sub" id="left-nav-tool-catalog" data-tab="tool-catalog" onclick="switchTab('tool-catalog')" title="Every tool the agent uses by provenance, with call count and p50/p95 latency">
+        <div class="left-nav-item left-nav-item-sub" id="left-nav-tool-catalog" data-tab="tool-catalog" title="Every tool the agent uses by provenance, with call count and p50/p95 latency">
           <span class="left-nav-label" data-i18n="nav.tools">Tools</span>
         </div>
-        <div class="left-nav-item left-nav-item-sub" id="left-nav-context-economics" data-tab="context-economics" onclick="switchTab('context-economics')" title="Context-window utilization over time, compaction triggers and tokens reclaimed">
+        <div class="left-nav-item left-nav-item-sub" id="left-nav-context-economics" data-tab="context-economics" title="Context-window utilization over time, compaction triggers and tokens reclaimed">
           <span class="left-nav-label" data-i18n="nav.context_usage">Context usage</span>
         </div>
-        <div class="left-nav-item left-nav-item-sub" id="left-nav-harness" data-tab="harness" onclick="switchTab('harness')" title="What the selected runtime uniquely exposes — beyond the generic tabs" style="display:none">
+        <div class="left-nav-item left-nav-item-sub" id="left-nav-harness" data-tab="harness" title="What the selected runtime uniquely exposes — beyond the generic tabs" style="display:none">
           <span class="left-nav-label" data-i18n="nav.runtime_extras">Runtime extras</span>
         </div>
-        <div class="left-nav-item left-nav-item-sub" data-tab="dives" onclick="switchTab('dives')" title="Ask questions about your AI usage in plain English">
+        <div class="left-nav-item left-nav-item-sub" data-tab="dives" title="Ask questions about your AI usage in plain English">
           <span class="left-nav-label" data-i18n="nav.ask">Ask</span>
         </div>
       </div>
@@ -12264,31 +12516,31 @@ DASHBOARD_HTML = r"""
       <span class="left-nav-advanced-chevron" aria-hidden="true">&#9662;</span>
     </button>
     <div class="left-nav-advanced-list" id="left-nav-advanced-list" hidden>
-      <div class="left-nav-item left-nav-item-sub" data-tab="crons" id="crons-tab" onclick="switchTab('crons')" data-i18n-title="nav.crons_tooltip" title="Scheduled agent jobs">
+      <div class="left-nav-item left-nav-item-sub" data-tab="crons" id="crons-tab" data-i18n-title="nav.crons_tooltip" title="Scheduled agent jobs">
         <span class="left-nav-label" data-i18n="nav.crons">Schedules</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="memory" onclick="switchTab('memory')" data-i18n-title="nav.memory_tooltip" title="Persistent memory files the agent reads on boot">
+      <div class="left-nav-item left-nav-item-sub" data-tab="memory" data-i18n-title="nav.memory_tooltip" title="Persistent memory files the agent reads on boot">
         <span class="left-nav-label" data-i18n="nav.memory">Memory</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="notifications" onclick="switchTab('notifications')">
+      <div class="left-nav-item left-nav-item-sub" data-tab="notifications">
         <span class="left-nav-label" data-i18n="nav.notifications">Notifications</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="logs" onclick="switchTab('logs')" title="Live OpenClaw log stream">
+      <div class="left-nav-item left-nav-item-sub" data-tab="logs" title="Live OpenClaw log stream">
         <span class="left-nav-label">Logs</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="security" onclick="switchTab('security')">
+      <div class="left-nav-item left-nav-item-sub" data-tab="security">
         <span class="left-nav-label" data-i18n="nav.security">Security</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="policy" onclick="switchTab('policy')" title="Which tools each agent can run, where they run, and what got approved or blocked">
+      <div class="left-nav-item left-nav-item-sub" data-tab="policy" title="Which tools each agent can run, where they run, and what got approved or blocked">
         <span class="left-nav-label" data-i18n="nav.tool_policy">Tool permissions</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="skills" onclick="switchTab('skills')">
+      <div class="left-nav-item left-nav-item-sub" data-tab="skills">
         <span class="left-nav-label" data-i18n="nav.skills">Skills</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="selfevolve" onclick="switchTab('selfevolve')">
+      <div class="left-nav-item left-nav-item-sub" data-tab="selfevolve">
         <span class="left-nav-label" data-i18n="nav.self_evolve">Self-Evolve</span>
       </div>
-      <div class="left-nav-item left-nav-item-sub" data-tab="version-impact" onclick="switchTab('version-impact')">
+      <div class="left-nav-item left-nav-item-sub" data-tab="version-impact">
         <span class="left-nav-label" data-i18n="nav.version_impact">Version impact</span>
       </div>
       <!-- Rate limits tab removed: cloud endpoint is hard-disabled by design
@@ -12298,7 +12550,7 @@ DASHBOARD_HTML = r"""
            clawmetry.track interceptor. Per-provider spend already lives on
            the Cost tab; 429s surface in Brain + Reliability. The
            /api/rate-limits endpoint stays for power users scripting it. -->
-      <div class="left-nav-item left-nav-item-sub" data-tab="nemoclaw" id="nemoclaw-tab" onclick="switchTab('nemoclaw')" style="display:none;">
+      <div class="left-nav-item left-nav-item-sub" data-tab="nemoclaw" id="nemoclaw-tab" style="display:none;">
         <span class="left-nav-label">NemoClaw</span>
       </div>
     </div>
@@ -12408,7 +12660,7 @@ DASHBOARD_HTML = r"""
 {% endif %}
 <script src="{{ url_for('static', filename='js/i18n.js', v=version) }}"></script>
 <script src="{{ url_for('static', filename='js/runtime-logos.js', v=version) }}"></script>
-<script src="{{ url_for('static', filename='js/app.js', v=version) }}"></script>
+<script src="{{ url_for('static', filename='js/app.js', v=app_js_v or version) }}"></script>
 </div> <!-- end zoom-wrapper -->
 
 <!-- Component Detail Modal -->
@@ -14093,6 +14345,153 @@ def _score_cron_match(session, job):
     return score
 
 
+# Per-transcript parse state for _compute_transcript_analytics, keyed by path.
+# Transcripts are append-only, so a refresh parses only the bytes added since
+# the stored offset and folds them into that file's running aggregates; a
+# file that shrank, was replaced (new inode) or was rewritten at the same
+# size is parsed again from the top. The lock keeps two concurrent refreshes
+# from folding the same bytes twice.
+_transcript_file_state: dict = {}
+_transcript_scan_lock = threading.Lock()
+_TRANSCRIPT_SEARCH_TEXT_MAX = 12000
+
+
+def _new_transcript_state(st):
+    return {
+        "ino": st.st_ino,
+        "offset": 0,
+        "mtime": None,
+        "tokens": 0,
+        "cost": 0.0,
+        "model": "unknown",
+        "start": None,
+        "end": None,
+        "search_text": "",
+        "cron_refs": set(),
+        "daily_tokens": {},
+        "daily_cost": {},
+        "plugin_stats": {},
+        "plugin_daily_stats": {},
+    }
+
+
+def _fold_transcript_event(state, obj, fallback_dt):
+    """Fold one parsed transcript line into its file's running aggregates."""
+    ts = _parse_event_timestamp(
+        obj.get("timestamp") or obj.get("time") or obj.get("created_at"),
+        fallback_dt,
+    )
+    if ts:
+        if state["start"] is None or ts < state["start"]:
+            state["start"] = ts
+        if state["end"] is None or ts > state["end"]:
+            state["end"] = ts
+
+    # Collect cron hints from metadata and known custom session-info events
+    _collect_cron_refs(obj, state["cron_refs"])
+
+    message = obj.get("message", {}) if isinstance(obj.get("message"), dict) else {}
+    model = message.get("model") or obj.get("model")
+    if model:
+        state["model"] = model
+
+    usage_metrics = _extract_usage_metrics(obj)
+    tokens = usage_metrics["tokens"]
+    cost = usage_metrics["cost"]
+
+    if tokens > 0:
+        state["tokens"] += tokens
+        if cost > 0:
+            state["cost"] += cost
+
+        # Bucket to this event's actual date, not the session start date, so
+        # a long-running session's total doesn't pile onto the day it began.
+        # Plugin trend lines (GH#201) use the same day as the 14-day chart.
+        day = (ts or fallback_dt).strftime("%Y-%m-%d")
+        state["daily_tokens"][day] = state["daily_tokens"].get(day, 0) + tokens
+        state["daily_cost"][day] = state["daily_cost"].get(day, 0.0) + cost
+
+        plugins = _extract_tool_plugins(obj)
+        if plugins:
+            share_tokens = float(tokens) / float(len(plugins))
+            share_cost = float(cost) / float(len(plugins)) if cost > 0 else 0.0
+            day_stats = state["plugin_daily_stats"].setdefault(day, {})
+            for p in plugins:
+                for bucket in (state["plugin_stats"], day_stats):
+                    stats = bucket.setdefault(p, {"tokens": 0.0, "cost": 0.0, "calls": 0})
+                    stats["tokens"] += share_tokens
+                    stats["cost"] += share_cost
+                    stats["calls"] += 1
+
+    # Textual hints for cron matching. Only the first 12000 chars are kept,
+    # so once that is full the rest of the file skips this work.
+    text = state["search_text"]
+    if len(text) >= _TRANSCRIPT_SEARCH_TEXT_MAX:
+        return
+    parts = []
+    if obj.get("customType") == "openclaw.session-info":
+        parts.append(json.dumps(obj.get("data", {}), default=str).lower())
+    if isinstance(message.get("content"), list):
+        for part in message.get("content", []):
+            if isinstance(part, dict):
+                txt = part.get("text")
+                if isinstance(txt, str) and txt:
+                    parts.append(txt.lower())
+    if obj.get("type") == "custom":
+        try:
+            parts.append(json.dumps(obj, default=str).lower())
+        except Exception:
+            pass
+    for part in parts:
+        text = f"{text} {part}" if text else part
+        if len(text) >= _TRANSCRIPT_SEARCH_TEXT_MAX:
+            text = text[:_TRANSCRIPT_SEARCH_TEXT_MAX]
+            break
+    state["search_text"] = text
+
+
+def _scan_transcript_file(fpath, state):
+    """Bring ``state`` up to date with ``fpath``; returns the state to keep."""
+    st = os.stat(fpath)
+    if (
+        state is None
+        or state["ino"] != st.st_ino
+        or st.st_size < state["offset"]
+        or (st.st_size == state["offset"] and st.st_mtime != state["mtime"])
+    ):
+        state = _new_transcript_state(st)
+    fallback_dt = datetime.fromtimestamp(st.st_mtime)
+    if st.st_size > state["offset"]:
+        with open(fpath, "rb") as f:
+            f.seek(state["offset"])
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].split(b"\n")
+        tail = data[end:]
+        consumed = end
+        # An unterminated last line is taken only once it parses; a writer
+        # mid-line leaves it for the next refresh to read whole.
+        if tail.strip():
+            try:
+                _json_loads(tail)
+                lines.append(tail)
+                consumed = len(data)
+            except Exception:
+                pass
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                obj = _json_loads(line)
+            except Exception:
+                continue
+            if isinstance(obj, dict):
+                _fold_transcript_event(state, obj, fallback_dt)
+        state["offset"] += consumed
+    state["mtime"] = st.st_mtime
+    return state
+
+
 def _compute_transcript_analytics():
     """Parse transcript files once for usage, anomalies, cron attribution, and plugin breakdown."""
     now = time.time()
@@ -14101,7 +14500,16 @@ def _compute_transcript_analytics():
         and (now - _transcript_analytics_cache["ts"]) < _TRANSCRIPT_ANALYTICS_TTL
     ):
         return _transcript_analytics_cache["data"]
+    with _transcript_scan_lock:
+        if (
+            _transcript_analytics_cache["data"] is not None
+            and (now - _transcript_analytics_cache["ts"]) < _TRANSCRIPT_ANALYTICS_TTL
+        ):
+            return _transcript_analytics_cache["data"]
+        return _scan_transcript_analytics(now)
 
+
+def _scan_transcript_analytics(now):
     sessions_dir = _get_sessions_dir()
     summaries = []
     plugin_stats = defaultdict(lambda: {"tokens": 0.0, "cost": 0.0, "calls": 0})
@@ -14109,6 +14517,7 @@ def _compute_transcript_analytics():
     daily_tokens = {}
     daily_cost = {}
     model_usage = {}
+    seen = set()
 
     if os.path.isdir(sessions_dir):
         for fname in os.listdir(sessions_dir):
@@ -14126,139 +14535,63 @@ def _compute_transcript_analytics():
                 continue
             sid = fname.split(".jsonl", 1)[0]
             fpath = os.path.join(sessions_dir, fname)
-            fallback_dt = datetime.fromtimestamp(os.path.getmtime(fpath))
-
-            s_tokens = 0
-            s_cost = 0.0
-            s_model = "unknown"
-            s_start = None
-            s_end = None
-            search_parts = []
-            explicit_cron_refs = set()
 
             try:
-                with open(fpath, "r") as f:
-                    for line in f:
-                        try:
-                            obj = json.loads(line.strip())
-                        except Exception:
-                            continue
-
-                        ts = _parse_event_timestamp(
-                            obj.get("timestamp")
-                            or obj.get("time")
-                            or obj.get("created_at"),
-                            fallback_dt,
-                        )
-                        if ts:
-                            if s_start is None or ts < s_start:
-                                s_start = ts
-                            if s_end is None or ts > s_end:
-                                s_end = ts
-
-                        # Collect cron hints from metadata and known custom session-info events
-                        _collect_cron_refs(obj, explicit_cron_refs)
-                        if obj.get("customType") == "openclaw.session-info":
-                            search_parts.append(
-                                json.dumps(obj.get("data", {}), default=str).lower()
-                            )
-
-                        message = (
-                            obj.get("message", {})
-                            if isinstance(obj.get("message"), dict)
-                            else {}
-                        )
-                        model = message.get("model") or obj.get("model")
-                        if model:
-                            s_model = model
-
-                        usage_metrics = _extract_usage_metrics(obj)
-                        tokens = usage_metrics["tokens"]
-                        cost = usage_metrics["cost"]
-
-                        if tokens > 0:
-                            s_tokens += tokens
-                            if cost > 0:
-                                s_cost += cost
-
-                            # Bucket to this event's actual date, not the
-                            # session start date. Fixes the bug where a
-                            # long-running session's entire token total
-                            # piled onto the day the session started.
-                            _ev_date = (ts or fallback_dt).strftime("%Y-%m-%d")
-                            daily_tokens[_ev_date] = daily_tokens.get(_ev_date, 0) + tokens
-                            daily_cost[_ev_date] = daily_cost.get(_ev_date, 0.0) + cost
-
-                            plugins = _extract_tool_plugins(obj)
-                            if plugins:
-                                share_tokens = float(tokens) / float(len(plugins))
-                                share_cost = (
-                                    float(cost) / float(len(plugins))
-                                    if cost > 0
-                                    else 0.0
-                                )
-                                # Track daily breakdown for trend analysis (GH#201)
-                                # use the event's actual day so trend lines
-                                # match the headline 14-day chart.
-                                _ev_day = (ts or fallback_dt).strftime("%Y-%m-%d")
-                                for p in plugins:
-                                    plugin_stats[p]["tokens"] += share_tokens
-                                    plugin_stats[p]["cost"] += share_cost
-                                    plugin_stats[p]["calls"] += 1
-                                    if _ev_day not in plugin_daily_stats:
-                                        plugin_daily_stats[_ev_day] = {}
-                                    if p not in plugin_daily_stats[_ev_day]:
-                                        plugin_daily_stats[_ev_day][p] = {"tokens": 0.0, "cost": 0.0, "calls": 0}
-                                    plugin_daily_stats[_ev_day][p]["tokens"] += share_tokens
-                                    plugin_daily_stats[_ev_day][p]["cost"] += share_cost
-                                    plugin_daily_stats[_ev_day][p]["calls"] += 1
-
-                        # Textual hints for cron matching
-                        if isinstance(message.get("content"), list):
-                            for part in message.get("content", []):
-                                if isinstance(part, dict):
-                                    txt = part.get("text")
-                                    if isinstance(txt, str) and txt:
-                                        search_parts.append(txt.lower())
-                        if obj.get("type") == "custom":
-                            try:
-                                search_parts.append(
-                                    json.dumps(obj, default=str).lower()
-                                )
-                            except Exception:
-                                pass
-
-                if s_start is None:
-                    s_start = fallback_dt
-                if s_end is None:
-                    s_end = fallback_dt
-
-                # daily_tokens/daily_cost are now populated per-event above
-                # (bucketed by each event's timestamp, not the session start).
-                # Only model_usage still aggregates per-session.
-                model_usage[s_model] = model_usage.get(s_model, 0) + s_tokens
-
-                search_text = " ".join(search_parts)
-                if len(search_text) > 12000:
-                    search_text = search_text[:12000]
-
-                summaries.append(
-                    {
-                        "session_id": sid,
-                        "tokens": s_tokens,
-                        "cost_usd": s_cost,
-                        "model": s_model,
-                        "start_ts": s_start.timestamp() if s_start else 0,
-                        "end_ts": s_end.timestamp() if s_end else 0,
-                        "day": s_start.strftime("%Y-%m-%d") if s_start else fallback_dt.strftime("%Y-%m-%d"),
-                        "search_text": search_text,
-                        "explicit_cron_refs": explicit_cron_refs,
-                        "is_cron_candidate": ("cron" in search_text)
-                        or bool(explicit_cron_refs),
-                    }
-                )
+                state = _scan_transcript_file(fpath, _transcript_file_state.get(fpath))
             except Exception:
+                _transcript_file_state.pop(fpath, None)
                 continue
+            _transcript_file_state[fpath] = state
+            seen.add(fpath)
+
+            fallback_dt = datetime.fromtimestamp(state["mtime"])
+            s_start = state["start"] or fallback_dt
+            s_end = state["end"] or fallback_dt
+            s_tokens = state["tokens"]
+            s_model = state["model"]
+
+            for day, tokens in state["daily_tokens"].items():
+                daily_tokens[day] = daily_tokens.get(day, 0) + tokens
+            for day, cost in state["daily_cost"].items():
+                daily_cost[day] = daily_cost.get(day, 0.0) + cost
+            for p, stats in state["plugin_stats"].items():
+                totals = plugin_stats[p]
+                totals["tokens"] += stats["tokens"]
+                totals["cost"] += stats["cost"]
+                totals["calls"] += stats["calls"]
+            for day, by_plugin in state["plugin_daily_stats"].items():
+                day_totals = plugin_daily_stats.setdefault(day, {})
+                for p, stats in by_plugin.items():
+                    totals = day_totals.setdefault(p, {"tokens": 0.0, "cost": 0.0, "calls": 0})
+                    totals["tokens"] += stats["tokens"]
+                    totals["cost"] += stats["cost"]
+                    totals["calls"] += stats["calls"]
+
+            # daily_tokens/daily_cost are bucketed per event; only
+            # model_usage still aggregates per-session.
+            model_usage[s_model] = model_usage.get(s_model, 0) + s_tokens
+
+            search_text = state["search_text"]
+            explicit_cron_refs = set(state["cron_refs"])
+            summaries.append(
+                {
+                    "session_id": sid,
+                    "tokens": s_tokens,
+                    "cost_usd": state["cost"],
+                    "model": s_model,
+                    "start_ts": s_start.timestamp(),
+                    "end_ts": s_end.timestamp(),
+                    "day": s_start.strftime("%Y-%m-%d"),
+                    "search_text": search_text,
+                    "explicit_cron_refs": explicit_cron_refs,
+                    "is_cron_candidate": ("cron" in search_text)
+                    or bool(explicit_cron_refs),
+                }
+            )
+
+    # Deleted or renamed transcripts drop their state.
+    for fpath in [p for p in _transcript_file_state if p not in seen]:
+        del _transcript_file_state[fpath]
 
     summaries.sort(key=lambda s: s.get("start_ts", 0))
     result = {
@@ -14678,14 +15011,14 @@ def _build_cost_comparison():
     model_token_map = {}  # model -> tokens
 
     with _metrics_lock:
-        for entry in metrics_store.get("tokens", []):
+        for entry in list(metrics_store.get("tokens", ())):
             if entry.get("timestamp", 0) >= month_start:
                 tok = float(entry.get("total", 0) or 0)
                 actual_tokens += tok
                 m = entry.get("model", "")
                 if m:
                     model_token_map[m] = model_token_map.get(m, 0) + tok
-        for entry in metrics_store.get("cost", []):
+        for entry in list(metrics_store.get("cost", ())):
             if entry.get("timestamp", 0) >= month_start:
                 actual_cost += float(entry.get("usd", 0) or 0)
 
@@ -16862,13 +17195,10 @@ def _estimate_usd_per_token():
     start = now - 86400
     total_tokens = 0.0
     total_cost = 0.0
-    with _metrics_lock:
-        for t in metrics_store.get("tokens", []):
-            if t.get("timestamp", 0) >= start:
-                total_tokens += float(t.get("total", 0) or 0)
-        for c in metrics_store.get("cost", []):
-            if c.get("timestamp", 0) >= start:
-                total_cost += float(c.get("usd", 0) or 0)
+    for t in _metrics_since("tokens", start):
+        total_tokens += float(t.get("total", 0) or 0)
+    for c in _metrics_since("cost", start):
+        total_cost += float(c.get("usd", 0) or 0)
     if total_tokens > 0 and total_cost > 0:
         return total_cost / total_tokens
     return 3.0 / 1_000_000.0
@@ -17247,7 +17577,7 @@ def _get_cost_summary():
     costs = {"today": 0, "week": 0, "month": 0, "projected": 0}
 
     with _metrics_lock:
-        for entry in metrics_store.get("cost", []):
+        for entry in list(metrics_store.get("cost", ())):
             entry_date = datetime.fromtimestamp(
                 entry.get("timestamp", 0) / 1000, CET
             ).strftime("%Y-%m-%d")
@@ -17395,7 +17725,7 @@ def _generate_cost_recommendations(costs, local_models):
 
     # Low-stakes task identification
     with _metrics_lock:
-        recent_calls = metrics_store.get("tokens", [])[-100:]  # Last 100 calls
+        recent_calls = _metrics_tail("tokens", 100)  # Last 100 calls
         high_cost_calls = [c for c in recent_calls if c.get("total", 0) > 10000]
         if len(high_cost_calls) > 20:
             recommendations.append(
@@ -17416,8 +17746,8 @@ def _get_expensive_operations():
 
     with _metrics_lock:
         # Combine cost and token data
-        recent_tokens = metrics_store.get("tokens", [])[-50:]
-        recent_costs = metrics_store.get("cost", [])[-50:]
+        recent_tokens = _metrics_tail("tokens", 50)
+        recent_costs = _metrics_tail("cost", 50)
 
         # Match tokens with costs by timestamp (approximate)
         for cost_entry in recent_costs:
@@ -1,5 +1,5 @@
 """
-helpers/system.py — Portable system uptime helpers.
+helpers/system.py — Portable system uptime, disk and memory helpers.
 
 The legacy callers shelled out to `uptime -p`, which only exists on
 GNU/coreutils (Linux). On macOS / BSD `uptime` has no `-p` flag and the
@@ -18,8 +18,10 @@ the legacy `uptime -p` output the dashboard JS expects.
 
 from __future__ import annotations
 
+import math
 import os
 import re
+import shutil
 import subprocess
 import sys
 import time
@@ -124,3 +126,70 @@ def format_uptime(seconds: int | None) -> str:
 def uptime_pretty() -> str:
     """Convenience: portable replacement for `subprocess.run(['uptime', '-p'])`."""
     return format_uptime(uptime_seconds())
+
+
+# ── Disk / memory without forking df / free ────────────────────────────────
+# /api/overview used to shell out to `df -h /` and `free -h` on every miss;
+# these read the same numbers from statvfs and /proc/meminfo and format them
+# the way those tools do, so the rendered strings don't change.
+
+
+def human_size(n: float, suffix: str = "") -> str:
+    """Format a byte count like ``df -h`` ("20G", "3.5G"); ``free -h``
+    output is ``human_size(n, "i")`` ("15Gi").
+
+    Powers of 1024, rounded up, one decimal below 10.
+    """
+    units = ("B", "K", "M", "G", "T", "P")
+    v = float(n)
+    i = 0
+    while v >= 1024 and i < len(units) - 1:
+        v /= 1024.0
+        i += 1
+    if i == 0:
+        return f"{int(v)}B"
+    tenths = math.ceil(v * 10) / 10
+    if tenths < 10:
+        return f"{tenths:.1f}{units[i]}{suffix}"
+    return f"{math.ceil(v)}{units[i]}{suffix}"
+
+
+def disk_usage(path: str = "/") -> tuple[int, int, int] | None:
+    """``(total_bytes, used_bytes, use_pct)`` for ``path``, or None.
+
+    ``use_pct`` follows df: used / (used + available to non-root), rounded up.
+    """
+    try:
+        du = shutil.disk_usage(path)
+    except Exception:
+        return None
+    denom = du.used + du.free
+    pct = math.ceil(du.used * 100 / denom) if denom else 0
+    return du.total, du.used, pct
+
+
+def memory_usage() -> tuple[int, int] | None:
+    """``(total_bytes, used_bytes)`` of RAM, or None if unknown.
+
+    Used is total minus MemAvailable, as procps ``free`` reports it. Reads
+    /proc/meminfo on Linux, psutil elsewhere when it is installed.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            info = {}
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    if key in ("MemTotal", "MemAvailable"):
+                        info[key] = int(rest.split()[0]) * 1024
+            total = info["MemTotal"]
+            return total, total - info["MemAvailable"]
+        except Exception:
+            pass
+    try:
+        import psutil  # type: ignore
+
+        vm = psutil.virtual_memory()
+        return int(vm.total), int(vm.total - vm.available)
+    except Exception:
+        return None
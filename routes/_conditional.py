@@ -0,0 +1,147 @@
+"""routes/_conditional.py — ETag revalidation + short-TTL memo for polled JSON.
+
+The Overview tab re-polls ``/api/overview``, ``/api/usage`` and ``/api/logs``
+on every refresh, and several tabs may be open at once. Two helpers keep
+that cheap:
+
+* ``conditional_json`` stamps a content ETag with ``Cache-Control: no-cache``,
+  so the browser revalidates each poll and an unchanged payload comes back
+  as a bodyless 304.
+  Bodies are encoded with orjson when it is installed and gzipped when the
+  client accepts it and the body is big enough to be worth it.
+* ``TTLMemo`` memoizes a payload for a couple of seconds per key and
+  coalesces concurrent misses, so N tabs refreshing together compute once.
+
+Usage::
+
+    from routes._conditional import TTLMemo, conditional_json
+
+    _memo = TTLMemo(2.0)
+
+    @bp.route("/api/thing")
+    def api_thing():
+        return conditional_json(_memo.get("thing", _compute_thing))
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import time
+
+from flask import Response, current_app, jsonify, request
+
+# Optional, as in dashboard.py: orjson encodes the sub-agent and log payloads
+# several times faster than the stdlib. Falls back to Flask's encoder.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Below this a gzip round-trip costs more than the bytes it saves.
+GZIP_MIN_BYTES = 4096
+
+
+def _json_default():
+    """Flask's ``default`` hook for values JSON can't encode natively.
+
+    ``app.json`` (the JSON provider) arrived in Flask 2.2; older releases
+    expose the encoder class as ``app.json_encoder`` instead.
+    """
+    provider = getattr(current_app, "json", None)
+    if provider is not None:
+        return provider.default
+    return current_app.json_encoder().default
+
+
+def json_body(payload):
+    """Serialize ``payload`` to JSON bytes for a response body.
+
+    orjson when installed; anything it can't encode natively goes through
+    Flask's provider ``default`` (so dates keep their usual format), and
+    whatever still fails (ints past 64 bits, say) is left to ``jsonify``.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(
+                payload,
+                default=_json_default(),
+                option=_orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            pass
+    return jsonify(payload).get_data()
+
+
+def send_json(body, etag=None):
+    """Revalidatable JSON response for pre-serialized ``body`` bytes.
+
+    ``etag`` defaults to a blake2b of the body. A matching ``If-None-Match``
+    is answered 304 before anything is compressed.
+    """
+    if etag is None:
+        etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+    resp = Response(mimetype="application/json")
+    if len(body) >= GZIP_MIN_BYTES and request.accept_encodings["gzip"]:
+        etag += "-gz"
+        resp.vary.add("Accept-Encoding")
+        if not request.if_none_match.contains(etag):
+            body = gzip.compress(body, compresslevel=6)
+            resp.headers["Content-Encoding"] = "gzip"
+    resp.set_data(body)
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+
+def conditional_json(payload):
+    """JSON response for ``payload`` with a content ETag, 304 on a match."""
+    return send_json(json_body(payload))
+
+
+class TTLMemo:
+    """Per-key ``(monotonic_ts, value)`` memo with single-flight misses.
+
+    A miss takes that key's lock and re-checks before computing, so callers
+    that arrive while the first one is computing wait and share its result
+    instead of repeating the work. Exceptions propagate and cache nothing.
+    """
+
+    MAX_KEYS = 64
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict = {}
+        self._locks: dict = {}
+        self._guard = threading.Lock()
+
+    def _fresh(self, key):
+        hit = self._entries.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.ttl:
+            return hit
+        return None
+
+    def get(self, key, compute):
+        hit = self._fresh(key)
+        if hit is not None:
+            return hit[1]
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            hit = self._fresh(key)
+            if hit is not None:
+                return hit[1]
+            value = compute()
+            now = time.monotonic()
+            if len(self._entries) >= self.MAX_KEYS:
+                # Keys come from query args; drop expired ones so arbitrary
+                # parameter values can't grow the memo without bound.
+                for k in [k for k, v in self._entries.items() if now - v[0] >= self.ttl]:
+                    self._entries.pop(k, None)
+                    self._locks.pop(k, None)
+            self._entries[key] = (now, value)
+            return value
+
+    def clear(self):
+        self._entries.clear()
@@ -6,7 +6,7 @@ Owns the routes registered on bp_health:
 
   GET  /healthz                   — liveness probe (k8s / load-balancer, unauthenticated)
   GET  /api/reliability           — cross-session behavioral reliability trend
-  GET  /api/heatmap               — activity heatmap (events per hour, N days)
+  GET  /api/heatmap               — activity heatmap (events per hour, N days; ?format=q8 packed)
   GET  /api/system-health         — comprehensive system health (services, disks, crons)
   GET  /api/health                — health check panel (gateway/disk/memory/uptime/otel)
   GET  /api/diagnostics           — detected configuration snapshot
@@ -37,6 +37,7 @@ Module-level helpers (``_history_db``, ``AgentReliabilityScorer``,
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import os
@@ -946,18 +947,42 @@ def _try_local_store_heatmap(n_days: int):
     }
 
 
+def _pack_heatmap_q8(payload: dict) -> dict:
+    """Replace the per-day ``hours`` lists with one base64 ``q`` string of
+    uint8 intensities (``round(255 * v / max)``, day-major, 24 per day).
+
+    A 90-day grid is 2160 JSON numbers; packed it is ~2.9KB of base64 the
+    client decodes into a ``Uint8Array``. Counts decode back exactly as
+    ``round(q * max / 255)`` whenever ``max <= 255`` (the step is then < 1).
+    Any non-zero count packs to at least 1 so it never shades as idle.
+    """
+    max_val = payload.get("max") or 0
+    scale = 255.0 / max_val if max_val else 0.0
+    q = bytes(
+        max(1, int(v * scale + 0.5)) if v else 0
+        for day in payload["days"]
+        for v in day["hours"]
+    )
+    out = {k: v for k, v in payload.items() if k != "days"}
+    out["labels"] = [day["label"] for day in payload["days"]]
+    out["q"] = base64.b64encode(q).decode("ascii")
+    return out
+
+
 @bp_health.route("/api/heatmap")
 def api_heatmap():
     """Activity heatmap - events per hour for the last N days (default 7, max 90).
 
     Query params:
-      days: int  number of days to show (1-90, default 7)
+      days: int     number of days to show (1-90, default 7)
+      format: str   ``q8`` to receive the grid packed by ``_pack_heatmap_q8``
     """
     import dashboard as _d
     try:
         n_days = max(1, min(90, int(request.args.get("days", 7))))
     except (ValueError, TypeError):
         n_days = 7
+    packed = request.args.get("format") == "q8"
 
     # Epic #964 / Issue #1088 — opt-in DuckDB fast path. When
     # CLAWMETRY_LOCAL_STORE_READ=1 AND the store has events in the window,
@@ -966,7 +991,7 @@ def api_heatmap():
     if is_local_store_read_enabled():
         fast = _try_local_store_heatmap(n_days)
         if fast is not None:
-            return jsonify(fast)
+            return jsonify(_pack_heatmap_q8(fast) if packed else fast)
 
     now = datetime.now()
     # Initialize N days × 24 hours grid
@@ -1072,7 +1097,8 @@ def api_heatmap():
     for dl in day_labels:
         days_out.append({"label": dl["label"], "hours": grid.get(dl["date"], [0] * 24)})
 
-    return jsonify({"days": days_out, "max": max_val, "n_days": n_days})
+    payload = {"days": days_out, "max": max_val, "n_days": n_days}
+    return jsonify(_pack_heatmap_q8(payload) if packed else payload)
 
 
 @bp_health.route("/api/system-health")
@@ -5,7 +5,8 @@ Extracted from dashboard.py as Phase 5.11 of the incremental modularisation.
 Four related Blueprints bundled because each is small (3–4 routes) and they
 are logically adjacent observability concerns:
 
-  bp_logs     (4 routes) — /api/logs, /api/flow[-events], /api/logs-stream
+  bp_logs     (5 routes) — /api/logs, /api/logs/stats, /api/flow[-events],
+                           /api/logs-stream
   bp_memory   (4 routes) — /api/memory[-files], /api/file, /api/memory-analytics
   bp_security (3 routes) — /api/security/{threats,signatures,posture}
   bp_config   (4 routes) — /api/llmfit, /api/cost-optimizer, /api/cost-optimization,
@@ -26,14 +27,18 @@ mechanical move — zero behaviour change.
 
 import json
 import os
+import re
 import sqlite3
 import subprocess
+import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 
 from flask import Blueprint, Response, jsonify, request
 from clawmetry._gate import gate
 from clawmetry.config import is_local_store_read_enabled, hide_clawmetry_session
+from routes._conditional import TTLMemo, conditional_json
 
 bp_logs = Blueprint('logs', __name__)
 bp_memory = Blueprint('memory', __name__)
@@ -90,13 +95,30 @@ bp_config = Blueprint('config', __name__)
 # ── Logs / Flow SSE ────────────────────────────────────────────────────────
 
 
+# Overview and Logs both poll the same tail; a 2s memo per query shape
+# means N open tabs read the log file once per window, not N times.
+_LOGS_MEMO_TTL_SECONDS = 2.0
+_logs_memo = TTLMemo(_LOGS_MEMO_TTL_SECONDS)
+
+
 @bp_logs.route("/api/logs")
 def api_logs():
-    import dashboard as _d
     lines_count = int(request.args.get("lines", 100))
     date_str = request.args.get("date", datetime.now().strftime("%Y-%m-%d"))
     hour_start = request.args.get("hour_start", None)
     hour_end = request.args.get("hour_end", None)
+    return conditional_json(_logs_payload(lines_count, date_str, hour_start, hour_end))
+
+
+def _logs_payload(lines_count, date_str, hour_start=None, hour_end=None):
+    key = (lines_count, date_str, hour_start, hour_end)
+    return _logs_memo.get(
+        key, lambda: _read_logs(lines_count, date_str, hour_start, hour_end)
+    )
+
+
+def _read_logs(lines_count, date_str, hour_start, hour_end):
+    import dashboard as _d
     log_file = _d._find_log_file(date_str)
     lines = []
     if log_file:
@@ -127,7 +149,124 @@ def api_logs():
         _d._ext_emit("log.ingested", {"count": len(lines)})
     except Exception:
         pass
-    return jsonify({"lines": lines, "date": date_str})
+    return {"lines": lines, "date": date_str}
+
+
+# Tool Activity card stats over the last ``_LOG_STATS_WINDOW`` log lines.
+# Each line is classified once as it is appended: a call re-reads only the
+# bytes added since the previous one, and an unchanged (size, mtime) returns
+# the stored result without touching the file.
+_LOG_STATS_WINDOW = 100
+# Larger deltas are re-seeded from the tail instead of read in full.
+_LOG_STATS_MAX_DELTA = _LOG_STATS_WINDOW * 2000
+_LOG_TOOL_LINE_RE = re.compile(r"tool|invoke")
+_LOG_TOOL_KINDS = (
+    ("exec", re.compile(r"exec|shell")),
+    ("browser", re.compile(r"browser|screenshot")),
+    ("search", re.compile(r"web_search|web_fetch")),
+)
+_log_stats = {
+    "path": None, "ino": None, "size": 0, "mtime": None, "offset": 0,
+    "window": deque(maxlen=_LOG_STATS_WINDOW), "stats": None,
+}
+_log_stats_lock = threading.Lock()
+
+
+def _classify_log_line(line):
+    """Tool kind for one log line, ``"other"`` for an unknown tool, else None."""
+    msg = line.lower()
+    if not _LOG_TOOL_LINE_RE.search(msg):
+        return None
+    for kind, pattern in _LOG_TOOL_KINDS:
+        if pattern.search(msg):
+            return kind
+    return "other"
+
+
+def _summarize_log_window(window):
+    counts = {"exec": 0, "browser": 0, "search": 0, "other": 0}
+    recent = []
+    for kind in window:
+        if kind is None:
+            continue
+        counts[kind] += 1
+        if kind != "other" and len(recent) < 3:
+            recent.append(kind)
+    return {"toolCounts": counts, "recentTools": recent, "lines": len(window)}
+
+
+def _seed_log_window(log_file, size):
+    """Classify the last complete lines of the first ``size`` bytes.
+
+    Returns ``(kinds, offset)`` with ``offset`` just past the last newline,
+    so a partly written last line is left for the next incremental read
+    rather than classified twice.
+    """
+    start = max(0, size - _LOG_STATS_WINDOW * 500)
+    try:
+        with open(log_file, "rb") as f:
+            f.seek(start)
+            chunk = f.read(size - start)
+    except OSError:
+        return [], size
+    end = chunk.rfind(b"\n") + 1
+    kinds = [
+        _classify_log_line(raw.decode("utf-8", errors="replace"))
+        for raw in chunk[:end].splitlines()[-_LOG_STATS_WINDOW:]
+    ]
+    return kinds, start + end
+
+
+def _log_tool_stats(log_file):
+    if not log_file:
+        return _summarize_log_window(())
+    try:
+        st = os.stat(log_file)
+    except OSError:
+        return _summarize_log_window(())
+    with _log_stats_lock:
+        state = _log_stats
+        same_file = state["path"] == log_file and state["ino"] == st.st_ino
+        if same_file and state["stats"] is not None and (
+            state["size"], state["mtime"]) == (st.st_size, st.st_mtime):
+            return state["stats"]
+        window = state["window"]
+        delta = st.st_size - state["offset"]
+        if not same_file or delta < 0 or delta > _LOG_STATS_MAX_DELTA:
+            # New day's file, rotation, truncation or a big jump: seed from the tail.
+            kinds, offset = _seed_log_window(log_file, st.st_size)
+            window.clear()
+            window.extend(kinds)
+        else:
+            try:
+                with open(log_file, "rb") as f:
+                    f.seek(state["offset"])
+                    chunk = f.read(delta)
+            except OSError:
+                chunk = b""
+            # Leave a partial last line for the next call.
+            end = chunk.rfind(b"\n") + 1
+            for raw in chunk[:end].splitlines():
+                window.append(_classify_log_line(raw.decode("utf-8", errors="replace")))
+            offset = state["offset"] + end
+        stats = _summarize_log_window(window)
+        state.update(
+            path=log_file, ino=st.st_ino, size=st.st_size, mtime=st.st_mtime,
+            offset=offset, stats=stats,
+        )
+        return stats
+
+
+def _log_stats_payload(date_str=None):
+    import dashboard as _d
+    date_str = date_str or datetime.now().strftime("%Y-%m-%d")
+    return _log_tool_stats(_d._find_log_file(date_str))
+
+
+@bp_logs.route("/api/logs/stats")
+def api_logs_stats():
+    """Tool-use counts over the last 100 log lines, for the Tool Activity card."""
+    return conditional_json(_log_stats_payload(request.args.get("date")))
 
 
 # Tool-name → flow-tab short key. OpenClaw emits these tool names verified
@@ -946,6 +1085,77 @@ def _generate_openclaw_json_logs(started_at, sse_max_seconds, release_fn):
         release_fn()
 
 
+# Sent first on the file-follow stream so EventSource's own reconnect after
+# a max-duration close waits a few seconds instead of the browser default.
+_SSE_RETRY_HINT = "retry: 3000\n\n"
+
+# File follow poll: short right after new lines, doubling toward the max
+# while the log is idle, so an active log streams promptly and an idle
+# stream wakes once a second.
+_LOG_FOLLOW_POLL_MIN_S = 0.2
+_LOG_FOLLOW_POLL_MAX_S = 1.0
+
+
+def _follow_log_file(log_file, started_at, sse_max_seconds, release_fn):
+    """Yield SSE events for lines appended to ``log_file`` (``tail -f -n 0``).
+
+    One open file handle per stream and no subprocess. Everything readable
+    is sent as one chunk, a partial last line waits for its newline, and a
+    file that shrinks below the read offset (truncated or replaced in
+    place) is followed again from the top.
+    """
+    if not log_file:
+        yield 'data: {"line":"No log file found"}\n\n'
+        release_fn()
+        return
+    # ``tail`` does not exist on Windows and select() on a pipe is
+    # POSIX-only, so the file is read directly.
+    try:
+        fh = open(log_file, "rb")
+    except OSError:
+        yield 'data: {"line":"Cannot open log file"}\n\n'
+        release_fn()
+        return
+    fh.seek(0, 2)
+    pending = b""
+    delay = _LOG_FOLLOW_POLL_MIN_S
+    try:
+        yield _SSE_RETRY_HINT
+        while True:
+            if time.time() - started_at > sse_max_seconds:
+                yield 'event: done\ndata: {"reason":"max_duration_reached"}\n\n'
+                break
+            chunk = fh.read()
+            if not chunk:
+                try:
+                    if os.stat(log_file).st_size < fh.tell():
+                        fh.seek(0)
+                        pending = b""
+                        continue
+                except OSError:
+                    pass
+                time.sleep(delay)
+                delay = min(delay * 2, _LOG_FOLLOW_POLL_MAX_S)
+                continue
+            delay = _LOG_FOLLOW_POLL_MIN_S
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            if lines:
+                yield "".join(
+                    "data: %s\n\n"
+                    % json.dumps({"line": line.decode("utf-8", "replace").rstrip()})
+                    for line in lines
+                )
+    except GeneratorExit:
+        pass
+    finally:
+        try:
+            fh.close()
+        except Exception:
+            pass
+        release_fn()
+
+
 @bp_logs.route("/api/logs-stream")
 def api_logs_stream():
     """SSE endpoint - streams new log lines in real-time."""
@@ -966,47 +1176,11 @@ def api_logs_stream():
             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
-    # Fallback: tail the log file directly (no JSON framing, no rotation signal)
+    # Fallback: follow the log file directly (no JSON framing, no rotation signal)
     today = datetime.now().strftime("%Y-%m-%d")
     log_file = _d._find_log_file(today)
-
-    def generate():
-        if not log_file:
-            yield 'data: {"line":"No log file found"}\n\n'
-            release()
-            return
-        # Pure-Python follow (tail -f -n 0 semantics: only new lines).
-        # ``tail`` does not exist on Windows and select() on a pipe is
-        # POSIX-only, so the subprocess approach broke this stream there;
-        # reading the file directly needs neither.
-        try:
-            fh = open(log_file, "r", encoding="utf-8", errors="replace")
-        except OSError:
-            yield 'data: {"line":"Cannot open log file"}\n\n'
-            release()
-            return
-        fh.seek(0, 2)
-        try:
-            while True:
-                if time.time() - started_at > _d.SSE_MAX_SECONDS:
-                    yield 'event: done\ndata: {"reason":"max_duration_reached"}\n\n'
-                    break
-                line = fh.readline()
-                if not line:
-                    time.sleep(1.0)
-                    continue
-                yield f"data: {json.dumps({'line': line.rstrip()})}\n\n"
-        except GeneratorExit:
-            pass
-        finally:
-            try:
-                fh.close()
-            except Exception:
-                pass
-            release()
-
     return Response(
-        generate(),
+        _follow_log_file(log_file, started_at, _d.SSE_MAX_SECONDS, release),
         mimetype="text/event-stream",
         headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
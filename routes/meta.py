@@ -7,7 +7,9 @@ and they are all auth/meta/observability plumbing:
 
   bp_version        (2)  — /api/version, /api/update
   bp_gateway        (3)  — /api/gw/{config,invoke,rpc}
-  bp_auth           (3)  — /api/auth/check, /auth, /  (main page)
+  bp_auth           (3)  — /api/auth/check, /auth, /  (main page),
+                           /static/css/dashboard.css (minified),
+                           /static/js/app.js (content-hashed, gzip)
   bp_otel           (3)  — /v1/metrics, /v1/traces, /api/otel-status
   bp_version_impact (1)  — /api/version-impact
   bp_cloud_relay    (1)  — /api/cloud/subscribe
@@ -31,18 +33,20 @@ Pure mechanical move — zero behaviour change.
 """
 
 import collections
+import gzip
 import hashlib
 import html
 import json
 import logging
 import os
+import re
 import sys
 import threading
 import time
 import uuid
 from datetime import datetime, timezone
 
-from flask import Blueprint, jsonify, make_response, render_template_string, request
+from flask import Blueprint, current_app, jsonify, make_response, render_template_string, request
 from clawmetry.config import is_local_store_read_enabled
 
 bp_version = Blueprint('version', __name__)
@@ -1100,6 +1104,13 @@ def auth_token():
 # imported, so the value is stable for the lifetime of the process.
 _v1_root = "/v1/" if os.environ.get("CLAWMETRY_V2_DEFAULT") == "1" else "/"
 
+# Rendered main page, one entry per template variant. The page only branches on
+# the flags in the key (plus the mount point url_for() bakes into asset links),
+# so each variant is rendered and gzip-compressed once and every later load is
+# a dict hit — or a bodyless 304 when the browser's ETag still matches.
+# Bypassed while Jinja auto-reloads templates (debug) so edits show up.
+_index_cache = {}
+
 
 @bp_auth.route(_v1_root)
 def index():
@@ -1127,17 +1138,149 @@ def index():
     # ("1", "true", "yes") flips the legacy template branch on.
     legacy_nav_raw = request.args.get("legacy_nav", "")
     legacy_nav = legacy_nav_raw.lower() in ("1", "true", "yes", "on")
-    resp = make_response(
-        render_template_string(
+    try:
+        app_js_v = _app_js_asset()["etag"]
+    except OSError:
+        app_js_v = _d.__version__
+    key = (_d.__version__, app_js_v, v2_enabled, is_pro, legacy_nav, request.script_root)
+    page = _index_cache.get(key)
+    if page is None or current_app.jinja_env.auto_reload:
+        body = render_template_string(
             _d.DASHBOARD_HTML,
             version=_d.__version__,
+            app_js_v=app_js_v,
             v2_enabled=v2_enabled,
             is_pro=is_pro,
             legacy_nav=legacy_nav,
+        ).encode("utf-8")
+        page = {
+            "body": body,
+            "gz": gzip.compress(body, compresslevel=9),
+            "etag": hashlib.blake2b(body, digest_size=8).hexdigest(),
+        }
+        _index_cache[key] = page
+    if request.accept_encodings["gzip"]:
+        resp = make_response(page["gz"])
+        resp.headers["Content-Encoding"] = "gzip"
+        resp.set_etag(page["etag"] + "-gz")
+    else:
+        resp = make_response(page["body"])
+        resp.set_etag(page["etag"])
+    resp.mimetype = "text/html"
+    resp.vary.add("Accept-Encoding")
+    # Always revalidate (a new version or Pro state changes the ETag), but let
+    # an unchanged page come back as a 304 instead of the full document.
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+
+# ── Minified dashboard stylesheet ─────────────────────────────────────────────────
+#
+# dashboard.css is hand-edited with comments and aligned whitespace. This more
+# specific rule shadows Flask's /static/<path> for that one file and serves a
+# minified copy, rebuilt only when the file's mtime changes (so dev edits
+# still show up on reload). Stdlib-only: no CSS toolchain at build or run time.
+
+_CSS_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+_CSS_SPACE_AROUND = re.compile(r"\s*([{};,>])\s*")
+_dashboard_css_cache = {"mtime": None, "body": b"", "etag": ""}
+
+
+def _minify_css(text):
+    """Strip comments and redundant whitespace, leaving strings untouched.
+
+    Conservative on purpose: spaces inside values (``calc(a - b)``, font
+    stacks, descendant selectors) survive as a single space; only the
+    whitespace around ``{ } ; , >``, after ``:`` (never valid inside a
+    selector) and a ``;`` before ``}`` are dropped.
+    """
+    strings = []
+
+    def _stash(m):
+        if m.group(1) is None:
+            return " "
+        strings.append(m.group(1))
+        return "\x00%d\x00" % (len(strings) - 1)
+
+    out = _CSS_STRING_OR_COMMENT.sub(_stash, text)
+    out = " ".join(out.split())
+    out = _CSS_SPACE_AROUND.sub(r"\1", out).replace(";}", "}").replace(": ", ":")
+    return re.sub(r"\x00(\d+)\x00", lambda m: strings[int(m.group(1))], out).strip()
+
+
+def _minified_dashboard_css():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "clawmetry", "static", "css", "dashboard.css")
+    mtime = os.path.getmtime(path)
+    if _dashboard_css_cache["mtime"] != mtime:
+        with open(path, encoding="utf-8") as f:
+            body = _minify_css(f.read()).encode("utf-8")
+        _dashboard_css_cache.update(
+            mtime=mtime, body=body,
+            etag=hashlib.blake2b(body, digest_size=8).hexdigest(),
         )
-    )
-    resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    return resp
+    return _dashboard_css_cache
+
+
+@bp_auth.route("/static/css/dashboard.css")
+def dashboard_css():
+    try:
+        cached = _minified_dashboard_css()
+    except OSError:
+        return make_response("", 404)
+    resp = make_response(cached["body"])
+    resp.mimetype = "text/css"
+    resp.set_etag(cached["etag"])
+    return resp.make_conditional(request)
+
+
+# ── Content-hashed app.js ──────────────────────────────────────────────────────────
+#
+# app.js is well over a megabyte and only changes between builds, yet Flask's
+# static handler sends it uncompressed and makes the browser revalidate it on
+# every navigation. The main page links it as ``app.js?v=<content hash>``; a
+# request carrying the current hash is immutable for a year, anything else
+# (a stale hash, no hash) revalidates by ETag. Like the stylesheet above, the
+# body and its gzip copy are rebuilt only when the file's mtime changes.
+
+_app_js_cache = {"mtime": None, "body": b"", "gz": b"", "etag": ""}
+
+
+def _app_js_asset():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "clawmetry", "static", "js", "app.js")
+    mtime = os.path.getmtime(path)
+    if _app_js_cache["mtime"] != mtime:
+        with open(path, "rb") as f:
+            body = f.read()
+        _app_js_cache.update(
+            mtime=mtime, body=body,
+            gz=gzip.compress(body, compresslevel=9),
+            etag=hashlib.blake2b(body, digest_size=8).hexdigest(),
+        )
+    return _app_js_cache
+
+
+@bp_auth.route("/static/js/app.js")
+def app_js():
+    try:
+        cached = _app_js_asset()
+    except OSError:
+        return make_response("", 404)
+    if request.accept_encodings["gzip"]:
+        resp = make_response(cached["gz"])
+        resp.headers["Content-Encoding"] = "gzip"
+        resp.set_etag(cached["etag"] + "-gz")
+    else:
+        resp = make_response(cached["body"])
+        resp.set_etag(cached["etag"])
+    resp.mimetype = "text/javascript"
+    resp.vary.add("Accept-Encoding")
+    if request.args.get("v") == cached["etag"]:
+        resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
 
 
 # ── OTLP receiver routes ──────────────────────────────────────────────────────────────────
@@ -2,10 +2,11 @@
 routes/overview.py — Main-dashboard endpoints.
 
 Extracted from dashboard.py as Phase 5.8 of the incremental modularisation.
-Owns the 6 routes registered on ``bp_overview``:
+Owns the 7 routes registered on ``bp_overview``:
 
   GET  /api/channels              — active input channels for Flow diagram
   GET  /api/overview              — top-bar live data (polled every 10s)
+  GET  /api/dashboard/bulk        — overview + usage + log stats + sub-agents
   GET  /api/timeline              — 30-day session-activity timeline
   GET  /api/cloud-cta/status      — cloud-sync CTA connected status
   POST /api/cloud-cta/send-otp    — cloud-sync CTA: send email OTP
@@ -33,6 +34,7 @@ from datetime import datetime, timedelta, timezone
 from flask import Blueprint, jsonify, request
 from clawmetry._gate import gate
 from clawmetry.config import is_local_store_read_enabled
+from routes._conditional import TTLMemo, conditional_json
 
 bp_overview = Blueprint('overview', __name__)
 
@@ -861,8 +863,9 @@ def _try_local_store_overview():
     metadata (model, tokens, updatedAt) — all derivable from
     ``query_sessions`` + ``query_aggregates`` + ``query_events``.
 
-    System-info and infra blocks still come from local subprocesses; the fast
-    path only replaces the gateway-dependent fields (model, sessionCount,
+    System-info and infra blocks still come from local host probes (shared
+    with the legacy handler through ``_host_info``); the fast path only
+    replaces the gateway-dependent fields (model, sessionCount,
     activeSessions, mainSessionUpdated, mainTokens). Cron + memory counts
     intentionally stay on their existing helpers (they hit the filesystem
     directly and are already <5ms).
@@ -872,8 +875,6 @@ def _try_local_store_overview():
       - the sessions table is empty (fresh install / non-OpenClaw user)
       - any unexpected error happens (we'd rather degrade than 500)
     """
-    import subprocess as _sub
-    import sys as _sys
     # Issue #1088: cross-process fast path. Try the daemon HTTP proxy first
     # (covers the standard launchd/systemd install where DuckDB's writer lock
     # blocks the dashboard from opening directly), then fall back to direct
@@ -976,86 +977,7 @@ def _try_local_store_overview():
         mem_files = []
     total_size = sum(f.get("size", 0) for f in mem_files)
 
-    # System info — copied verbatim from the legacy handler so the response
-    # shape matches byte-for-byte. Each subprocess has a 2s timeout so a slow
-    # df/free/uptime can't hang the request thread.
-    system = []
-    try:
-        disk = (
-            _sub.run(["df", "-h", "/"], capture_output=True, text=True, timeout=2)
-            .stdout.strip().split("\n")[-1].split()
-        )
-        disk_pct = int(disk[4].replace("%", "")) if len(disk) > 4 else 0
-        disk_color = "green" if disk_pct < 80 else ("yellow" if disk_pct < 90 else "red")
-        system.append(["Disk /", f"{disk[2]} / {disk[1]} ({disk[4]})", disk_color])
-    except Exception:
-        system.append(["Disk /", "--", ""])
-
-    try:
-        mem = (
-            _sub.run(["free", "-h"], capture_output=True, text=True, timeout=2)
-            .stdout.strip().split("\n")[1].split()
-        )
-        system.append(["RAM", f"{mem[2]} / {mem[1]}", ""])
-    except Exception:
-        system.append(["RAM", "--", ""])
-
-    try:
-        load = open("/proc/loadavg").read().split()[:3]
-        system.append(["Load", " ".join(load), ""])
-    except Exception:
-        system.append(["Load", "--", ""])
-
-    try:
-        # Portable: GNU `uptime -p` doesn't exist on macOS / BSD.
-        from helpers.system import uptime_pretty
-
-        uptime = uptime_pretty()
-        system.append([
-            "Uptime",
-            uptime.replace("up ", "") if uptime != "unknown" else "--",
-            "",
-        ])
-    except Exception:
-        system.append(["Uptime", "--", ""])
-
-    if _sys.platform != "win32":
-        try:
-            gw = _sub.run(
-                ["pgrep", "-f", "moltbot"], capture_output=True, text=True, timeout=2
-            )
-            gw_running = gw.returncode == 0
-        except Exception:
-            gw_running = False
-    else:
-        gw_running = False
-    system.append([
-        "Gateway",
-        "Running" if gw_running else "Stopped",
-        "green" if gw_running else "red",
-    ])
-
-    # Infra block — same shape as legacy.
-    infra = {
-        "userName": _d.USER_NAME,
-        "network": _d.get_local_ip(),
-    }
-    try:
-        import platform
-        uname = platform.uname()
-        infra["machine"] = uname.node
-        infra["runtime"] = f"Node.js - {uname.system} {uname.release.split('-')[0]}"
-    except Exception:
-        infra["machine"] = "Host"
-        infra["runtime"] = "Runtime"
-    try:
-        disk_info = (
-            _sub.run(["df", "-h", "/"], capture_output=True, text=True, timeout=2)
-            .stdout.strip().split("\n")[-1].split()
-        )
-        infra["storage"] = f"{disk_info[1]} root"
-    except Exception:
-        infra["storage"] = "Disk"
+    system, infra = _host_info()
 
     # OSS/cloud parity: user-visible session count excludes sub-agents and
     # ClawMetry-internal plumbing sessions so the OSS Overview matches the
@@ -1108,8 +1030,45 @@ def _try_local_store_overview():
     }
 
 
+# Every open dashboard tab polls /api/overview; memoize for 2s so a burst of
+# refreshes runs the gateway RPC + df/free/pgrep subprocesses once.
+_OVERVIEW_TTL_SECONDS = 2.0
+_overview_memo = TTLMemo(_OVERVIEW_TTL_SECONDS)
+
+
 @bp_overview.route("/api/overview")
 def api_overview():
+    return conditional_json(_overview_memo.get("overview", _compute_overview))
+
+
+@bp_overview.route("/api/dashboard/bulk")
+def api_dashboard_bulk():
+    """Overview, usage, tool-activity log stats and sub-agents in one response.
+
+    The Overview refresh used to make four round-trips for these. Each part
+    comes from the same memo/cache its standalone endpoint uses, so mixing
+    bulk and single polls never computes twice. A failing secondary part is
+    ``null`` and the client falls back to that part's own endpoint.
+    """
+    from routes.infra import _log_stats_payload
+    from routes.sessions import _subagents_payload
+    from routes.usage import _usage_payload
+
+    def _part(fn, *args):
+        try:
+            return fn(*args)
+        except Exception:
+            return None
+
+    return conditional_json({
+        "overview": _overview_memo.get("overview", _compute_overview),
+        "usage": _part(_usage_payload),
+        "logStats": _part(_log_stats_payload),
+        "subagents": _part(_subagents_payload),
+    })
+
+
+def _compute_overview():
     import dashboard as _d
 
     # Epic #964: opt-in local-store fast path. When CLAWMETRY_LOCAL_STORE_READ=1
@@ -1118,7 +1077,7 @@ def api_overview():
     if is_local_store_read_enabled():
         fast = _try_local_store_overview()
         if fast is not None:
-            return jsonify(fast)
+            return fast
 
     # Try gateway API for sessions
     gw_sessions = _d._gw_invoke("sessions_list", {"limit": 20, "messageLimit": 0})
@@ -1142,35 +1101,76 @@ def api_overview():
     mem_files = _d._get_memory_files()
     total_size = sum(f["size"] for f in mem_files)
 
-    # System info
+    system, infra = _host_info()
+
+    model_name = main.get("model") or "unknown"
+    return {
+        "model": model_name,
+        "provider": _d._infer_provider_from_model(model_name),
+        "sessionCount": len(sessions),
+        "sessions": len(sessions),  # alias for E2E compatibility
+        "activeSessions": len([s for s in sessions if s.get("active")]),
+        "mainSessionUpdated": main.get("updatedAt"),
+        "mainTokens": main.get("totalTokens", 0),
+        "contextWindow": main.get("contextTokens", 200000),
+        "cronCount": len(crons),
+        "cronEnabled": enabled,
+        "cronDisabled": disabled,
+        "memoryCount": len(mem_files),
+        "memorySize": total_size,
+        "system": system,
+        "infra": infra,
+        "heartbeat": _get_overview_heartbeat_cached(),
+        "client_health": _detect_anthropic_oauth(),
+        # Issue #688: north-star autonomy metric (always present).
+        "autonomy": _autonomy_for_overview(),
+        # Issue #1233: opt-in nudge for users impacted by PR #1228 default-OFF flip.
+        "_comms": _compute_gateway_tap_comms(),
+    }
+
+
+# Host probes (disk, RAM, load, uptime, pgrep) change slowly; both overview
+# paths share one 5s memo of them, longer than the 2s memo on the payload
+# around them.
+_HOST_INFO_TTL_SECONDS = 5.0
+_host_info_memo = TTLMemo(_HOST_INFO_TTL_SECONDS)
+
+
+def _host_info():
+    """``(system, infra)`` blocks for /api/overview, memoized for 5s.
+
+    Returns fresh containers each call so a caller can't alter the cached
+    rows.
+    """
+    system, infra = _host_info_memo.get("host", _compute_host_info)
+    return [list(row) for row in system], dict(infra)
+
+
+def _compute_host_info():
+    import dashboard as _d
+    from helpers import system as _host
+
     system = []
-    # 2s timeout on every subprocess: on slow/NFS-backed volumes df/free/uptime
-    # can hang the request thread indefinitely, and /api/overview is on the
-    # dashboard's hot path (fires every refresh). Better to show "--" than hang.
-    try:
-        disk = (
-            subprocess.run(["df", "-h", "/"], capture_output=True, text=True, timeout=2)
-            .stdout.strip()
-            .split("\n")[-1]
-            .split()
-        )
-        disk_pct = int(disk[4].replace("%", "")) if len(disk) > 4 else 0
+    # Disk and RAM come from statvfs and /proc/meminfo (formatted like df -h
+    # and free -h) rather than forking df/free on every miss.
+    disk = _host.disk_usage("/")
+    if disk:
+        disk_total, disk_used, disk_pct = disk
         disk_color = (
             "green" if disk_pct < 80 else ("yellow" if disk_pct < 90 else "red")
         )
-        system.append(["Disk /", f"{disk[2]} / {disk[1]} ({disk[4]})", disk_color])
-    except Exception:
+        system.append([
+            "Disk /",
+            f"{_host.human_size(disk_used)} / {_host.human_size(disk_total)} ({disk_pct}%)",
+            disk_color,
+        ])
+    else:
         system.append(["Disk /", "--", ""])
 
-    try:
-        mem = (
-            subprocess.run(["free", "-h"], capture_output=True, text=True, timeout=2)
-            .stdout.strip()
-            .split("\n")[1]
-            .split()
-        )
-        system.append(["RAM", f"{mem[2]} / {mem[1]}", ""])
-    except Exception:
+    mem = _host.memory_usage()
+    if mem:
+        system.append(["RAM", f"{_host.human_size(mem[1], 'i')} / {_host.human_size(mem[0], 'i')}", ""])
+    else:
         system.append(["RAM", "--", ""])
 
     try:
@@ -1181,9 +1181,7 @@ def api_overview():
 
     try:
         # Portable: GNU `uptime -p` doesn't exist on macOS / BSD.
-        from helpers.system import uptime_pretty
-
-        uptime = uptime_pretty()
+        uptime = _host.uptime_pretty()
         system.append([
             "Uptime",
             uptime.replace("up ", "") if uptime != "unknown" else "--",
@@ -1192,6 +1190,8 @@ def api_overview():
     except Exception:
         system.append(["Uptime", "--", ""])
 
+    # pgrep is the one probe still forked (2s timeout, so a wedged process
+    # table can't hang the request).
     if sys.platform != "win32":
         try:
             gw = subprocess.run(
@@ -1225,43 +1225,8 @@ def api_overview():
         infra["machine"] = "Host"
         infra["runtime"] = "Runtime"
 
-    try:
-        disk_info = (
-            subprocess.run(["df", "-h", "/"], capture_output=True, text=True, timeout=2)
-            .stdout.strip()
-            .split("\n")[-1]
-            .split()
-        )
-        infra["storage"] = f"{disk_info[1]} root"
-    except Exception:
-        infra["storage"] = "Disk"
-
-    model_name = main.get("model") or "unknown"
-    return jsonify(
-        {
-            "model": model_name,
-            "provider": _d._infer_provider_from_model(model_name),
-            "sessionCount": len(sessions),
-            "sessions": len(sessions),  # alias for E2E compatibility
-            "activeSessions": len([s for s in sessions if s.get("active")]),
-            "mainSessionUpdated": main.get("updatedAt"),
-            "mainTokens": main.get("totalTokens", 0),
-            "contextWindow": main.get("contextTokens", 200000),
-            "cronCount": len(crons),
-            "cronEnabled": enabled,
-            "cronDisabled": disabled,
-            "memoryCount": len(mem_files),
-            "memorySize": total_size,
-            "system": system,
-            "infra": infra,
-            "heartbeat": _get_overview_heartbeat_cached(),
-            "client_health": _detect_anthropic_oauth(),
-            # Issue #688: north-star autonomy metric (always present).
-            "autonomy": _autonomy_for_overview(),
-            # Issue #1233: opt-in nudge for users impacted by PR #1228 default-OFF flip.
-            "_comms": _compute_gateway_tap_comms(),
-        }
-    )
+    infra["storage"] = f"{_host.human_size(disk[0])} root" if disk else "Disk"
+    return system, infra
 
 
 def _ls_call(method_name, **kwargs):
@@ -17,6 +17,7 @@ definitions.
 """
 
 import collections
+import hashlib
 import json
 import os
 import re
@@ -31,11 +32,12 @@ from flask import Blueprint, jsonify, request, Response
 from clawmetry._gate import gate
 from clawmetry.config import is_local_store_read_enabled, hide_clawmetry_session
 from clawmetry._gate import gate
+from routes._conditional import conditional_json, json_body, send_json
 from routes._dedupe import build_sibling_bucket_max, is_sibling_dup
 
 bp_sessions = Blueprint('sessions', __name__)
 
-_SUBAGENTS_CACHE = {"ts": 0.0, "data": None}
+_SUBAGENTS_CACHE = {"ts": 0.0, "data": None, "body": None, "etag": None}
 _SUBAGENTS_CACHE_TTL_SECONDS = 10
 _SUBAGENTS_SCAN_MAX_FILES = int(os.environ.get("CLAWMETRY_SUBAGENTS_SCAN_MAX_FILES", "120"))
 _SUBAGENTS_SCAN_TAIL_BYTES = int(os.environ.get("CLAWMETRY_SUBAGENTS_SCAN_TAIL_BYTES", str(512 * 1024)))
@@ -2110,13 +2112,22 @@ def api_subagents():
        succeeded spawns (via `details.childSessionKey`) and attempted
        spawns that errored (visible so the user knows the agent tried).
     """
+    full_scan = request.args.get("full", "").strip().lower() in ("1", "true", "yes")
+    return _subagents_response(_subagents_payload(full_scan))
+
+
+def _subagents_payload(full_scan=False):
+    """Build the ``/api/subagents`` payload; see ``api_subagents``.
+
+    Shared with ``/api/dashboard/bulk``. Non-``full_scan`` results are stored
+    in ``_SUBAGENTS_CACHE`` and served from it inside the TTL.
+    """
     import dashboard as _d
     now_ms = time.time() * 1000
-    full_scan = request.args.get("full", "").strip().lower() in ("1", "true", "yes")
     if not full_scan:
         cached = _SUBAGENTS_CACHE.get("data")
         if cached is not None and (time.time() - float(_SUBAGENTS_CACHE.get("ts") or 0)) < _SUBAGENTS_CACHE_TTL_SECONDS:
-            return jsonify(cached)
+            return cached
 
     # Source 0: DuckDB fast path. Skips the JSONL spawn-scan + gateway RPC
     # entirely. ``full_scan`` still defers to the legacy path so the "force
@@ -2128,9 +2139,7 @@ def api_subagents():
                 for _sa in fast.get("subagents", []):
                     if (_sa.get("key") or _sa.get("sessionId") or "") in _paused_agents:
                         _sa["status"] = "paused"
-            _SUBAGENTS_CACHE["data"] = fast
-            _SUBAGENTS_CACHE["ts"] = time.time()
-            return jsonify(fast)
+            return _cache_subagents(fast)
 
     # Source 1: canonical subagent registry
     reg_active = []
@@ -2331,10 +2340,30 @@ def api_subagents():
     _status_rank = {"active": 0, "idle": 1, "stale": 2, "paused": 3, "failed": 4}
     subagents.sort(key=lambda x: (_status_rank.get(x["status"], 9), x["depth"]))
     payload = {"subagents": subagents, "counts": counts}
-    if not full_scan:
-        _SUBAGENTS_CACHE["data"] = payload
-        _SUBAGENTS_CACHE["ts"] = time.time()
-    return jsonify(payload)
+    return payload if full_scan else _cache_subagents(payload)
+
+
+def _cache_subagents(payload):
+    _SUBAGENTS_CACHE.update(data=payload, body=None, etag=None, ts=time.time())
+    return payload
+
+
+def _subagents_response(payload):
+    """JSON response for /api/subagents with a content ETag.
+
+    The sub-agent tab polls every 5s and the tree rarely changes between
+    polls, so a matching ``If-None-Match`` gets a bodyless 304 and the client
+    skips its re-render. A cached payload keeps its serialized body and ETag
+    next to it, so TTL hits neither re-serialize nor re-hash.
+    """
+    cached = payload is _SUBAGENTS_CACHE.get("data")
+    if cached and _SUBAGENTS_CACHE.get("body"):
+        return send_json(_SUBAGENTS_CACHE["body"], _SUBAGENTS_CACHE["etag"])
+    body = json_body(payload)
+    etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+    if cached:
+        _SUBAGENTS_CACHE.update(body=body, etag=etag)
+    return send_json(body, etag)
 
 
 def _check_duplicate_completions(sessions_dir, max_files=None):
@@ -4096,10 +4125,11 @@ def _extract_decoding_params(obj):
     return out
 
 
-def _try_local_store_transcript(session_id: str, _events=None):
+def _try_local_store_transcript(session_id: str, _events=None, tail=None):
     """Read a session transcript directly from the DuckDB events table.
 
-    Returns the same response shape as the JSONL parser. Returns ``None``
+    Returns the same response shape as the JSONL parser; ``tail`` keeps only
+    the last N messages. Returns ``None``
     to defer to the JSONL fallback if the local_store module isn't importable,
     the events table has no rows for this session, or anything raises.
 
@@ -4329,20 +4359,38 @@ def _try_local_store_transcript(session_id: str, _events=None):
         "model": model,
         "totalTokens": total_tokens,
         "duration": duration,
-        "messages": messages[:500],
+        "messages": _transcript_window(messages, tail),
         "external_api_calls": ext_calls,
         "_source": "local_store",
     }
 
 
+def _transcript_window(messages, tail=None):
+    """First 500 messages, or the last ``tail`` when a caller only shows the end."""
+    return messages[-tail:] if tail else messages[:500]
+
+
 @bp_sessions.route("/api/transcript/<session_id>")
 def api_transcript(session_id):
-    """Parse and return a session transcript for the chat viewer."""
+    """Parse and return a session transcript for the chat viewer.
+
+    ``?tail=N`` returns only the last N messages (``messageCount`` stays the
+    full count) for callers that show the end of the conversation.
+    """
+    tail = min(max(request.args.get("tail", 0, type=int), 0), 500) or None
+    payload = _transcript_payload(session_id, tail)
+    if not isinstance(payload, dict):
+        return payload
+    return conditional_json(payload)
+
+
+def _transcript_payload(session_id, tail=None):
+    """Transcript dict for ``session_id``, or an error response tuple."""
     import dashboard as _d
     if is_local_store_read_enabled():
-        fast = _try_local_store_transcript(session_id)
+        fast = _try_local_store_transcript(session_id, tail=tail)
         if fast is not None:
-            return jsonify(fast)
+            return fast
     sessions_dir = _d.SESSIONS_DIR or os.path.expanduser(
         "~/.openclaw/agents/main/sessions"
     )
@@ -4458,16 +4506,67 @@ def api_transcript(session_id):
         else:
             duration = f"{dur_sec / 3600:.1f}h"
 
-    return jsonify(
-        {
-            "name": session_id[:40],
-            "messageCount": len(messages),
-            "model": model,
-            "totalTokens": total_tokens,
-            "duration": duration,
-            "messages": messages[:500],  # Cap at 500 messages
-        }
-    )
+    return {
+        "name": session_id[:40],
+        "messageCount": len(messages),
+        "model": model,
+        "totalTokens": total_tokens,
+        "duration": duration,
+        "messages": _transcript_window(messages, tail),  # Cap at 500 messages
+    }
+
+
+# Overview "Live Activity" tags, checked in order against an assistant reply.
+# Same keyword rules the widget used to apply client-side; a reply matching
+# none of them but longer than 50 chars is a "thought" with a short preview.
+_ACTIVITY_TAGS = (
+    ("search", re.compile(r"search", re.I)),
+    ("read", re.compile(r"reading|file", re.I)),
+    ("edit", re.compile(r"writing|edit", re.I)),
+    ("exec", re.compile(r"exec|command", re.I)),
+    ("browser", re.compile(r"browser|screenshot", re.I)),
+)
+_ACTIVITY_PREVIEW_NONWORD = re.compile(r"[^\w\s]", re.ASCII)
+
+
+def _activity_tag(content):
+    """``(tag, preview)`` for an assistant reply, or ``None`` to skip it."""
+    for tag, rx in _ACTIVITY_TAGS:
+        if rx.search(content):
+            return tag, ""
+    if len(content) > 50:
+        return "thought", _ACTIVITY_PREVIEW_NONWORD.sub(" ", content[:80]).strip()
+    return None
+
+
+@bp_sessions.route("/api/transcript/<session_id>/activity")
+def api_transcript_activity(session_id):
+    """Tagged activity rows for the Overview widget instead of whole messages.
+
+    ``?tail=N`` (default 10) is how many trailing messages are tagged. Also
+    carries the latest assistant reply among the last 50 messages (trimmed)
+    for the Overview hero, which used to dig it out of the full transcript.
+    """
+    tail = min(max(request.args.get("tail", 10, type=int), 1), 50)
+    payload = _transcript_payload(session_id, 50)
+    if not isinstance(payload, dict):
+        return payload
+    messages = payload.get("messages") or []
+    activity = []
+    for msg in messages[-tail:]:
+        content = msg.get("content")
+        if msg.get("role") != "assistant" or not content:
+            continue
+        tagged = _activity_tag(str(content))
+        if tagged:
+            activity.append({"ts": msg.get("timestamp"), "tag": tagged[0], "preview": tagged[1]})
+    last_reply = None
+    for msg in reversed(messages):
+        text = str(msg.get("content") or "").strip()
+        if msg.get("role") == "assistant" and text:
+            last_reply = {"text": text[:400], "when": msg.get("timestamp")}
+            break
+    return conditional_json({"activity": activity, "lastReply": last_reply})
 
 
 def _try_local_store_transcript_events(session_id: str):
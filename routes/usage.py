@@ -41,6 +41,7 @@ from typing import Optional
 from flask import Blueprint, jsonify, make_response, request
 from clawmetry._gate import gate
 from clawmetry.config import is_local_store_read_enabled
+from routes._conditional import TTLMemo, conditional_json
 from routes._dedupe import build_sibling_bucket_max, is_sibling_dup
 
 bp_usage = Blueprint('usage', __name__)
@@ -1802,12 +1803,17 @@ def _try_local_store_token_attribution(wanted_sid: str = "", limit: int = 100):
     }
 
 
+# The local-store fast path had no cache of its own and /api/usage is polled
+# by every Overview refresh; a 2s per-runtime memo collapses bursts from
+# several tabs into one aggregate query. The legacy path keeps its longer
+# ``_usage_cache`` underneath.
+_USAGE_MEMO_TTL_SECONDS = 2.0
+_usage_memo = TTLMemo(_USAGE_MEMO_TTL_SECONDS)
+
+
 @bp_usage.route("/api/usage")
 def api_usage():
     """Token/cost tracking from transcript files - Enhanced OTLP workaround."""
-    import dashboard as _d
-    import time as _time
-
     # Optional ?runtime=X scopes the Cost / Tokens tab to one agent runtime
     # (Claude Code, Goose, PicoClaw, …). Mirrors the global runtime switcher;
     # threaded into query_aggregates + query_daily_usage_splits so per-runtime
@@ -1815,20 +1821,32 @@ def api_usage():
     # unfiltered, by construction). Only honoured on the local-store fast
     # path; the legacy OTLP/cache fallback ignores it.
     _rt = (request.args.get("runtime") or "").strip() or None
+    return conditional_json(_usage_payload(_rt))
+
+
+def _usage_payload(_rt=None):
+    result = _usage_memo.get(_rt, lambda: _compute_usage(_rt))
+    # Tier cap runs per request, after the memo, so Free/Pro never share a body.
+    return _apply_oss_24h_cap(result)
+
+
+def _compute_usage(_rt):
+    import dashboard as _d
+    import time as _time
 
     # Epic #964 — local-store fast path. Opt-in via CLAWMETRY_LOCAL_STORE_READ=1;
     # falls through to OTLP/transcript scan when the store is empty / disabled.
     if is_local_store_read_enabled():
         fast = _try_local_store_usage(runtime=_rt)
         if fast is not None:
-            return jsonify(_apply_oss_24h_cap(fast))
+            return fast
 
     now = _time.time()
     if (
         _d._usage_cache["data"] is not None
         and (now - _d._usage_cache["ts"]) < _d._USAGE_CACHE_TTL
     ):
-        return jsonify(_apply_oss_24h_cap(_d._usage_cache["data"]))
+        return _d._usage_cache["data"]
 
     # Prefer OTLP data when available
     if _d._has_otel_data():
@@ -1839,7 +1857,7 @@ def api_usage():
             _d._ext_emit("usage.compiled", {"ok": True})
         except Exception:
             pass
-        return jsonify(_apply_oss_24h_cap(result))
+        return result
 
     analytics = _d._compute_transcript_analytics()
     daily_tokens = analytics.get("daily_tokens", {})
@@ -1951,7 +1969,7 @@ def api_usage():
 
     _d._usage_cache["data"] = result
     _d._usage_cache["ts"] = _time.time()
-    return jsonify(_apply_oss_24h_cap(result))
+    return result
 
 
 @bp_usage.route("/api/usage/anomalies")
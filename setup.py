@@ -62,6 +62,9 @@ setup(
     ],
     extras_require={
         "otel": ["opentelemetry-proto>=1.20.0", "protobuf>=4.21.0"],
+        # Optional faster JSON encode/decode for the polled endpoints, the
+        # metrics snapshot and transcript parsing; stdlib json otherwise.
+        "fast": ["orjson>=3.6"],
         # Kept for back-compat with `pip install clawmetry[relay]` calls
         # in old install scripts. No-op in 0.12.166+.
         "relay": [],
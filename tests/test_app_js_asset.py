@@ -0,0 +1,68 @@
+"""``/static/js/app.js`` is served content-hashed and gzipped by ``routes.meta``.
+
+The main page links ``app.js?v=<blake2b of the file>``. Pins: the page links
+the current hash, a request carrying that hash is cacheable for a year while
+a stale or missing hash revalidates, gzip is served only when accepted, and a
+matching ``If-None-Match`` is a bodyless 304.
+"""
+from __future__ import annotations
+
+import gzip
+import importlib
+import os
+
+import pytest
+from flask import Flask
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_JS_PATH = os.path.join(_REPO_ROOT, "clawmetry", "static", "js", "app.js")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    import dashboard
+    import routes.meta as meta
+    importlib.reload(meta)
+    monkeypatch.setattr(dashboard, "_is_pro_user", lambda: False)
+    a = Flask(
+        __name__,
+        static_folder=os.path.join(_REPO_ROOT, "clawmetry", "static"),
+        template_folder=os.path.join(_REPO_ROOT, "clawmetry", "templates"),
+    )
+    a.register_blueprint(meta.bp_auth)
+    return a.test_client(), meta
+
+
+def test_index_links_content_hash(client):
+    c, meta = client
+    page = c.get("/", environ_overrides={"REMOTE_ADDR": "127.0.0.1"})
+    v = meta._app_js_asset()["etag"]
+    assert ("js/app.js?v=" + v).encode() in page.data
+
+
+def test_current_hash_is_immutable(client):
+    c, meta = client
+    v = meta._app_js_asset()["etag"]
+    r = c.get("/static/js/app.js?v=" + v)
+    assert r.status_code == 200
+    assert r.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert "Content-Encoding" not in r.headers
+    assert len(r.data) == os.path.getsize(_JS_PATH)
+
+    stale = c.get("/static/js/app.js?v=0.0.0")
+    assert stale.headers["Cache-Control"] == "no-cache"
+
+
+def test_gzip_and_304(client):
+    c, _meta = client
+    gz = c.get("/static/js/app.js", headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in gz.headers["Vary"]
+    assert len(gzip.decompress(gz.data)) == os.path.getsize(_JS_PATH)
+
+    again = c.get(
+        "/static/js/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": gz.headers["ETag"]},
+    )
+    assert again.status_code == 304
+    assert again.data == b""
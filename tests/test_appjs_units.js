@@ -1287,7 +1287,7 @@ console.log('_backfillFlowFromBrain scopes Active Tools by runtime (#3004)');
         return i > 0 ? id.slice(0, i).toLowerCase() : 'openclaw';
       },
       flowStats: { activeTools: activeTools },
-      updateFlowStats: function() {},
+      scheduleFlowStatsUpdate: function() {},
       fetch: function() {
         return Promise.resolve({ json: function() {
           return Promise.resolve({ events: events });
@@ -1371,6 +1371,38 @@ console.log('\ncmRuntimeIcon (runtime pixel logos, runtime-logos.js)');
   truthy(win.cmRuntimeKnown('codex') === true && win.cmRuntimeKnown('nope') === false, 'cmRuntimeKnown known/unknown');
 }
 
+// ── renderLogs: stale parses dropped, live rows kept ──────────────────
+console.log('renderLogs (superseded loads and rows streamed in mid-parse)');
+{
+  const el = { innerHTML: '', scrollTop: 0, scrollHeight: 0 };
+  const v = { rows: [], appended: 0 };
+  const pending = [];
+  const sandbox = {
+    document: { getElementById: function() { return el; } },
+    _vlistFor: function() { return v; },
+    _parseLogLines: function(lines) {
+      return new Promise(function(resolve) { pending.push(function() { resolve(lines.slice()); }); });
+    },
+    _logsRefilter: function(vl) { vl.shown = vl.rows; },
+    _vlistRender: function() {},
+    _logsLoadSeq: 0,
+  };
+  vm.createContext(sandbox);
+  vm.runInContext(src.match(/^async function renderLogs\b[\s\S]*?^\}/m)[0], sandbox);
+  (async function() {
+    sandbox._logsLoadSeq = 1;
+    const older = sandbox.renderLogs('logs-full', ['old-1', 'old-2'], 1);
+    sandbox._logsLoadSeq = 2;
+    const newer = sandbox.renderLogs('logs-full', ['new-1'], 2);
+    v.rows.push('live-1'); v.appended += 1;
+    pending[1]();
+    await newer;
+    pending[0]();
+    await older;
+    eq(v.rows.join(','), 'new-1,live-1', 'older parse finishing last is dropped; live row kept');
+  })();
+}
+
 // Auth-bootstrap scenarios above are async — wait for the microtask /
 // macrotask queue to drain before printing the summary. (The previous
 // synchronous test blocks all completed in-tick, so no wait was needed
@@ -0,0 +1,168 @@
+"""``routes._conditional`` — short-TTL memo + ETag for polled JSON endpoints.
+
+``/api/overview``, ``/api/usage`` and ``/api/logs`` go through
+``TTLMemo.get`` and ``conditional_json``. Pins: a hit inside the TTL reuses
+the value, concurrent misses compute once, a failing compute caches nothing,
+a matching ``If-None-Match`` on a memoized route is a bodyless 304, a large
+``/api/logs`` history is gzipped and still revalidates, large bodies are
+gzipped only when accepted, and values orjson can't encode still serialize
+(on Flask releases before the ``app.json`` provider too).
+"""
+from __future__ import annotations
+
+import gzip
+import importlib
+import os
+import sys
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from routes._conditional import TTLMemo, conditional_json, json_body  # noqa: E402
+
+
+def test_hit_within_ttl_reuses_value():
+    memo = TTLMemo(60)
+    calls = []
+    assert memo.get("k", lambda: calls.append(1) or "a") == "a"
+    assert memo.get("k", lambda: calls.append(1) or "b") == "a"
+    assert len(calls) == 1
+    memo.clear()
+    assert memo.get("k", lambda: "c") == "c"
+
+
+def test_expired_entry_recomputes():
+    memo = TTLMemo(0)
+    assert memo.get("k", lambda: 1) == 1
+    assert memo.get("k", lambda: 2) == 2
+
+
+def test_concurrent_misses_compute_once():
+    memo = TTLMemo(60)
+    calls = []
+
+    def _slow():
+        calls.append(1)
+        time.sleep(0.05)
+        return "v"
+
+    out = []
+    threads = [
+        threading.Thread(target=lambda: out.append(memo.get("k", _slow)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert out == ["v"] * 8
+    assert len(calls) == 1
+
+
+def test_failing_compute_caches_nothing():
+    memo = TTLMemo(60)
+
+    def _boom():
+        raise RuntimeError("x")
+
+    with pytest.raises(RuntimeError):
+        memo.get("k", _boom)
+    assert memo.get("k", lambda: "ok") == "ok"
+
+
+def test_logs_route_answers_304_on_matching_etag(monkeypatch, tmp_path):
+    import dashboard as _d
+    import routes.infra as infra
+
+    importlib.reload(infra)
+    log = tmp_path / "gw.log"
+    log.write_text("one\ntwo\n")
+    monkeypatch.setattr(_d, "_find_log_file", lambda _date: str(log))
+    a = Flask(__name__)
+    a.register_blueprint(infra.bp_logs)
+    c = a.test_client()
+
+    first = c.get("/api/logs?lines=5&date=2026-01-01")
+    assert first.status_code == 200
+    assert first.get_json()["lines"] == ["one", "two"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    again = c.get(
+        "/api/logs?lines=5&date=2026-01-01",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert again.status_code == 304
+    assert again.data == b""
+
+
+def test_large_logs_history_is_gzipped_and_revalidates(monkeypatch, tmp_path):
+    import json
+
+    import dashboard as _d
+    import routes.infra as infra
+
+    importlib.reload(infra)
+    log = tmp_path / "gw.log"
+    log.write_text("".join('{"n":%d}\n' % i for i in range(1000)))
+    monkeypatch.setattr(_d, "_find_log_file", lambda _date: str(log))
+    a = Flask(__name__)
+    a.register_blueprint(infra.bp_logs)
+    c = a.test_client()
+    url = "/api/logs?lines=1000&date=2026-01-01"
+    r = c.get(url, headers={"Accept-Encoding": "gzip"})
+    assert r.headers["Content-Encoding"] == "gzip"
+    lines = json.loads(gzip.decompress(r.data))["lines"]
+    assert lines[0] == '{"n":0}' and len(lines) == 1000
+    again = c.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": r.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_large_body_gzipped_when_accepted():
+    a = Flask(__name__)
+    a.add_url_rule("/big", "big", lambda: conditional_json({"x": "a" * 5000}))
+    c = a.test_client()
+
+    plain = c.get("/big")
+    assert "Content-Encoding" not in plain.headers
+    assert plain.get_json() == {"x": "a" * 5000}
+
+    gz = c.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in gz.headers["Vary"]
+    assert gzip.decompress(gz.data) == plain.data
+    again = c.get("/big", headers={"Accept-Encoding": "gzip", "If-None-Match": gz.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.data == b""
+
+
+def test_json_body_falls_back_for_values_orjson_rejects():
+    import datetime
+    import json
+
+    a = Flask(__name__)
+    with a.app_context():
+        assert json.loads(json_body({1: "a"})) == {"1": "a"}
+        assert json.loads(json_body({"big": 2 ** 70})) == {"big": 2 ** 70}
+        when = json.loads(json_body({"t": datetime.datetime(2026, 1, 1)}))["t"]
+        assert when == "Thu, 01 Jan 2026 00:00:00 GMT"
+
+
+def test_json_body_default_on_flask_without_json_provider(monkeypatch):
+    import json
+    import types
+
+    import routes._conditional as cond
+
+    class _Encoder(json.JSONEncoder):
+        def default(self, o):
+            return "enc:" + type(o).__name__
+
+    # Flask < 2.2 has ``json_encoder`` and no ``app.json`` provider.
+    monkeypatch.setattr(cond, "current_app", types.SimpleNamespace(json_encoder=_Encoder))
+    assert cond._json_default()(object()) == "enc:object"
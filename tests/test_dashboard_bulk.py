@@ -0,0 +1,67 @@
+"""``/api/dashboard/bulk`` — one round-trip for the Overview refresh.
+
+Pins: the payload carries ``overview``, ``usage``, ``logStats`` and ``subagents``
+from the same helpers the standalone endpoints use, a failing secondary part
+comes back ``null`` instead of failing the request, and a matching
+``If-None-Match`` is a bodyless 304.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    import routes.infra as infra
+    import routes.overview as ov
+    import routes.sessions as sessions
+    import routes.usage as usage
+
+    importlib.reload(ov)
+    monkeypatch.setattr(ov, "_compute_overview", lambda: {"model": "m", "sessionCount": 2})
+    monkeypatch.setattr(usage, "_usage_payload", lambda _rt=None: {"today": 5})
+    monkeypatch.setattr(infra, "_log_stats_payload", lambda d=None: {"lines": 0})
+    monkeypatch.setattr(sessions, "_subagents_payload", lambda full_scan=False: {"subagents": [], "counts": {"total": 0}})
+    a = Flask(__name__)
+    a.register_blueprint(ov.bp_overview)
+    return a.test_client(), monkeypatch, usage
+
+
+def test_bulk_combines_all_parts(client):
+    c, _mp, _usage = client
+    r = c.get("/api/dashboard/bulk")
+    assert r.status_code == 200
+    body = r.get_json()
+    assert body["overview"] == {"model": "m", "sessionCount": 2}
+    assert body["usage"] == {"today": 5}
+    assert body["logStats"] == {"lines": 0}
+    assert body["subagents"]["counts"] == {"total": 0}
+
+
+def test_failing_part_is_null(client):
+    c, monkeypatch, usage = client
+
+    def _boom(_rt=None):
+        raise RuntimeError("usage down")
+
+    monkeypatch.setattr(usage, "_usage_payload", _boom)
+    body = c.get("/api/dashboard/bulk").get_json()
+    assert body["usage"] is None
+    assert body["overview"]["model"] == "m"
+
+
+def test_matching_etag_is_304(client):
+    c, _mp, _usage = client
+    first = c.get("/api/dashboard/bulk")
+    again = c.get("/api/dashboard/bulk", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.data == b""
@@ -0,0 +1,60 @@
+"""``/static/css/dashboard.css`` is served minified by ``routes.meta``.
+
+The more specific blueprint rule shadows Flask's static route for that one
+file. Pins: the minifier keeps strings and value-internal spaces intact, the
+route serves a smaller body than the source with a strong ETag, a matching
+``If-None-Match`` short-circuits to 304, and other static files still go
+through Flask's static handler.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+
+import pytest
+from flask import Flask
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CSS_PATH = os.path.join(_REPO_ROOT, "clawmetry", "static", "css", "dashboard.css")
+
+
+@pytest.fixture
+def client():
+    import routes.meta as meta
+    importlib.reload(meta)
+    a = Flask(__name__, static_folder=os.path.join(_REPO_ROOT, "clawmetry", "static"))
+    a.register_blueprint(meta.bp_auth)
+    return a.test_client(), meta
+
+
+def test_minify_keeps_strings_and_value_spaces(client):
+    _c, meta = client
+    src = (
+        "/* header */\n.a > .b ,\n.c :hover {\n  content: ' x  /* y */ ';\n"
+        "  width: calc(100% - 2px) ;\n}\n@media (max-width: 10px) { .d .e { color: red } }\n"
+    )
+    assert meta._minify_css(src) == (
+        ".a>.b,.c :hover{content:' x  /* y */ ';width:calc(100% - 2px)}"
+        "@media (max-width:10px){.d .e{color:red}}"
+    )
+
+
+def test_route_serves_minified_css_with_etag(client):
+    c, _meta = client
+    r = c.get("/static/css/dashboard.css?v=1")
+    assert r.status_code == 200
+    assert r.mimetype == "text/css"
+    assert 0 < len(r.data) < os.path.getsize(_CSS_PATH)
+    assert b"/*" not in r.data.replace(b"'/*", b"")
+    etag = r.headers["ETag"]
+
+    r2 = c.get("/static/css/dashboard.css", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.data == b""
+
+
+def test_other_static_files_untouched(client):
+    c, _meta = client
+    r = c.get("/static/js/i18n.js")
+    assert r.status_code == 200
+    r.close()
@@ -0,0 +1,54 @@
+"""``/api/heatmap?format=q8`` packs the grid into base64 uint8 intensities.
+
+Pins: cells are day-major with 24 per day and scaled so the max is 255,
+counts round-trip exactly while ``max <= 255``, small non-zero counts under a
+large max still pack to at least 1, an all-zero window packs to
+zeros without dividing by zero, and the other payload keys pass through.
+"""
+from __future__ import annotations
+
+import base64
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from routes.health import _pack_heatmap_q8  # noqa: E402
+
+
+def _decode(packed):
+    return list(base64.b64decode(packed["q"]))
+
+
+def test_packs_day_major_scaled_to_max():
+    days = [
+        {"label": "Mon 01", "hours": [0] * 23 + [40]},
+        {"label": "Tue 02", "hours": [10] + [0] * 23},
+    ]
+    packed = _pack_heatmap_q8({"days": days, "max": 40, "n_days": 2, "_source": "local_store"})
+    q = _decode(packed)
+    assert len(q) == 48
+    assert q[23] == 255 and q[24] == 64 and sum(q) == 255 + 64
+    assert packed["labels"] == ["Mon 01", "Tue 02"]
+    assert packed["max"] == 40 and packed["n_days"] == 2
+    assert packed["_source"] == "local_store"
+    assert "days" not in packed
+
+
+def test_counts_round_trip_exactly_up_to_255():
+    hours = list(range(0, 240, 10))
+    packed = _pack_heatmap_q8({"days": [{"label": "d", "hours": hours}], "max": 230, "n_days": 1})
+    assert [round(v * 230 / 255) for v in _decode(packed)] == hours
+
+
+def test_small_counts_under_large_max_stay_nonzero():
+    hours = [1200, 1, 2, 0] + [0] * 20
+    packed = _pack_heatmap_q8({"days": [{"label": "d", "hours": hours}], "max": 1200, "n_days": 1})
+    assert _decode(packed)[:4] == [255, 1, 1, 0]
+
+
+def test_empty_window_packs_to_zeros():
+    packed = _pack_heatmap_q8({"days": [{"label": "d", "hours": [0] * 24}], "max": 0, "n_days": 1})
+    assert _decode(packed) == [0] * 24
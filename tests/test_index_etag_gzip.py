@@ -0,0 +1,69 @@
+"""The main page is rendered once per template variant and revalidated by ETag.
+
+``routes.meta.index`` caches the rendered page (plain + gzip) keyed by the
+flags the template branches on. Pins: gzip is served only when accepted and
+carries its own ETag, a matching ``If-None-Match`` gets a bodyless 304, and
+the Pro flag is part of the key so a tier change never reuses the other
+variant's page.
+"""
+from __future__ import annotations
+
+import gzip
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    import dashboard
+    import routes.meta as meta
+    importlib.reload(meta)
+    monkeypatch.setattr(dashboard, "_is_pro_user", lambda: False)
+    a = Flask(__name__, template_folder=os.path.join(ROOT, "clawmetry", "templates"))
+    a.register_blueprint(meta.bp_auth)
+    return a.test_client(), dashboard
+
+
+def _get(c, **headers):
+    return c.get("/", headers=headers, environ_overrides={"REMOTE_ADDR": "127.0.0.1"})
+
+
+def test_gzip_only_when_accepted(client):
+    c, _d = client
+    plain = _get(c)
+    assert plain.status_code == 200
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["Cache-Control"] == "no-cache"
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    gz = _get(c, **{"Accept-Encoding": "gzip, deflate"})
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(gz.data) == plain.data
+    assert gz.headers["ETag"] != plain.headers["ETag"]
+
+
+def test_matching_etag_is_304(client):
+    c, _d = client
+    first = _get(c, **{"Accept-Encoding": "gzip"})
+    again = _get(c, **{"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.data == b""
+
+
+def test_tier_is_part_of_the_cache_key(client, monkeypatch):
+    c, dashboard = client
+    free = _get(c)
+    monkeypatch.setattr(dashboard, "_is_pro_user", lambda: True)
+    pro = _get(c)
+    assert pro.headers["ETag"] != free.headers["ETag"]
+    assert b"nc-sandbox-status" in pro.data
+    assert b"nc-sandbox-status" not in free.data
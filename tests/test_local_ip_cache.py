@@ -0,0 +1,70 @@
+"""``get_local_ip`` caches the LAN-IP probe for ``_LOCAL_IP_TTL`` seconds.
+
+The overview and system panels call it on every poll; the UDP connect() it
+wraps can block on misconfigured hosts. Pins: a second call inside the TTL
+doesn't open a socket, an expired entry re-probes, and a failing probe
+falls back to loopback.
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+class _FakeSocket:
+    opened = 0
+
+    def __init__(self, *args, **kwargs):
+        type(self).opened += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def settimeout(self, _t):
+        pass
+
+    def connect(self, _addr):
+        pass
+
+    def getsockname(self):
+        return ("192.168.1.23", 54321)
+
+
+@pytest.fixture
+def dash(monkeypatch):
+    import dashboard as _d
+
+    _FakeSocket.opened = 0
+    monkeypatch.setattr(_d.socket, "socket", _FakeSocket)
+    monkeypatch.setattr(_d, "_local_ip_cache", {"ts": 0.0, "ip": None})
+    return _d
+
+
+def test_second_call_within_ttl_is_cached(dash):
+    assert dash.get_local_ip() == "192.168.1.23"
+    assert dash.get_local_ip() == "192.168.1.23"
+    assert _FakeSocket.opened == 1
+
+
+def test_expired_entry_reprobes(dash, monkeypatch):
+    dash.get_local_ip()
+    dash._local_ip_cache["ts"] -= dash._LOCAL_IP_TTL + 1
+    dash.get_local_ip()
+    assert _FakeSocket.opened == 2
+
+
+def test_probe_failure_falls_back_to_loopback(dash, monkeypatch):
+    def _boom(self, _addr):
+        raise OSError("network unreachable")
+
+    monkeypatch.setattr(_FakeSocket, "connect", _boom)
+    assert dash.get_local_ip() == "127.0.0.1"
@@ -96,6 +96,31 @@ def test_json_log_stream_uses_resolved_binary_and_no_select(monkeypatch):
     assert any("stream_ended" in e or "max_duration" in e for e in events)
 
 
+def test_file_follow_holds_partial_lines_and_reseeds_on_truncate(monkeypatch, tmp_path):
+    import routes.infra as infra
+
+    monkeypatch.setattr(infra.time, "sleep", lambda _s: None)
+    log = tmp_path / "gw.log"
+    log.write_bytes(b"old\n")
+    released = []
+    gen = infra._follow_log_file(
+        str(log), time.time(), 60, lambda: released.append(1)
+    )
+    assert next(gen) == infra._SSE_RETRY_HINT
+    with open(log, "ab") as f:
+        f.write("a\nb-\u00e9".encode("utf-8")[:-1])
+    assert next(gen) == 'data: {"line": "a"}\n\n'
+    with open(log, "ab") as f:
+        f.write("\u00e9".encode("utf-8")[-1:] + b"\nc\n")
+    assert next(gen) == (
+        'data: {"line": "b-\\u00e9"}\n\ndata: {"line": "c"}\n\n'
+    )
+    log.write_bytes(b"new\n")
+    assert next(gen) == 'data: {"line": "new"}\n\n'
+    gen.close()
+    assert released == [1]
+
+
 # ── Class guard: the POSIX idioms must not come back ──────────────────────
 
 _REPO = Path(__file__).resolve().parents[1]
@@ -0,0 +1,115 @@
+"""``/api/logs/stats`` — Tool Activity counts kept in step with the log tail.
+
+``routes.infra._log_tool_stats`` classifies each log line once as it is
+appended. Pins: classification matches the card's old client-side rules,
+appends are folded in from the stored offset (partial lines wait), the
+window stays at the last 100 lines, and truncation re-seeds from the tail
+without classifying a partly written last line twice.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+@pytest.fixture
+def infra(tmp_path, monkeypatch):
+    import dashboard as _d
+    import routes.infra as infra
+
+    importlib.reload(infra)
+    log = tmp_path / "openclaw-2026-01-01.log"
+    log.write_text("")
+    monkeypatch.setattr(_d, "_find_log_file", lambda _date: str(log))
+    return infra, log
+
+
+def _append(log, *lines, newline=True):
+    with open(log, "a") as f:
+        f.write("\n".join(lines) + ("\n" if newline else ""))
+
+
+def test_classifies_like_the_tool_card(infra):
+    infra_mod, _log = infra
+    c = infra_mod._classify_log_line
+    assert c("Tool invoke: exec ls") == "exec"
+    assert c("tool browser screenshot") == "browser"
+    assert c("INVOKE web_fetch https://x") == "search"
+    assert c("tool call: memory_get") == "other"
+    assert c("gateway started") is None
+
+
+def test_appends_are_folded_in_incrementally(infra):
+    infra_mod, log = infra
+    _append(log, "tool exec a", "boot")
+    first = infra_mod._log_stats_payload("2026-01-01")
+    assert first == {
+        "toolCounts": {"exec": 1, "browser": 0, "search": 0, "other": 0},
+        "recentTools": ["exec"], "lines": 2,
+    }
+
+    _append(log, "tool browser b")
+    _append(log, "tool web_search c", newline=False)
+    second = infra_mod._log_stats_payload("2026-01-01")
+    # The unterminated last line waits for its newline.
+    assert second["toolCounts"]["browser"] == 1
+    assert second["toolCounts"]["search"] == 0
+    assert second["lines"] == 3
+
+    _append(log, "")
+    third = infra_mod._log_stats_payload("2026-01-01")
+    assert third["toolCounts"]["search"] == 1
+    assert third["recentTools"] == ["exec", "browser", "search"]
+
+
+def test_window_keeps_last_hundred_lines(infra):
+    infra_mod, log = infra
+    _append(log, *(["tool exec"] * 30))
+    infra_mod._log_stats_payload("2026-01-01")
+    _append(log, *(["idle"] * 90))
+    stats = infra_mod._log_stats_payload("2026-01-01")
+    assert stats["lines"] == 100
+    assert stats["toolCounts"]["exec"] == 10
+
+
+def test_truncation_reseeds_from_tail(infra):
+    infra_mod, log = infra
+    _append(log, *(["tool exec"] * 5))
+    infra_mod._log_stats_payload("2026-01-01")
+    log.write_text("tool browser\n")
+    stats = infra_mod._log_stats_payload("2026-01-01")
+    assert stats["toolCounts"] == {"exec": 0, "browser": 1, "search": 0, "other": 0}
+
+
+def test_reseed_leaves_partial_last_line_for_next_read(infra):
+    infra_mod, log = infra
+    _append(log, *(["idle"] * 5))
+    infra_mod._log_stats_payload("2026-01-01")
+    log.write_text("tool exec a\ntool brow")
+    seeded = infra_mod._log_stats_payload("2026-01-01")
+    assert seeded["lines"] == 1
+    _append(log, "ser b")
+    stats = infra_mod._log_stats_payload("2026-01-01")
+    assert stats["toolCounts"] == {"exec": 1, "browser": 1, "search": 0, "other": 0}
+    assert stats["lines"] == 2
+
+
+def test_route_serves_stats_with_etag(infra):
+    infra_mod, log = infra
+    _append(log, "tool exec")
+    a = Flask(__name__)
+    a.register_blueprint(infra_mod.bp_logs)
+    c = a.test_client()
+    r = c.get("/api/logs/stats")
+    assert r.status_code == 200
+    assert r.get_json()["toolCounts"]["exec"] == 1
+    again = c.get("/api/logs/stats", headers={"If-None-Match": r.headers["ETag"]})
+    assert again.status_code == 304
@@ -0,0 +1,253 @@
+"""In-memory OTLP ``metrics_store`` ring buffer.
+
+Each category is a ``deque(maxlen=MAX_STORE_ENTRIES)`` so the cap is
+enforced on append instead of by slicing the whole list. Pins:
+
+  * appends past the cap drop the oldest entry, never grow the ring;
+  * ``_expire_old_entries`` trims stale heads and keeps the ring bounded;
+  * a snapshot round-trips through disk back into bounded deques;
+  * ``_metrics_tail`` returns the newest N entries, oldest first.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from collections import deque
+
+import pytest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+_STORE_KEYS = ("tokens", "cost", "runs", "messages", "webhooks", "queues")
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    import dashboard as _d
+
+    monkeypatch.setattr(_d, "MAX_STORE_ENTRIES", 5)
+    monkeypatch.setattr(
+        _d, "metrics_store", {k: deque(maxlen=5) for k in _STORE_KEYS}
+    )
+    monkeypatch.setattr(_d, "_otel_last_received", 0, raising=False)
+    monkeypatch.setattr(_d, "METRICS_FILE", str(tmp_path / "metrics.json"))
+    return _d
+
+
+def test_append_past_cap_drops_oldest(store):
+    for i in range(8):
+        store._add_metric("runs", {"timestamp": time.time(), "duration_ms": i})
+    runs = store.metrics_store["runs"]
+    assert len(runs) == 5
+    assert [e["duration_ms"] for e in runs] == [3, 4, 5, 6, 7]
+
+
+def test_expire_trims_stale_head_only(store):
+    now = time.time()
+    old = now - (store.STORE_RETENTION_DAYS + 1) * 86400
+    for ts in (old, old, now, now):
+        store.metrics_store["cost"].append({"timestamp": ts, "usd": 1.0})
+    store.metrics_store["tokens"].append({"timestamp": now, "total": 1})
+
+    store._expire_old_entries()
+
+    cost = store.metrics_store["cost"]
+    assert isinstance(cost, deque) and cost.maxlen == 5
+    assert [e["timestamp"] for e in cost] == [now, now]
+    assert len(store.metrics_store["tokens"]) == 1
+
+
+def test_snapshot_round_trip_restores_bounded_deques(store):
+    now = time.time()
+    for i in range(3):
+        store.metrics_store["tokens"].append({"timestamp": now, "total": i})
+    store._save_metrics_to_disk()
+
+    for k in _STORE_KEYS:
+        store.metrics_store[k].clear()
+    store._load_metrics_from_disk()
+
+    tokens = store.metrics_store["tokens"]
+    assert isinstance(tokens, deque) and tokens.maxlen == 5
+    assert [e["total"] for e in tokens] == [0, 1, 2]
+
+
+def test_metrics_tail_returns_newest_in_order(store):
+    for i in range(5):
+        store.metrics_store["tokens"].append({"timestamp": i, "total": i})
+    assert [e["total"] for e in store._metrics_tail("tokens", 2)] == [3, 4]
+    assert len(store._metrics_tail("tokens", 50)) == 5
+    assert store._metrics_tail("missing", 3) == []
+
+
+def test_concurrent_lock_free_appends_are_not_lost(store, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(
+        store, "metrics_store", {k: deque(maxlen=10_000) for k in _STORE_KEYS}
+    )
+
+    def _writer():
+        for i in range(500):
+            store._add_metric("runs", {"timestamp": time.time(), "duration_ms": i})
+
+    threads = [threading.Thread(target=_writer) for _ in range(8)]
+    for t in threads:
+        t.start()
+    # Expiry runs under the lock while writers append without it.
+    store._expire_old_entries()
+    for t in threads:
+        t.join()
+    assert len(store.metrics_store["runs"]) == 8 * 500
+    assert store._otel_last_received > 0
+
+
+def test_local_day_bucketer_matches_strftime(store):
+    from datetime import datetime
+
+    today = datetime.now()
+    day_of = store._local_day_bucketer(today, 15)
+    now = time.time()
+    # Inside the window, on a day boundary, and far outside it (fallback).
+    for ts in (now, now - 3 * 86400, now - 40 * 86400, 0):
+        assert day_of(ts) == datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+    midnight = today.replace(hour=0, minute=0, second=0, microsecond=0)
+    assert day_of(midnight.timestamp()) == midnight.strftime("%Y-%m-%d")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_streamed_snapshot_is_valid_json(store, monkeypatch, use_orjson):
+    import json
+
+    if use_orjson and not store._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(store, "_HAS_ORJSON", use_orjson)
+    store.metrics_store["cost"].append({"timestamp": 1.5, "usd": 0.25, "model": "m"})
+    store._otel_last_received = 7.0
+    store._save_metrics_to_disk()
+
+    with open(store._metrics_file_path()) as f:
+        data = json.load(f)
+    assert set(_STORE_KEYS) <= set(data)
+    assert data["cost"] == [{"timestamp": 1.5, "usd": 0.25, "model": "m"}]
+    assert data["_last_received"] == 7.0 and data["_saved_at"] > 0
+    assert not os.path.exists(store._metrics_file_path() + ".tmp")
+
+
+def test_metrics_since_walks_back_to_cutoff(store):
+    for ts in (10, 20, 30, 40):
+        store.metrics_store["webhooks"].append({"timestamp": ts})
+    assert [e["timestamp"] for e in store._metrics_since("webhooks", 25)] == [30, 40]
+    assert [e["timestamp"] for e in store._metrics_since("webhooks", 30)] == [30, 40]
+    assert store._metrics_since("webhooks", 50) == []
+    assert len(store._metrics_since("webhooks", 0)) == 4
+    assert store._metrics_since("missing", 0) == []
+
+
+def test_metrics_since_survives_a_racing_append(store):
+    class _RacingRing(deque):
+        def __reversed__(self):
+            raise RuntimeError("deque mutated during iteration")
+
+    ring = _RacingRing([{"timestamp": 10}, {"timestamp": 20}], maxlen=5)
+    store.metrics_store["webhooks"] = ring
+    assert [e["timestamp"] for e in store._metrics_since("webhooks", 15)] == [20]
+
+
+def test_otel_usage_data_aggregates_snapshot(store):
+    now = time.time()
+    store.metrics_store["tokens"].append({"timestamp": now, "total": 300, "model": "m"})
+    store.metrics_store["cost"].append({"timestamp": now, "usd": 0.5})
+    for ms in (100, 300):
+        store.metrics_store["runs"].append({"timestamp": now, "duration_ms": ms})
+    store.metrics_store["messages"].append({"timestamp": now, "outcome": "processed"})
+
+    usage = store._get_otel_usage_data()
+
+    assert len(usage["days"]) == 14
+    assert usage["days"][-1]["tokens"] == 300
+    assert usage["today"] == 300 and usage["todayCost"] == 0.5
+    assert usage["avgRunMs"] == 200.0
+    assert usage["messageCount"] == 1
+    assert usage["modelBreakdown"] == [{"model": "m", "tokens": 300}]
+
+
+def test_load_accepts_legacy_nan_snapshot(store):
+    # Snapshots written by the stdlib encoder may contain NaN, which orjson
+    # rejects; the load must fall back rather than quarantine the file.
+    now = time.time()
+    with open(store._metrics_file_path(), "w") as f:
+        f.write('{"runs": [{"timestamp": %r, "duration_ms": NaN}], '
+                '"_last_received": %r}' % (now, now))
+    store._load_metrics_from_disk()
+    assert len(store.metrics_store["runs"]) == 1
+    assert store._otel_last_received == now
+    assert os.path.exists(store._metrics_file_path())
+
+
+def test_load_quarantines_corrupt_snapshot(store):
+    path = store._metrics_file_path()
+    with open(path, "w") as f:
+        f.write("{not json")
+    store._load_metrics_from_disk()
+    assert not os.path.exists(path)
+    assert all(len(v) == 0 for v in store.metrics_store.values())
+
+
+def test_day_window_cached_per_calendar_day(store, monkeypatch):
+    from datetime import datetime, timedelta
+
+    monkeypatch.setattr(store, "_day_window_cache", {"window": None})
+    today = datetime.now()
+    bounds, labels = store._local_day_window(today, 15)
+    assert len(bounds) == len(labels) + 1 == 17
+    assert labels[-1] == today.strftime("%Y-%m-%d")
+    assert labels[-14] == (today - timedelta(days=13)).strftime("%Y-%m-%d")
+    # Same calendar day, later time → same cached lists.
+    again = store._local_day_window(today.replace(hour=23, minute=59), 15)
+    assert again[1] is labels
+    tomorrow = store._local_day_window(today + timedelta(days=1), 15)
+    assert tomorrow[1][-1] == (today + timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def test_flush_cycle_skips_idle_store(store, monkeypatch):
+    monkeypatch.setattr(store, "_metrics_pending", 0)
+    assert store._metrics_flush_cycle() is False
+    assert not os.path.exists(store._metrics_file_path())
+
+    store._add_metric("runs", {"timestamp": time.time(), "duration_ms": 1})
+    assert store._metrics_flush_cycle() is True
+    assert os.path.exists(store._metrics_file_path())
+    assert store._metrics_pending == 0
+
+
+def test_batch_threshold_wakes_flush_loop(store, monkeypatch):
+    monkeypatch.setattr(store, "_metrics_pending", 0)
+    monkeypatch.setattr(store, "METRICS_FLUSH_BATCH", 3)
+    store._metrics_flush_event.clear()
+    for _ in range(2):
+        store._add_metric("queues", {"timestamp": time.time(), "depth": 1})
+    assert not store._metrics_flush_event.is_set()
+    store._add_metric("queues", {"timestamp": time.time(), "depth": 1})
+    assert store._metrics_flush_event.is_set()
+    store._metrics_flush_event.clear()
+
+
+def test_label_strings_are_shared_across_entries(store):
+    for _ in range(3):
+        # Build fresh, equal-but-distinct strings the way protobuf decode does.
+        store._add_metric("tokens", {
+            "timestamp": time.time(), "total": 1,
+            "model": "".join(["claude-", "haiku"]), "channel": "".join(["tele", "gram"]),
+        })
+    toks = list(store.metrics_store["tokens"])
+    assert toks[0]["model"] is toks[1]["model"] is toks[2]["model"]
+    assert toks[0]["channel"] is toks[2]["channel"]
+
+    store._save_metrics_to_disk()
+    store._load_metrics_from_disk()
+    loaded = list(store.metrics_store["tokens"])
+    assert loaded[0]["model"] is loaded[2]["model"]
@@ -183,6 +183,54 @@ def test_multiple_data_points_all_recorded(app):
     assert {e["total"] for e in entries} == {100, 200, 300}
 
 
+def test_histogram_data_point_uses_sum(app):
+    a, _d = app
+    c = a.test_client()
+    met = _m_pb2.Metric()
+    met.name = "gen_ai.client.operation.duration"
+    dp = met.histogram.data_points.add()
+    dp.count = 3
+    dp.sum = 1.5
+    empty = met.histogram.data_points.add()
+    empty.count = 2
+    _post(c, _build_pb([met]))
+    runs = _d.metrics_store["runs"]
+    assert len(runs) == 2
+    # sum wins when set; an all-zero sum falls back to count (seconds → ms).
+    assert runs[0]["duration_ms"] == pytest.approx(1500.0)
+    assert runs[1]["duration_ms"] == pytest.approx(2000.0)
+
+
+def test_message_and_webhook_metrics_classified_by_name(app):
+    a, _d = app
+    c = a.test_client()
+    _post(c, _build_pb([
+        _metric("openclaw.message.processed", as_int=1, attrs={"channel": "tg"}),
+        _metric("openclaw.message.duration_ms", as_double=42.0),
+        _metric("openclaw.webhook.error", as_int=1, attrs={"channel": "slack"}),
+    ]))
+    msgs = _d.metrics_store["messages"]
+    assert [(m["outcome"], m["duration_ms"]) for m in msgs] == [
+        ("processed", 0), ("duration", pytest.approx(42.0)),
+    ]
+    assert msgs[0]["channel"] == "tg"
+    hooks = _d.metrics_store["webhooks"]
+    assert [(h["type"], h["channel"]) for h in hooks] == [("error", "slack")]
+
+
+def test_attr_values_unwrap_each_anyvalue_arm(app):
+    _a, _d = app
+    from opentelemetry.proto.common.v1 import common_pb2
+
+    assert _d._otel_attr_value(common_pb2.AnyValue(string_value="m")) == "m"
+    assert _d._otel_attr_value(common_pb2.AnyValue(int_value=7)) == 7
+    assert _d._otel_attr_value(common_pb2.AnyValue(double_value=0.5)) == 0.5
+    assert _d._otel_attr_value(common_pb2.AnyValue(bool_value=False)) is False
+    arr = common_pb2.AnyValue()
+    arr.array_value.values.add().int_value = 1
+    assert isinstance(_d._otel_attr_value(arr), str)
+
+
 # ── malformed input ─────────────────────────────────────────────────────────
 
 
@@ -0,0 +1,83 @@
+"""``routes.overview._host_info`` — memoized disk/RAM/pgrep probes.
+
+Both /api/overview paths read the system + infra blocks through it. Pins:
+disk and RAM come from ``helpers.system`` (no ``df``/``free`` fork), one disk
+read feeds both the Disk row and ``infra.storage``, a second call inside the
+TTL probes nothing, callers get copies they can't use to alter the cached
+rows, and sizes are formatted the way ``df -h``/``free -h`` print them.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+_G = 1024 ** 3
+
+
+@pytest.fixture
+def ov(monkeypatch):
+    import dashboard as _d
+    import helpers.system as _host
+    import routes.overview as ov
+
+    importlib.reload(ov)
+    calls = []
+
+    def _run(cmd, **_kw):
+        calls.append(cmd[0])
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    def _disk(path="/"):
+        calls.append("disk")
+        return (50 * _G, 20 * _G, 40)
+
+    def _mem():
+        calls.append("mem")
+        return (16 * _G, 4 * _G)
+
+    monkeypatch.setattr(ov.subprocess, "run", _run)
+    monkeypatch.setattr(_host, "disk_usage", _disk)
+    monkeypatch.setattr(_host, "memory_usage", _mem)
+    monkeypatch.setattr(_d, "get_local_ip", lambda: "10.0.0.2")
+    return ov, calls
+
+
+def test_one_disk_read_feeds_disk_row_and_storage(ov):
+    mod, calls = ov
+    system, infra = mod._host_info()
+    assert ["Disk /", "20G / 50G (40%)", "green"] in system
+    assert ["RAM", "4.0Gi / 16Gi", ""] in system
+    assert infra["storage"] == "50G root"
+    assert calls.count("disk") == 1
+    assert "df" not in calls and "free" not in calls
+
+
+def test_second_call_within_ttl_probes_nothing(ov):
+    mod, calls = ov
+    mod._host_info()
+    probed = len(calls)
+    system, infra = mod._host_info()
+    assert len(calls) == probed
+    system[0][1] = "changed"
+    infra["storage"] = "changed"
+    again, again_infra = mod._host_info()
+    assert again[0][1] == "20G / 50G (40%)"
+    assert again_infra["storage"] == "50G root"
+
+
+def test_human_size_matches_df_h():
+    from helpers.system import human_size
+
+    assert human_size(512) == "512B"
+    assert human_size(int(3.45 * _G)) == "3.5G"
+    assert human_size(20 * _G) == "20G"
+    assert human_size(int(24.2 * _G)) == "25G"
+    assert human_size(16 * _G, "i") == "16Gi"
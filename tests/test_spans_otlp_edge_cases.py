@@ -532,6 +532,18 @@ def test_genai_usage_lights_live_tiles(app, clear_metrics):
     assert len(runs) >= 1, "a GenAI chat span must count as a run"
 
 
+def test_span_name_classification(clear_metrics):
+    """Span-name → tile mapping is cached per name; case must not matter and
+    a GenAI operation attr still promotes an unrecognised name to a run."""
+    _d = clear_metrics
+    assert _d._classify_span_name("openclaw.Run") == "run"
+    assert _d._classify_span_name("llm.completion") == "run"
+    assert _d._classify_span_name("openai.chat") == "run"
+    assert _d._classify_span_name("Message.Process") == "message"
+    assert _d._classify_span_name("tool.exec") == ""
+    assert "generate_content" in _d._GENAI_RUN_OPERATIONS
+
+
 def test_genai_cost_usd_lights_cost_tile(app, clear_metrics):
     """gen_ai.usage.cost_usd on a span must light the live cost tile."""
     a, ls = app
@@ -176,3 +176,30 @@ def test_subagents_local_store_derives_status_from_age(app):
     # daemon didn't stamp ``runtime_ms`` explicitly.
     assert s["runtimeMs"] >= 0
     assert s["runtime"], f"runtime string must be set; got {s['runtime']!r}"
+
+
+def test_subagents_poll_revalidates_with_etag(app):
+    """The 5s tab poll carries ``If-None-Match``; an unchanged tree is a
+    bodyless 304 served from the TTL cache without re-hashing the body."""
+    a, ls = app
+    ls.get_store().ingest_subagent({
+        "subagent_id":       "child-etag",
+        "agent_type":        "openclaw",
+        "parent_session_id": "parent-etag",
+        "spawned_at":        "2026-05-17T10:00:00Z",
+        "status":            "active",
+        "updated_at_ms":     int(time.time() * 1000),
+    })
+    c = a.test_client()
+    first = c.get("/api/subagents")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+    etag = first.headers["ETag"]
+
+    again = c.get("/api/subagents", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+
+    stale = c.get("/api/subagents", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+    assert stale.get_json()["subagents"][0]["sessionId"] == "child-etag"
@@ -0,0 +1,96 @@
+"""``dashboard._compute_transcript_analytics`` — incremental transcript parse.
+
+The legacy /api/usage path aggregates every session ``.jsonl`` through it.
+Pins: a refresh parses only lines appended since the last one, an
+unterminated last line waits for its newline, a truncated file is parsed
+again from the top, and deleted transcripts drop out of the totals.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+def _ev(day, tokens, cost, tool=None):
+    msg = {"model": "m1", "usage": {"totalTokens": tokens, "cost": {"total": cost}}}
+    if tool:
+        msg["content"] = [{"type": "toolCall", "name": tool}]
+    return json.dumps({"timestamp": f"{day}T10:00:00", "message": msg}) + "\n"
+
+
+@pytest.fixture
+def analytics(tmp_path, monkeypatch):
+    import dashboard as _d
+
+    monkeypatch.setattr(_d, "_get_sessions_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(_d, "_transcript_file_state", {})
+    parsed = []
+    real_loads = _d._json_loads
+
+    def _loads(raw):
+        parsed.append(raw)
+        return real_loads(raw)
+
+    monkeypatch.setattr(_d, "_json_loads", _loads)
+
+    def _run():
+        _d._transcript_analytics_cache["data"] = None
+        return _d._compute_transcript_analytics()
+
+    yield _run, tmp_path, parsed
+    _d._transcript_analytics_cache["data"] = None
+
+
+def test_refresh_parses_only_appended_lines(analytics):
+    run, sessions, parsed = analytics
+    log = sessions / "s1.jsonl"
+    log.write_text(_ev("2026-01-01", 100, 0.5, tool="exec") + _ev("2026-01-02", 50, 0.25))
+    first = run()
+    assert first["daily_tokens"] == {"2026-01-01": 100, "2026-01-02": 50}
+    assert first["plugin_stats"]["exec"]["calls"] == 1
+
+    parsed.clear()
+    with open(log, "a") as f:
+        f.write(_ev("2026-01-02", 10, 0.1, tool="exec"))
+    second = run()
+    assert len(parsed) == 1
+    assert second["daily_tokens"] == {"2026-01-01": 100, "2026-01-02": 60}
+    assert second["model_usage"] == {"m1": 160}
+    assert second["plugin_stats"]["exec"]["calls"] == 2
+    assert second["plugin_daily_stats"]["2026-01-02"]["exec"]["tokens"] == 10.0
+    [summary] = second["sessions"]
+    assert summary["tokens"] == 160
+    assert summary["cost_usd"] == pytest.approx(0.85)
+    assert summary["day"] == "2026-01-01"
+
+
+def test_partial_line_waits_and_truncation_reparses(analytics):
+    run, sessions, _parsed = analytics
+    log = sessions / "s1.jsonl"
+    line = _ev("2026-01-01", 40, 0.0)
+    log.write_text(_ev("2026-01-01", 100, 0.0) + line[:20])
+    assert run()["daily_tokens"] == {"2026-01-01": 100}
+    with open(log, "a") as f:
+        f.write(line[20:])
+    assert run()["daily_tokens"] == {"2026-01-01": 140}
+
+    log.write_text(_ev("2026-01-03", 7, 0.0))
+    assert run()["daily_tokens"] == {"2026-01-03": 7}
+
+
+def test_deleted_transcript_drops_out(analytics):
+    run, sessions, _parsed = analytics
+    (sessions / "a.jsonl").write_text(_ev("2026-01-01", 5, 0.0))
+    (sessions / "b.jsonl.reset.1").write_text(_ev("2026-01-01", 6, 0.0))
+    assert run()["daily_tokens"] == {"2026-01-01": 11}
+    os.remove(sessions / "a.jsonl")
+    result = run()
+    assert result["daily_tokens"] == {"2026-01-01": 6}
+    assert [s["session_id"] for s in result["sessions"]] == ["b"]
@@ -287,3 +287,60 @@ def test_empty_store_returns_none(env):
     """Returning None lets the JSONL fallback take over for fresh installs."""
     _store, sessions_mod = env
     assert sessions_mod._try_local_store_transcript("nonexistent-session") is None
+
+
+def test_transcript_window_head_or_tail():
+    from routes.sessions import _transcript_window
+    msgs = list(range(600))
+    assert _transcript_window(msgs) == msgs[:500]
+    assert _transcript_window(msgs, 10) == msgs[-10:]
+
+
+def test_route_tail_returns_last_messages(env, tmp_path, monkeypatch):
+    import json
+    import dashboard as _d
+    from flask import Flask
+
+    _store, sessions_mod = env
+    monkeypatch.setattr(_d, "SESSIONS_DIR", str(tmp_path))
+    with open(tmp_path / "sess-tail.jsonl", "w") as f:
+        for i in range(5):
+            f.write(json.dumps({"role": "user", "content": f"m{i}"}) + "\n")
+    a = Flask(__name__)
+    a.register_blueprint(sessions_mod.bp_sessions)
+    r = a.test_client().get("/api/transcript/sess-tail?tail=2")
+    assert r.status_code == 200
+    body = r.get_json()
+    assert [m["content"] for m in body["messages"]] == ["m3", "m4"]
+    assert body["messageCount"] == 5
+
+
+def test_activity_tag_rules():
+    from routes.sessions import _activity_tag
+    assert _activity_tag("Searching the docs") == ("search", "")
+    assert _activity_tag("opened the FILE") == ("read", "")
+    assert _activity_tag("short reply") is None
+    tag, preview = _activity_tag("Thinking it over: the plan looks sound, next I'll tidy up — ok?")
+    assert tag == "thought"
+    assert len(preview) <= 80 and ":" not in preview and "—" not in preview
+
+
+def test_route_activity_sends_tags_not_messages(env, tmp_path, monkeypatch):
+    import json
+    import dashboard as _d
+    from flask import Flask
+
+    _store, sessions_mod = env
+    monkeypatch.setattr(_d, "SESSIONS_DIR", str(tmp_path))
+    with open(tmp_path / "sess-act.jsonl", "w") as f:
+        f.write(json.dumps({"role": "user", "content": "go", "timestamp": 1000}) + "\n")
+        f.write(json.dumps({"role": "assistant", "content": "Running the command now", "timestamp": 2000}) + "\n")
+        f.write(json.dumps({"role": "assistant", "content": "done", "timestamp": 3000}) + "\n")
+    a = Flask(__name__)
+    a.register_blueprint(sessions_mod.bp_sessions)
+    r = a.test_client().get("/api/transcript/sess-act/activity")
+    assert r.status_code == 200
+    body = r.get_json()
+    assert body["activity"] == [{"ts": 2000000, "tag": "exec", "preview": ""}]
+    assert body["lastReply"] == {"text": "done", "when": 3000000}
+    assert "messages" not in body